@@ -9,18 +9,54 @@ Author: CreativeCloudAppDev2020
 # Importing necessary libraries
 
 import sys
+import math
+import time
 import uuid
 import random
 import pickle
+import sqlite3
 import copy
+import json
+import argparse
+import threading
+import os
+import weakref
+import itertools
+import tracemalloc
 from mpmath import *
+from mpmath import log10 as mpmath_log10
 from functools import reduce
+from fractions import Fraction
+from bisect import bisect_right
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 
 mp.pretty = True
 
 
 # Creating static functions to be used throughout the game
 
+DIAMOND_OFFSETS: dict = {}  # Offsets of tiles within each number of steps, filled in lazily
+# Stats versions start at a random offset in each process, so that units copied from another process never share a
+# version with units whose stats change in this one
+stats_versions: iter = itertools.count(int.from_bytes(os.urandom(6), "big") << 24)
+
+
+def new_stats_version():
+    # type: () -> int
+    return next(stats_versions)
+
+
+def reset_stats_versions():
+    # type: () -> None
+    global stats_versions
+    stats_versions = itertools.count(int.from_bytes(os.urandom(6), "big") << 24)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_stats_versions)
+
 
 def is_number(string: str) -> bool:
     try:
@@ -41,111 +77,1242 @@ def mpf_product_of_list(a_list: list) -> mpf:
     mpf(str(a)) * mpf(str(b)), a_list)))
 
 
-def generate_random_name() -> str:
+def generate_random_name(rng=random) -> str:
     name: str = ""  # initial value
     letters: str = "abcdefghijklmnopqrstuvwxyz"
-    length: int = random.randint(6, 20)
+    length: int = rng.randint(6, 20)
     for i in range(length):
-        name += letters[random.randint(0, len(letters) - 1)]
+        name += letters[rng.randint(0, len(letters) - 1)]
 
     name = name.capitalize()
     return name
 
 
-def generate_random_hero(name):
-    # type: (str) -> Hero
-    max_hp: mpf = mpf(random.randint(10000, 100000))
-    max_magic_points: mpf = mpf(random.randint(10000, 100000))
-    attack_power: mpf = mpf(random.randint(2000, 20000))
-    defense: mpf = mpf(random.randint(2000, 20000))
-    crit_rate: mpf = mpf(random.randint(150, 1000))
-    crit_resistance: mpf = mpf(random.randint(150, 1000))
-    crit_damage: mpf = mpf(random.random() * 2)
-    max_steps: int = random.randint(10, 20)
+def get_diamond_offsets(radius):
+    # type: (int) -> tuple
+    """
+    This function gets offsets of all tiles within the given number of steps from a tile, excluding the tile itself.
+    Offsets are computed once per radius and then reused.
+    :param radius: maximum number of steps
+    :return: a tuple of (x offset, y offset) pairs
+    """
+    if radius not in DIAMOND_OFFSETS:
+        DIAMOND_OFFSETS[radius] = tuple((dx, dy) for dy in range(-radius, radius + 1)
+                                        for dx in range(-(radius - abs(dy)), radius - abs(dy) + 1)
+                                        if dx != 0 or dy != 0)
+
+    return DIAMOND_OFFSETS[radius]
+
+
+def generate_random_hero(name, rng=random):
+    # type: (str, random.Random) -> Hero
+    max_hp: mpf = to_number(rng.randint(10000, 100000))
+    max_magic_points: mpf = to_number(rng.randint(10000, 100000))
+    attack_power: mpf = to_number(rng.randint(2000, 20000))
+    defense: mpf = to_number(rng.randint(2000, 20000))
+    crit_rate: mpf = to_number(rng.randint(150, 1000))
+    crit_resistance: mpf = to_number(rng.randint(150, 1000))
+    crit_damage: mpf = to_number(rng.random() * 2)
+    max_steps: int = rng.randint(10, 20)
     x: int = 0
     y: int = 0
     skills: list = [
-        Skill("Weak Attacking Skill", "Attacking skill causing low amount of damage.", mpf("0.05"), mpf("0.05"),
-              mpf("3.5"), mpf("3.5"), mpf(random.randint(200, 500))),
-        Skill("Moderate Attacking Skill", "Attacking skill causing moderate amount of damage.", mpf("0.1"), mpf("0.1"),
-              mpf("7"), mpf("7"), mpf(random.randint(500, 1000))),
-        Skill("Strong Attacking Skill", "Attacking skill causing high amount of damage.", mpf("0.2"), mpf("0.2"),
-              mpf("15"), mpf("15"), mpf(random.randint(1000, 2000)))
+        Skill("Weak Attacking Skill", "Attacking skill causing low amount of damage.", to_number("0.05"),
+              to_number("0.05"), to_number("3.5"), to_number("3.5"), to_number(rng.randint(200, 500))),
+        Skill("Moderate Attacking Skill", "Attacking skill causing moderate amount of damage.", to_number("0.1"),
+              to_number("0.1"), to_number("7"), to_number("7"), to_number(rng.randint(500, 1000))),
+        Skill("Strong Attacking Skill", "Attacking skill causing high amount of damage.", to_number("0.2"),
+              to_number("0.2"), to_number("15"), to_number("15"), to_number(rng.randint(1000, 2000)))
     ]
     return Hero(name, max_hp, max_magic_points, attack_power, defense, crit_rate, crit_resistance, crit_damage,
                 max_steps, x, y, skills)
 
 
-def generate_random_game_character(name):
-    # type: (str) -> GameCharacter
-    max_hp: mpf = mpf(random.randint(10000, 100000))
-    max_magic_points: mpf = mpf(random.randint(10000, 100000))
-    attack_power: mpf = mpf(random.randint(2000, 20000))
-    defense: mpf = mpf(random.randint(2000, 20000))
-    crit_rate: mpf = mpf(random.randint(150, 1000))
-    crit_resistance: mpf = mpf(random.randint(150, 1000))
-    crit_damage: mpf = mpf(random.random() * 2)
-    max_steps: int = random.randint(10, 20)
+def generate_random_game_character(name, rng=random):
+    # type: (str, random.Random) -> GameCharacter
+    max_hp: mpf = to_number(rng.randint(10000, 100000))
+    max_magic_points: mpf = to_number(rng.randint(10000, 100000))
+    attack_power: mpf = to_number(rng.randint(2000, 20000))
+    defense: mpf = to_number(rng.randint(2000, 20000))
+    crit_rate: mpf = to_number(rng.randint(150, 1000))
+    crit_resistance: mpf = to_number(rng.randint(150, 1000))
+    crit_damage: mpf = to_number(rng.random() * 2)
+    max_steps: int = rng.randint(10, 20)
     x: int = 0
     y: int = 0
     return GameCharacter(name, max_hp, max_magic_points, attack_power, defense, crit_rate, crit_resistance, crit_damage,
                          max_steps, x, y)
 
 
-def generate_random_building(name):
-    # type: (str) -> Building
-    max_hp: mpf = mpf(random.randint(10000, 100000))
-    defense: mpf = mpf(random.randint(2000, 20000))
+def generate_random_building(name, rng=random):
+    # type: (str, random.Random) -> Building
+    max_hp: mpf = to_number(rng.randint(10000, 100000))
+    defense: mpf = to_number(rng.randint(2000, 20000))
     x: int = 0
     y: int = 0
     return Building(name, max_hp, defense, x, y)
 
 
-def generate_random_battle_tower(name):
-    # type: (str) -> BattleTower
-    max_hp: mpf = mpf(random.randint(10000, 100000))
-    defense: mpf = mpf(random.randint(2000, 20000))
+def generate_random_battle_tower(name, rng=random):
+    # type: (str, random.Random) -> BattleTower
+    max_hp: mpf = to_number(rng.randint(10000, 100000))
+    defense: mpf = to_number(rng.randint(2000, 20000))
     x: int = 0
     y: int = 0
-    attack_power: mpf = mpf(random.randint(2000, 20000))
-    crit_rate: mpf = mpf(random.randint(150, 1000))
-    crit_resistance: mpf = mpf(random.randint(150, 1000))
-    crit_damage: mpf = mpf(random.random() * 2)
+    attack_power: mpf = to_number(rng.randint(2000, 20000))
+    crit_rate: mpf = to_number(rng.randint(150, 1000))
+    crit_resistance: mpf = to_number(rng.randint(150, 1000))
+    crit_damage: mpf = to_number(rng.random() * 2)
     return BattleTower(name, max_hp, defense, x, y, attack_power, crit_rate, crit_resistance, crit_damage)
 
 
+def generate_random_cpu_player(rng=random):
+    # type: (random.Random) -> CPUPlayer
+    cpu_player: CPUPlayer = CPUPlayer(name=generate_random_name(rng))
+    hero_to_control: Hero = generate_random_hero(cpu_player.name, rng)
+    hero_to_control.controlling_player = cpu_player
+    cpu_player.hero_to_control = hero_to_control
+    return cpu_player
+
+
+def generate_random_team(heroes, name="Team", rng=random, num_villagers=None, num_defense_towers=None):
+    # type: (list, str, random.Random, int or None, int or None) -> Team
+    villagers: list = [generate_random_game_character(generate_random_name(rng), rng)
+                       for i in range(BattleSquad.NUM_VILLAGERS if num_villagers is None else num_villagers)]
+    defense_towers: list = [generate_random_battle_tower(generate_random_name(rng), rng)
+                            for i in range(BattleSquad.NUM_DEFENSE_TOWERS if num_defense_towers is None
+                                           else num_defense_towers)]
+    town_center: TownCenter = generate_random_building(generate_random_name(rng), rng)
+    return Team(BattleSquad(heroes, villagers, defense_towers, town_center), name)
+
+
+def generate_battlefield_shop():
+    # type: () -> BattlefieldShop
+    runes: list = []  # initial value
+    for i in range(20):
+        curr_rune: Rune = Rune("Rune #" + str(i + 1), to_number("0.2") * (i + 1), to_number("0.2") * (i + 1),
+                               to_number("0.2") * (i + 1), to_number("0.2") * (i + 1), to_number("150") * (i + 1),
+                               to_number("150") * (i + 1), to_number("0.2") * (i + 1),
+                               LogNumber.power_of_ten(5 + i))
+        runes.append(curr_rune)
+
+    return BattlefieldShop(runes)
+
+
+def generate_random_battle(team_1_heroes, team_2_heroes, battle_random=None, battlefield_width=None,
+                           battlefield_height=None, num_villagers=None, num_defense_towers=None, profile_stages=False,
+                           use_array_state=False):
+    # type: (list, list, BattleRandom or None, int or None, int or None, int or None, int or None,
+    #        bool, bool) -> BattleEngine
+    battle_random = battle_random if battle_random is not None else BattleRandom()
+    team1: Team = generate_random_team(team_1_heroes, "Team 1", battle_random.generation, num_villagers,
+                                       num_defense_towers)
+    team2: Team = generate_random_team(team_2_heroes, "Team 2", battle_random.generation, num_villagers,
+                                       num_defense_towers)
+    if battlefield_width is None and battlefield_height is None:
+        # Battlefields for large squads are made big enough for units to take up at most a quarter of the tiles
+        num_units: int = len(BattleEngine.get_units(team1)) + len(BattleEngine.get_units(team2))
+        battlefield_width = battlefield_height = max(Battlefield.BATTLEFIELD_WIDTH, math.isqrt(4 * num_units - 1) + 1)
+
+    battlefield: Battlefield = Battlefield(generate_random_name(battle_random.generation), battlefield_width,
+                                           battlefield_height)
+    return BattleEngine(team1, team2, battlefield, generate_battlefield_shop(), battle_random=battle_random,
+                        profile_stages=profile_stages, use_array_state=use_array_state)
+
+
+# Creating functions used to save and load game data
+
+
+SAVE_FORMAT_NAME: str = "BATTLELAND SAVE"
+SAVE_FORMAT_VERSION: int = 1
+PICKLE_PROTOCOL_PREFIX: bytes = b"\x80"
+HERO_STAT_NAMES: tuple = ("max_hp", "max_magic_points", "attack_power", "defense", "crit_rate", "crit_resistance",
+                          "crit_damage")
+HERO_HEAL_RATE_NAMES: tuple = ("hp_heal_rate", "mp_heal_rate")
+SKILL_FIELD_NAMES: tuple = ("damage_multiplier_to_max_hp", "damage_multiplier_to_max_magic_points",
+                            "damage_multiplier_to_attack_power", "damage_multiplier_to_defense", "magic_points_cost")
+UPGRADE_FIELD_NAMES: tuple = ("max_hp_multiplier", "max_magic_points_multiplier", "attack_power_multiplier",
+                              "defense_multiplier", "crit_rate_up", "crit_resistance_up", "crit_damage_up")
+
+
+def number_to_record(value):
+    # type: (object) -> float or int or str
+    # Stats which are not exactly representable as floats are saved as strings with enough digits to be read back
+    if isinstance(value, mpf):
+        as_float: float = float(value)
+        return as_float if math.isfinite(as_float) and mp.prec <= 53 else nstr(value, mp.dps + 2)
+    return value if isinstance(value, (float, int)) else str(value)
+
+
+def log_number_to_record(value):
+    # type: (object) -> float or None
+    log10: float = LogNumber.of(value).log10
+    return None if log10 == -math.inf else log10
+
+
+def log_number_from_record(log10):
+    # type: (float or None) -> LogNumber
+    return LogNumber(0) if log10 is None else LogNumber(log10=log10)
+
+
+def player_to_record(player):
+    # type: (Player) -> dict
+    """
+    This function gets the data of a player which persists between battles. Battle coins, runes, teams, and other
+    data which only lasts for a battle are left out.
+    :param player: the player to be saved
+    :return: a dictionary which can be written as JSON
+    """
+    hero: Hero = player.hero_to_control
+    return {
+        "player_id": player.player_id,
+        "name": player.name,
+        "level": player.level,
+        "exp": log_number_to_record(player.exp),
+        "required_exp": log_number_to_record(player.required_exp),
+        "global_coins": log_number_to_record(player.global_coins),
+        "rank": str(player.rank),
+        "wins": player.wins,
+        "loses": player.loses,
+        "hero": None if hero is None else {
+            "name": hero.name,
+            "stats": [number_to_record(getattr(hero, stat_name)) for stat_name in HERO_STAT_NAMES],
+            "heal_rates": [number_to_record(getattr(hero, heal_rate_name)) for heal_rate_name in HERO_HEAL_RATE_NAMES],
+            "max_steps": hero.max_steps,
+            "skills": [[skill.name, skill.description] +
+                       [number_to_record(getattr(skill, field_name)) for field_name in SKILL_FIELD_NAMES]
+                       for skill in hero.get_skills()],
+            "upgrades": [[upgrade.name, log_number_to_record(upgrade.purchase_global_coin_cost)] +
+                         [number_to_record(getattr(upgrade, field_name)) for field_name in UPGRADE_FIELD_NAMES]
+                         for upgrade in hero.get_upgrades_applied()]
+        }
+    }
+
+
+def player_from_record(record):
+    # type: (dict) -> HumanPlayer
+    """
+    This function rebuilds a human player and the hero it controls from saved data.
+    :param record: a dictionary made by player_to_record()
+    :return: the rebuilt human player
+    """
+    human_player: HumanPlayer = HumanPlayer(record["name"], record["level"], log_number_from_record(record["exp"]),
+                                            log_number_from_record(record["required_exp"]))
+    human_player.player_id = record["player_id"]
+    human_player.global_coins = log_number_from_record(record["global_coins"])
+    human_player.rank = Rank(record["rank"])
+    human_player.wins = record["wins"]
+    human_player.loses = record["loses"]
+    hero_record: dict or None = record["hero"]
+    if hero_record is not None:
+        skills: list = [Skill(skill_record[0], skill_record[1], *[to_number(value) for value in skill_record[2:]])
+                        for skill_record in hero_record["skills"]]
+        hero: Hero = Hero(hero_record["name"], *[to_number(value) for value in hero_record["stats"]],
+                          hero_record["max_steps"], 0, 0, skills)
+        for heal_rate_name, value in zip(HERO_HEAL_RATE_NAMES, hero_record["heal_rates"]):
+            setattr(hero, heal_rate_name, to_number(value))
+
+        # Saved stats already include the upgrades, so the upgrades are only listed rather than applied again
+        for upgrade_record in hero_record["upgrades"]:
+            hero.get_upgrades_applied().append(
+                Upgrade(upgrade_record[0], *[to_number(value) for value in upgrade_record[2:]],
+                        log_number_from_record(upgrade_record[1])))
+
+        hero.controlling_player = human_player
+        human_player.hero_to_control = hero
+
+    return human_player
+
+
+def is_pickled_game_data(file_name):
+    # type: (str) -> bool
+    with open(file_name, "rb") as file:
+        return file.read(len(PICKLE_PROTOCOL_PREFIX)) == PICKLE_PROTOCOL_PREFIX
+
+
 def load_game_data(file_name):
     # type: (str) -> Game
-    return pickle.load(open(file_name, "rb"))
+    """
+    This function loads saved game data. Game data saved as a pickle by older versions of this game is still loaded,
+    and is saved in the current format the next time it is saved.
+    :param file_name: name of the file the game data is saved in
+    :return: the loaded game data
+    """
+    if is_pickled_game_data(file_name):
+        with open(file_name, "rb") as file:
+            return pickle.load(file)
+
+    return Game([player_from_record(record) for record in load_player_records(file_name)])
+
+
+def load_player_records(file_name):
+    # type: (str) -> list
+    """
+    This function reads the saved data of every human player without rebuilding any players.
+    :param file_name: name of the file the game data is saved in (in the current format)
+    :return: a list of dictionaries made by player_to_record()
+    """
+    with open(file_name, "r", encoding="utf-8") as file:
+        header: dict = json.loads(file.readline())
+        if header.get("format") != SAVE_FORMAT_NAME:
+            raise ValueError("'" + str(file_name) + "' is not a saved Battleland game!")
+        if header.get("version", 0) > SAVE_FORMAT_VERSION:
+            raise ValueError("'" + str(file_name) + "' was saved by a newer version of Battleland (save format "
+                             "version " + str(header["version"]) + ")!")
+
+        return [json.loads(line) for line in file if line.strip() != ""]
 
 
 def save_game_data(game_data, file_name):
     # type: (Game, str) -> None
-    pickle.dump(game_data, open(file_name, "wb"))
+    save_player_records(game_data.export_player_records(), file_name)
+
+
+def fsync_directory(file_name):
+    # type: (str) -> None
+    """
+    This function flushes the directory containing a file to disk, so that renaming the file into place is not lost
+    if the computer crashes. Directories cannot be opened on some platforms (e.g. Windows), which is ignored.
+    :param file_name: name of the file whose directory is flushed
+    :return: None
+    """
+    try:
+        directory: int = os.open(os.path.dirname(os.path.abspath(file_name)), os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(directory)
+    except OSError:
+        pass
+    finally:
+        os.close(directory)
+
+
+def save_player_records(records, file_name):
+    # type: (list, str) -> None
+    """
+    This function saves the saved data of human players. The data is written to a temporary file which then replaces
+    the saved game data in one step, so the saved game data is never left half written.
+    :param records: a list of dictionaries made by player_to_record()
+    :param file_name: name of the file the game data is saved in
+    :return: None
+    """
+    temporary_file_name: str = file_name + ".tmp"
+    with open(temporary_file_name, "w", encoding="utf-8") as file:
+        file.write(json.dumps({"format": SAVE_FORMAT_NAME, "version": SAVE_FORMAT_VERSION,
+                               "num_players": len(records)}) + "\n")
+        file.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temporary_file_name, file_name)
+    fsync_directory(file_name)
+
+
+def migrate_game_data(file_name):
+    # type: (str) -> bool
+    """
+    This function rewrites game data saved as a pickle by older versions of this game in the current format.
+    :param file_name: name of the file the game data is saved in
+    :return: whether the game data needed migrating
+    """
+    if not is_pickled_game_data(file_name):
+        return False
+
+    save_game_data(load_game_data(file_name), file_name)
+    return True
+
+
+def get_record_delta(old_record, new_record):
+    # type: (dict or None, dict) -> dict
+    """
+    This function gets the fields of a player's saved data which have changed. Changed fields hold their new values
+    rather than differences, so applying the same delta twice gives the same result.
+    :param old_record: the player's data when it was last saved, or None if the player has not been saved yet
+    :param new_record: the player's current data
+    :return: a dictionary of the player's ID and the changed fields
+    """
+    delta: dict = {"player_id": new_record["player_id"]}
+    for key, value in new_record.items():
+        if old_record is None or key not in old_record:
+            delta[key] = value
+        elif key == "hero" and value is not None and old_record[key] is not None:
+            old_hero_record: dict = old_record[key]
+            hero_delta: dict = {hero_key: hero_value for hero_key, hero_value in value.items()
+                                if hero_key != "upgrades" and old_hero_record.get(hero_key) != hero_value}
+            old_upgrades: list = old_hero_record["upgrades"]
+            new_upgrades: list = value["upgrades"]
+            if old_upgrades != new_upgrades:
+                # Upgrades are only ever added, so only the upgrades after the ones both lists share are saved
+                num_shared_upgrades: int = 0  # initial value
+                while num_shared_upgrades < min(len(old_upgrades), len(new_upgrades)) and \
+                        old_upgrades[num_shared_upgrades] == new_upgrades[num_shared_upgrades]:
+                    num_shared_upgrades += 1
+
+                hero_delta["upgrades_from"] = num_shared_upgrades
+                hero_delta["new_upgrades"] = new_upgrades[num_shared_upgrades:]
+
+            if len(hero_delta) > 0:
+                delta[key] = hero_delta
+        elif old_record[key] != value:
+            delta[key] = value
+
+    return delta
+
+
+def apply_record_delta(records, delta):
+    # type: (dict, dict) -> None
+    """
+    This function applies a delta made by get_record_delta() to the saved data of the player it belongs to.
+    :param records: a dictionary mapping player IDs to players' saved data
+    :param delta: the delta to be applied
+    :return: None
+    """
+    record: dict = records.setdefault(delta["player_id"], {})
+    for key, value in delta.items():
+        if key == "hero" and value is not None and record.get(key) is not None and "upgrades" not in value:
+            hero_record: dict = record[key]
+            for hero_key, hero_value in value.items():
+                if hero_key not in ("upgrades_from", "new_upgrades"):
+                    hero_record[hero_key] = hero_value
+
+            if "upgrades_from" in value:
+                hero_record["upgrades"] = hero_record["upgrades"][:value["upgrades_from"]] + value["new_upgrades"]
+        else:
+            record[key] = value
+
+
+# Creating numeric backends used to represent stats of game characters and buildings
+
+
+class FixedPoint:
+    """
+    This class contains attributes of a fixed precision number stored as a scaled integer.
+    """
+
+    __slots__ = ("raw",)
+    SCALE: int = 10 ** 6
+
+    def __init__(self, value=0, raw=None):
+        # type: (object, int or None) -> None
+        # Only numbers coming from outside (strings, floats, and mpf) are converted here, once. Arithmetic between
+        # fixed point numbers and integers stays on integers throughout.
+        if raw is not None:
+            self.raw: int = raw
+        elif isinstance(value, FixedPoint):
+            self.raw = value.raw
+        elif isinstance(value, int):
+            self.raw = value * self.SCALE
+        elif isinstance(value, float):
+            self.raw = round(value * self.SCALE)
+        elif isinstance(value, str):
+            self.raw = round(Fraction(value) * self.SCALE)
+        else:
+            self.raw = int(nint(mpf(value) * self.SCALE))
+
+    @staticmethod
+    def __raw_of(value):
+        # type: (object) -> int
+        if value.__class__ is FixedPoint:
+            return value.raw
+        if isinstance(value, int):
+            return value * FixedPoint.SCALE
+        return FixedPoint(value).raw
+
+    def __add__(self, other):
+        # type: (object) -> FixedPoint
+        if other.__class__ is FixedPoint:
+            return FixedPoint(raw=self.raw + other.raw)
+        return FixedPoint(raw=self.raw + FixedPoint.__raw_of(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        # type: (object) -> FixedPoint
+        if other.__class__ is FixedPoint:
+            return FixedPoint(raw=self.raw - other.raw)
+        return FixedPoint(raw=self.raw - FixedPoint.__raw_of(other))
+
+    def __rsub__(self, other):
+        # type: (object) -> FixedPoint
+        return FixedPoint(raw=FixedPoint.__raw_of(other) - self.raw)
+
+    def __mul__(self, other):
+        # type: (object) -> FixedPoint
+        if other.__class__ is FixedPoint:
+            return FixedPoint(raw=self.raw * other.raw // self.SCALE)
+        if isinstance(other, int):
+            return FixedPoint(raw=self.raw * other)
+        return FixedPoint(raw=self.raw * FixedPoint.__raw_of(other) // self.SCALE)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        # type: (object) -> FixedPoint
+        if isinstance(other, int):
+            return FixedPoint(raw=self.raw // other)
+        return FixedPoint(raw=self.raw * self.SCALE // FixedPoint.__raw_of(other))
+
+    def __rtruediv__(self, other):
+        # type: (object) -> FixedPoint
+        return FixedPoint(raw=FixedPoint.__raw_of(other) * self.SCALE // self.raw)
+
+    def __neg__(self):
+        # type: () -> FixedPoint
+        return FixedPoint(raw=-self.raw)
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        try:
+            return self.raw == FixedPoint.__raw_of(other)
+        except (TypeError, ValueError):
+            return False
+
+    def __lt__(self, other):
+        # type: (object) -> bool
+        return self.raw < (other.raw if other.__class__ is FixedPoint else FixedPoint.__raw_of(other))
+
+    def __le__(self, other):
+        # type: (object) -> bool
+        return self.raw <= (other.raw if other.__class__ is FixedPoint else FixedPoint.__raw_of(other))
+
+    def __gt__(self, other):
+        # type: (object) -> bool
+        return self.raw > (other.raw if other.__class__ is FixedPoint else FixedPoint.__raw_of(other))
+
+    def __ge__(self, other):
+        # type: (object) -> bool
+        return self.raw >= (other.raw if other.__class__ is FixedPoint else FixedPoint.__raw_of(other))
+
+    def __hash__(self):
+        # type: () -> int
+        return hash(self.raw)
+
+    def __float__(self):
+        # type: () -> float
+        return self.raw / self.SCALE
+
+    def __int__(self):
+        # type: () -> int
+        return self.raw // self.SCALE if self.raw >= 0 else -(-self.raw // self.SCALE)
+
+    def __str__(self):
+        # type: () -> str
+        sign: str = "-" if self.raw < 0 else ""
+        whole, fraction = divmod(abs(self.raw), self.SCALE)
+        return sign + str(whole) + "." + (str(fraction).rjust(6, "0").rstrip("0") or "0")
+
+    def __repr__(self):
+        # type: () -> str
+        return "FixedPoint('" + str(self) + "')"
+
+    def __getstate__(self):
+        # type: () -> int
+        return self.raw
+
+    def __setstate__(self, state):
+        # type: (int) -> None
+        self.raw = state
+
+
+class LogNumber:
+    """
+    This class contains attributes of a non-negative number stored as the base 10 logarithm of its value. It is used
+    for EXP, coins, and costs which grow exponentially during battles, so that comparing, adding, and displaying them
+    takes constant time however large they become.
+    """
+
+    __slots__ = ("log10",)
+    EQUALITY_TOLERANCE: float = 1e-12
+
+    def __init__(self, value=0, log10=None):
+        # type: (object, float or None) -> None
+        if log10 is not None:
+            self.log10: float = float(log10)
+        elif isinstance(value, LogNumber):
+            self.log10 = value.log10
+        elif value == 0:
+            self.log10 = -math.inf
+        elif value < 0:
+            raise ValueError("Log numbers cannot be negative!")
+        elif isinstance(value, mpf):
+            self.log10 = float(mpmath_log10(value))
+        else:
+            self.log10 = math.log10(value)
+
+    @staticmethod
+    def power_of_ten(exponent):
+        # type: (int or float) -> LogNumber
+        return LogNumber(log10=exponent)
+
+    @staticmethod
+    def of(value):
+        # type: (object) -> LogNumber
+        return value if isinstance(value, LogNumber) else LogNumber(mpf(value) if isinstance(value, str) else value)
+
+    def __add__(self, other):
+        # type: (object) -> LogNumber
+        other_log10: float = other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10
+        larger: float = max(self.log10, other_log10)
+        smaller: float = min(self.log10, other_log10)
+        if smaller == -math.inf:
+            return LogNumber(log10=larger)
+        return LogNumber(log10=larger + math.log10(1 + 10 ** (smaller - larger)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        # type: (object) -> LogNumber
+        other_log10: float = other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10
+        if other_log10 == -math.inf:
+            return LogNumber(log10=self.log10)
+
+        difference: float = other_log10 - self.log10
+        if difference > self.EQUALITY_TOLERANCE:
+            raise ValueError("Log numbers cannot be negative!")
+        if difference >= -self.EQUALITY_TOLERANCE:
+            return LogNumber(0)
+        return LogNumber(log10=self.log10 + math.log10(1 - 10 ** difference))
+
+    def __rsub__(self, other):
+        # type: (object) -> LogNumber
+        return LogNumber.of(other) - self
+
+    def __mul__(self, other):
+        # type: (object) -> LogNumber
+        other_log10: float = other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10
+        return LogNumber(log10=self.log10 + other_log10)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        # type: (object) -> LogNumber
+        other_log10: float = other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10
+        return LogNumber(log10=self.log10 - other_log10)
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        try:
+            return self.log10 == (other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10)
+        except (TypeError, ValueError):
+            return False
+
+    def __lt__(self, other):
+        # type: (object) -> bool
+        return self.log10 < (other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10)
+
+    def __le__(self, other):
+        # type: (object) -> bool
+        return self.log10 <= (other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10)
+
+    def __gt__(self, other):
+        # type: (object) -> bool
+        return self.log10 > (other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10)
+
+    def __ge__(self, other):
+        # type: (object) -> bool
+        return self.log10 >= (other.log10 if other.__class__ is LogNumber else LogNumber.of(other).log10)
+
+    def __hash__(self):
+        # type: () -> int
+        return hash(self.log10)
+
+    def __bool__(self):
+        # type: () -> bool
+        return self.log10 != -math.inf
+
+    def __float__(self):
+        # type: () -> float
+        try:
+            return 10.0 ** self.log10
+        except OverflowError:
+            return math.inf
+
+    def __str__(self):
+        # type: () -> str
+        if self.log10 == -math.inf:
+            return "0.0"
+        if self.log10 < 15:
+            return str(round(10.0 ** self.log10, 6))
+
+        exponent: int = math.floor(self.log10)
+        return str(round(10.0 ** (self.log10 - exponent), 6)) + "e+" + str(exponent)
+
+    def __repr__(self):
+        # type: () -> str
+        return "LogNumber(log10=" + repr(self.log10) + ")"
+
+    def __getstate__(self):
+        # type: () -> float
+        return self.log10
+
+    def __setstate__(self, state):
+        # type: (float) -> None
+        self.log10 = state
+
+
+class NumericBackend:
+    """
+    This class contains attributes of a numeric backend used to represent stats of game characters and buildings.
+    EXP, coins, and costs are represented as log numbers regardless of the backend.
+    """
+
+    def __init__(self, name, number_type, convert):
+        # type: (str, type, callable) -> None
+        self.name: str = name
+        self.number_type: type = number_type
+        self.convert = convert
+
+    def __str__(self):
+        # type: () -> str
+        return str(self.name)
+
+
+NUMERIC_BACKENDS: dict = {
+    "MPF": NumericBackend("MPF", mpf, mpf),
+    "FLOAT": NumericBackend("FLOAT", float, float),
+    "FIXED": NumericBackend("FIXED", FixedPoint, FixedPoint)
+}
+numeric_backend: NumericBackend = NUMERIC_BACKENDS["MPF"]
+
+
+def set_numeric_backend(name):
+    # type: (str) -> NumericBackend
+    """
+    This function selects the numeric backend used for stats created from now on.
+    :param name: name of the numeric backend (either 'MPF', 'FLOAT', or 'FIXED')
+    :return: the selected numeric backend
+    """
+    global numeric_backend
+    if name not in NUMERIC_BACKENDS:
+        raise ValueError("Unknown numeric backend '" + str(name) + "'! Must be one of " +
+                         ", ".join(NUMERIC_BACKENDS) + ".")
+
+    numeric_backend = NUMERIC_BACKENDS[name]
+    return numeric_backend
+
+
+def to_number(value):
+    # type: (object) -> object
+    return numeric_backend.convert(value)
 
 
 # Creating necessary classes
 
 
+class CellSet:
+    """
+    This class contains attributes of a set of (x, y) coordinates supporting insertion, removal, and uniformly random
+    selection in constant time.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.__cells: list = []  # initial value
+        self.__indices: dict = {}  # initial value
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.__cells)
+
+    def __contains__(self, cell):
+        # type: (tuple) -> bool
+        return cell in self.__indices
+
+    def add(self, cell):
+        # type: (tuple) -> None
+        if cell not in self.__indices:
+            self.__indices[cell] = len(self.__cells)
+            self.__cells.append(cell)
+
+    def discard(self, cell):
+        # type: (tuple) -> None
+        index: int or None = self.__indices.pop(cell, None)
+        if index is not None:
+            # Move the last cell into the removed cell's position so that removal takes constant time
+            last_cell: tuple = self.__cells.pop()
+            if last_cell != cell:
+                self.__cells[index] = last_cell
+                self.__indices[last_cell] = index
+
+    def choose_random(self, rng=random):
+        # type: (random.Random) -> tuple or None
+        if len(self.__cells) == 0:
+            return None
+        return self.__cells[rng.randint(0, len(self.__cells) - 1)]
+
+    def get_cells(self):
+        # type: () -> tuple
+        return tuple(self.__cells)
+
+    def set_cells(self, cells):
+        # type: (tuple) -> None
+        self.__cells = list(cells)
+        self.__indices = {cell: index for index, cell in enumerate(self.__cells)}
+
+
+class SparseTileRow:
+    """
+    This class contains attributes of a row of a sparse tile grid, so that tiles are looked up as tiles[y][x] like in
+    a list of rows of tiles.
+    """
+
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid, y):
+        # type: (SparseTileGrid, int) -> None
+        self.grid: SparseTileGrid = grid
+        self.y: int = y
+
+    def __len__(self):
+        # type: () -> int
+        return self.grid.width
+
+    def __getitem__(self, x):
+        # type: (int) -> Tile
+        return self.grid.get_tile(x, self.y)
+
+    def __iter__(self):
+        for x in range(self.grid.width):
+            yield self.grid.get_tile(x, self.y)
+
+
+class SparseTileGrid:
+    """
+    This class contains attributes of the tiles of a large battlefield. Only occupied tiles are stored. Empty tiles
+    are made when they are looked up and are kept only while something refers to them, so the same tile is always
+    returned for the same coordinates but empty tiles take no memory.
+    """
+
+    def __init__(self, battlefield, width, height):
+        # type: (Battlefield, int, int) -> None
+        self.battlefield: Battlefield = battlefield
+        self.width: int = width
+        self.height: int = height
+        self.__occupied_tiles: dict = {}  # initial value
+        self.__tiles: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Empty tiles are made again when they are looked up, so only the occupied tiles are copied
+        return {name: value for name, value in vars(self).items() if name != "_SparseTileGrid__tiles"}
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        vars(self).update(state)
+        self.__tiles = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        # type: () -> int
+        return self.height
+
+    def __getitem__(self, y):
+        # type: (int) -> SparseTileRow
+        return SparseTileRow(self, y)
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield SparseTileRow(self, y)
+
+    def get_tile(self, x, y):
+        # type: (int, int) -> Tile
+        cell: tuple = (x, y)
+        tile: Tile or None = self.__occupied_tiles.get(cell)
+        if tile is None:
+            tile = self.__tiles.get(cell)
+            if tile is None:
+                tile = Tile(x, y, self.battlefield)
+                self.__tiles[cell] = tile
+
+        return tile
+
+    def update_tile(self, tile):
+        # type: (Tile) -> bool
+        """
+        This method keeps a tile stored while it is occupied and stops storing it once it is empty.
+        :param tile: the tile which has changed
+        :return: whether the tile has changed from free to occupied or from occupied to free
+        """
+        cell: tuple = (tile.x, tile.y)
+        was_occupied: bool = cell in self.__occupied_tiles
+        if tile.building is None and tile.game_character is None:
+            self.__occupied_tiles.pop(cell, None)
+            return was_occupied
+
+        self.__occupied_tiles[cell] = tile
+        return not was_occupied
+
+    def is_occupied(self, x, y):
+        # type: (int, int) -> bool
+        return (x, y) in self.__occupied_tiles
+
+    def get_occupied_tile(self, x, y):
+        # type: (int, int) -> Tile or None
+        return self.__occupied_tiles.get((x, y))
+
+    def get_occupied_tiles(self):
+        # type: () -> list
+        return list(self.__occupied_tiles.values())
+
+    def get_num_occupied_tiles(self):
+        # type: () -> int
+        return len(self.__occupied_tiles)
+
+
 class Battlefield:
     """
-    This class contains attributes of a battlefield in this game.
+    This class contains attributes of a battlefield in this game. The battlefield keeps track of which tiles are free
+    so that a random free tile can be found in constant time, and of which tiles each team occupies as bitboards
+    (one bit per tile, numbered row by row) so that nearby enemies can be found with a few bitwise operations.
+
+    Battlefields larger than MAX_DENSE_AREA tiles are sparse instead: only occupied tiles are stored, random free
+    tiles are found by sampling random tiles until a free one is found, and nearby enemies are found by looking at
+    the occupied tiles, so memory scales with the number of occupied tiles rather than with the area.
     """
 
+    MAX_CACHED_AREA_MASKS: int = 4096
+    MAX_DENSE_AREA: int = 4096
+    RANDOM_FREE_TILE_ATTEMPTS: int = 32
+
     BATTLEFIELD_WIDTH: int = 20
     BATTLEFIELD_HEIGHT: int = 20
 
-    def __init__(self, name):
-        # type: (str) -> None
+    def __init__(self, name, width=None, height=None):
+        # type: (str, int or None, int or None) -> None
         self.name: str = name
-        self.__tiles: list = []  # initial value
+        self.BATTLEFIELD_WIDTH: int = width if width is not None else Battlefield.BATTLEFIELD_WIDTH
+        self.BATTLEFIELD_HEIGHT: int = height if height is not None else Battlefield.BATTLEFIELD_HEIGHT
+        self.is_sparse: bool = self.BATTLEFIELD_WIDTH * self.BATTLEFIELD_HEIGHT > self.MAX_DENSE_AREA
+        self.__tiles: list or SparseTileGrid = []  # initial value
+        self.__free_cells: CellSet = CellSet()
+        self.__spawn_zones: dict = {}  # initial value
+        self.__game_character_masks: dict = {}  # initial value
+        self.__building_masks: dict = {}  # initial value
+        self.__area_masks: dict = {}  # initial value
+        self.zobrist_hash: ZobristHash or None = None  # initial value
+        if self.is_sparse:
+            self.__tiles = SparseTileGrid(self, self.BATTLEFIELD_WIDTH, self.BATTLEFIELD_HEIGHT)
+            return
+
         for i in range(self.BATTLEFIELD_HEIGHT):
             current: list = []  # initial value
             for j in range(self.BATTLEFIELD_WIDTH):
-                current.append(Tile(j, i))
+                current.append(Tile(j, i, self))
+                self.__free_cells.add((j, i))
 
             self.__tiles.append(current)
 
+    def add_spawn_zone(self, zone_name, x_min, y_min, x_max, y_max):
+        # type: (str, int, int, int, int) -> None
+        """
+        This method adds a rectangular zone (bounds inclusive) which units can be spawned in.
+        :param zone_name: name of the zone
+        :param x_min: minimum x-coordinate of tiles in the zone
+        :param y_min: minimum y-coordinate of tiles in the zone
+        :param x_max: maximum x-coordinate of tiles in the zone
+        :param y_max: maximum y-coordinate of tiles in the zone
+        :return: None
+        """
+        x_min, y_min = max(0, x_min), max(0, y_min)
+        x_max, y_max = min(self.BATTLEFIELD_WIDTH - 1, x_max), min(self.BATTLEFIELD_HEIGHT - 1, y_max)
+        if self.is_sparse:
+            # Sparse battlefields only count the occupied tiles in each zone
+            self.__spawn_zones[zone_name] = (x_min, y_min, x_max, y_max, [
+                sum(1 for tile in self.__tiles.get_occupied_tiles()
+                    if x_min <= tile.x <= x_max and y_min <= tile.y <= y_max)])
+            return
+
+        free_cells: CellSet = CellSet()
+        for y in range(max(0, y_min), min(self.BATTLEFIELD_HEIGHT - 1, y_max) + 1):
+            for x in range(max(0, x_min), min(self.BATTLEFIELD_WIDTH - 1, x_max) + 1):
+                if (x, y) in self.__free_cells:
+                    free_cells.add((x, y))
+
+        self.__spawn_zones[zone_name] = (x_min, y_min, x_max, y_max, free_cells)
+
+    def add_team_spawn_zones(self, team_1_zone_name, team_2_zone_name):
+        # type: (str, str) -> None
+        half_width: int = self.BATTLEFIELD_WIDTH // 2
+        self.add_spawn_zone(team_1_zone_name, 0, 0, half_width - 1, self.BATTLEFIELD_HEIGHT - 1)
+        self.add_spawn_zone(team_2_zone_name, half_width, 0, self.BATTLEFIELD_WIDTH - 1, self.BATTLEFIELD_HEIGHT - 1)
+
+    def update_tile_index(self, tile, occupant=None):
+        # type: (Tile, Building or GameCharacter or None) -> None
+        """
+        This method is called by tiles whenever a building or a game character is added to or removed from them.
+        :param tile: the tile which has changed
+        :param occupant: the building or game character which has been added or removed
+        :return: None
+        """
+        if self.zobrist_hash is not None and occupant is not None:
+            self.zobrist_hash.toggle_position(occupant, tile.x, tile.y)
+
+        cell: tuple = (tile.x, tile.y)
+        is_free: bool = tile.building is None and tile.game_character is None
+        if self.is_sparse:
+            if self.__tiles.update_tile(tile):
+                for x_min, y_min, x_max, y_max, num_occupied_tiles in self.__spawn_zones.values():
+                    if x_min <= tile.x <= x_max and y_min <= tile.y <= y_max:
+                        num_occupied_tiles[0] += 1 if not is_free else -1
+
+            return
+
+        if is_free:
+            self.__free_cells.add(cell)
+        else:
+            self.__free_cells.discard(cell)
+
+        bit: int = 1 << (tile.y * self.BATTLEFIELD_WIDTH + tile.x)
+        for masks, occupant in ((self.__game_character_masks, tile.game_character),
+                                (self.__building_masks, tile.building)):
+            for team in masks:
+                masks[team] &= ~bit
+
+            if occupant is not None:
+                masks[occupant.corresponding_team] = masks.get(occupant.corresponding_team, 0) | bit
+
+        for x_min, y_min, x_max, y_max, free_cells in self.__spawn_zones.values():
+            if x_min <= tile.x <= x_max and y_min <= tile.y <= y_max:
+                if is_free:
+                    free_cells.add(cell)
+                else:
+                    free_cells.discard(cell)
+
+    def update_unit_hash(self, *units):
+        # type: (Building or GameCharacter) -> None
+        if self.zobrist_hash is not None:
+            for unit in units:
+                self.zobrist_hash.update_unit(unit)
+
+    def get_occupancy_mask(self, team=None, game_characters=True, buildings=True):
+        # type: (Team or None, bool, bool) -> int
+        """
+        This method gets the bitboard of tiles occupied by a team, or by all teams if no team is given.
+        :param team: the team, or None for all teams
+        :param game_characters: whether tiles occupied by game characters are included
+        :param buildings: whether tiles occupied by buildings are included
+        :return: the bitboard of occupied tiles
+        """
+        return self.__get_mask(team, False, game_characters, buildings)
+
+    def get_enemy_mask(self, team, game_characters=True, buildings=True):
+        # type: (Team, bool, bool) -> int
+        return self.__get_mask(team, True, game_characters, buildings)
+
+    def __get_mask(self, team, is_enemy, game_characters, buildings):
+        # type: (Team or None, bool, bool, bool) -> int
+        mask: int = 0  # initial value
+        if self.is_sparse:
+            # Sparse battlefields keep no bitboards, so the mask is made from the occupied tiles
+            for tile in self.__tiles.get_occupied_tiles():
+                for occupant, is_included in ((tile.game_character, game_characters), (tile.building, buildings)):
+                    if is_included and occupant is not None and \
+                            (team is None or (occupant.corresponding_team is team) != is_enemy):
+                        mask |= 1 << (tile.y * self.BATTLEFIELD_WIDTH + tile.x)
+
+            return mask
+
+        for masks, is_included in ((self.__game_character_masks, game_characters),
+                                   (self.__building_masks, buildings)):
+            if is_included:
+                for curr_team, team_mask in masks.items():
+                    if team is None or (curr_team is team) != is_enemy:
+                        mask |= team_mask
+
+        return mask
+
+    def get_area_mask(self, x, y, radius):
+        # type: (int, int, int) -> int
+        """
+        This method gets the bitboard of tiles within the given number of steps from (x, y), including (x, y).
+        :param x: x-coordinate of the centre of the area
+        :param y: y-coordinate of the centre of the area
+        :param radius: maximum number of steps from the centre
+        :return: the bitboard of tiles in the area
+        """
+        key: tuple = (x, y, radius)
+        mask: int or None = self.__area_masks.get(key)
+        if mask is None:
+            mask = 0
+            for curr_y in range(max(0, y - radius), min(self.BATTLEFIELD_HEIGHT, y + radius + 1)):
+                steps_left: int = radius - abs(curr_y - y)
+                x_min: int = max(0, x - steps_left)
+                x_max: int = min(self.BATTLEFIELD_WIDTH - 1, x + steps_left)
+                mask |= ((1 << (x_max - x_min + 1)) - 1) << (curr_y * self.BATTLEFIELD_WIDTH + x_min)
+
+            if len(self.__area_masks) >= self.MAX_CACHED_AREA_MASKS:
+                self.__area_masks.clear()
+
+            self.__area_masks[key] = mask
+
+        return mask
+
+    def get_tiles_in_mask(self, mask):
+        # type: (int) -> list
+        tiles_in_mask: list = []  # initial value
+        while mask:
+            lowest_bit: int = mask & -mask
+            index: int = lowest_bit.bit_length() - 1
+            tiles_in_mask.append(self.__tiles[index // self.BATTLEFIELD_WIDTH][index % self.BATTLEFIELD_WIDTH])
+            mask ^= lowest_bit
+
+        return tiles_in_mask
+
+    def get_enemies_within(self, x, y, radius, team, game_characters=True, buildings=True):
+        # type: (int, int, int, Team, bool, bool) -> list
+        """
+        This method gets all living game characters and buildings not belonging to a team within the given number of
+        steps from (x, y).
+        :param x: x-coordinate of the centre of the area
+        :param y: y-coordinate of the centre of the area
+        :param radius: maximum number of steps from the centre
+        :param team: the team whose enemies are looked for
+        :param game_characters: whether game characters are included
+        :param buildings: whether buildings are included
+        :return: a list of enemy game characters and buildings
+        """
+        enemies: list = []  # initial value
+        tiles: list = self.__get_occupied_tiles_within(x, y, radius) if self.is_sparse else \
+            self.get_tiles_in_mask(self.get_enemy_mask(team, game_characters, buildings) &
+                                   self.get_area_mask(x, y, radius))
+        for tile in tiles:
+            occupant: Building or GameCharacter = tile.game_character if tile.game_character is not None \
+                else tile.building
+            if occupant.corresponding_team is team:
+                continue
+
+            if game_characters and tile.game_character is not None:
+                enemies.append(tile.game_character)
+            elif buildings and tile.building is not None and tile.building.get_is_alive():
+                enemies.append(tile.building)
+
+        return enemies
+
+    def __get_occupied_tiles_within(self, x, y, radius):
+        # type: (int, int, int) -> list
+        """
+        This method gets the occupied tiles within the given number of steps from (x, y) in a sparse battlefield, in
+        the same order (row by row) as tiles are listed from bitboards. Whichever of the tiles in the area and the
+        occupied tiles are fewer are looked at.
+        :param x: x-coordinate of the centre of the area
+        :param y: y-coordinate of the centre of the area
+        :param radius: maximum number of steps from the centre
+        :return: a list of occupied tiles
+        """
+        offsets: tuple = get_diamond_offsets(radius)
+        tiles: list = []  # initial value
+        if len(offsets) + 1 <= self.__tiles.get_num_occupied_tiles():
+            for dx, dy in ((0, 0),) + offsets:
+                tile: Tile or None = self.__tiles.get_occupied_tile(x + dx, y + dy)
+                if tile is not None:
+                    tiles.append(tile)
+        else:
+            tiles = [tile for tile in self.__tiles.get_occupied_tiles() if abs(tile.x - x) + abs(tile.y - y) <= radius]
+
+        tiles.sort(key=lambda tile: (tile.y, tile.x))
+        return tiles
+
+    def get_adjacent_enemies(self, x, y, team):
+        # type: (int, int, Team) -> list
+        return self.get_enemies_within(x, y, 1, team)
+
+    def get_nearest_enemy_building(self, x, y, team):
+        # type: (int, int, Team) -> Building or None
+        nearest_building: Building or None = None  # initial value
+        nearest_distance: int = 0  # initial value
+        tiles: list = sorted((tile for tile in self.__tiles.get_occupied_tiles() if tile.building is not None and
+                              tile.building.corresponding_team is not team), key=lambda tile: (tile.y, tile.x)) \
+            if self.is_sparse else self.get_tiles_in_mask(self.get_enemy_mask(team, False, True))
+        for tile in tiles:
+            distance: int = abs(tile.x - x) + abs(tile.y - y)
+            if tile.building.get_is_alive() and (nearest_building is None or distance < nearest_distance):
+                nearest_building = tile.building
+                nearest_distance = distance
+
+        return nearest_building
+
+    def get_num_free_tiles(self, zone_name=None):
+        # type: (str or None) -> int
+        if self.is_sparse:
+            if zone_name is None:
+                return self.BATTLEFIELD_WIDTH * self.BATTLEFIELD_HEIGHT - self.__tiles.get_num_occupied_tiles()
+
+            x_min, y_min, x_max, y_max, num_occupied_tiles = self.__spawn_zones[zone_name]
+            return (x_max - x_min + 1) * (y_max - y_min + 1) - num_occupied_tiles[0]
+
+        return len(self.__free_cells if zone_name is None else self.__spawn_zones[zone_name][4])
+
+    def is_free(self, x, y):
+        # type: (int, int) -> bool
+        """
+        This method checks whether a tile is free without making a tile object for it in sparse battlefields.
+        :param x: x-coordinate of the tile
+        :param y: y-coordinate of the tile
+        :return: whether there is no building or game character on the tile
+        """
+        if self.is_sparse:
+            return not self.__tiles.is_occupied(x, y)
+
+        return (x, y) in self.__free_cells
+
+    def get_free_cells(self):
+        # type: () -> tuple
+        """
+        This method gets the free cells of the whole battlefield and of each spawn zone in the order they are chosen
+        from, so that random free tiles are chosen identically after the free cells are set back.
+        :return: a tuple of the free cells of the whole battlefield followed by those of each spawn zone
+        """
+        if self.is_sparse:
+            return ()  # random free tiles in sparse battlefields only depend on which tiles are occupied
+
+        return (self.__free_cells.get_cells(),) + tuple(zone[4].get_cells() for zone in self.__spawn_zones.values())
+
+    def set_free_cells(self, free_cells):
+        # type: (tuple) -> None
+        if self.is_sparse:
+            return
+
+        self.__free_cells.set_cells(free_cells[0])
+        for zone, cells in zip(self.__spawn_zones.values(), free_cells[1:]):
+            zone[4].set_cells(cells)
+
+    def get_random_free_tile(self, zone_name=None, rng=random):
+        # type: (str or None, random.Random) -> Tile or None
+        """
+        This method gets a random tile without any buildings or game characters on it in constant time.
+        :param zone_name: name of the spawn zone the tile must be in, or None for anywhere in the battlefield
+        :param rng: random number generator used to choose the tile
+        :return: a random free tile, or None if there are no free tiles
+        """
+        if self.is_sparse:
+            return self.__get_random_sparse_free_tile(zone_name, rng)
+
+        free_cells: CellSet = self.__free_cells if zone_name is None else self.__spawn_zones[zone_name][4]
+        cell: tuple or None = free_cells.choose_random(rng)
+        if cell is None:
+            return None
+        return self.__tiles[cell[1]][cell[0]]
+
+    def __get_random_sparse_free_tile(self, zone_name, rng):
+        # type: (str or None, random.Random) -> Tile or None
+        x_min, y_min, x_max, y_max = (0, 0, self.BATTLEFIELD_WIDTH - 1, self.BATTLEFIELD_HEIGHT - 1) \
+            if zone_name is None else self.__spawn_zones[zone_name][:4]
+        if self.get_num_free_tiles(zone_name) <= 0:
+            return None
+
+        for i in range(self.RANDOM_FREE_TILE_ATTEMPTS):
+            x: int = rng.randint(x_min, x_max)
+            y: int = rng.randint(y_min, y_max)
+            if not self.__tiles.is_occupied(x, y):
+                return self.__tiles.get_tile(x, y)
+
+        # The free tiles are only listed if the area is so crowded that sampling keeps failing
+        free_cells: list = [(x, y) for y in range(y_min, y_max + 1) for x in range(x_min, x_max + 1)
+                            if not self.__tiles.is_occupied(x, y)]
+        cell: tuple = free_cells[rng.randint(0, len(free_cells) - 1)]
+        return self.__tiles.get_tile(cell[0], cell[1])
+
     def get_tile_at(self, x, y):
         # type: (int, int) -> Tile or None
         if x < 0 or x >= self.BATTLEFIELD_WIDTH or y < 0 or y >= self.BATTLEFIELD_HEIGHT:
@@ -159,9 +1326,9 @@ class Battlefield:
             current: str = ""  # initial value
             for j in range(self.BATTLEFIELD_WIDTH):
                 if j == self.BATTLEFIELD_WIDTH - 1:
-                    current += str(Tile(j, i))
+                    current += str(self.__tiles[i][j])
                 else:
-                    current += str(Tile(j, i)) + " | "
+                    current += str(self.__tiles[i][j]) + " | "
 
             res += current + "\n"
 
@@ -181,12 +1348,13 @@ class Tile:
     This class contains attributes of a tile in the battlefield.
     """
 
-    def __init__(self, x, y):
-        # type: (int, int) -> None
+    def __init__(self, x, y, battlefield=None):
+        # type: (int, int, Battlefield or None) -> None
         self.x: int = x
         self.y: int = y
         self.building: Building or None = None  # initial value
         self.game_character: GameCharacter or None = None  # initial value
+        self.battlefield: Battlefield or None = battlefield
 
     def __str__(self):
         # type: () -> str
@@ -203,11 +1371,16 @@ class Tile:
             return False
 
         self.building = building
+        if self.battlefield is not None:
+            self.battlefield.update_tile_index(self, building)
         return True
 
     def remove_building(self):
         # type: () -> None
+        building: Building or None = self.building
         self.building = None
+        if self.battlefield is not None:
+            self.battlefield.update_tile_index(self, building)
 
     def add_game_character(self, game_character):
         # type: (GameCharacter) -> bool
@@ -215,11 +1388,16 @@ class Tile:
             return False
 
         self.game_character = game_character
+        if self.battlefield is not None:
+            self.battlefield.update_tile_index(self, game_character)
         return True
 
     def remove_game_character(self):
         # type: () -> None
+        game_character: GameCharacter or None = self.game_character
         self.game_character = None
+        if self.battlefield is not None:
+            self.battlefield.update_tile_index(self, game_character)
 
     def get_distance(self, other):
         # type: (Tile) -> int
@@ -256,6 +1434,7 @@ class Rank:
     """
 
     POSSIBLE_VALUES: list = ["WARRIOR", "ELITE", "MASTER", "GRANDMASTER", "EPIC", "LEGEND", "MYTHIC"]
+    MIN_WINS: list = [0, 10, 100, 200, 500, 1000, 2000]  # minimum number of wins to have each rank
 
     def __init__(self, value):
         # type: (str) -> None
@@ -265,6 +1444,15 @@ class Rank:
         # type: () -> str
         return str(self.value)
 
+    @staticmethod
+    def get_value_for_wins(wins):
+        # type: (int) -> str
+        return Rank.POSSIBLE_VALUES[max(0, bisect_right(Rank.MIN_WINS, wins) - 1)]
+
+    def get_index(self):
+        # type: () -> int
+        return self.POSSIBLE_VALUES.index(self.value)
+
     def clone(self):
         # type: () -> Rank
         return copy.deepcopy(self)
@@ -275,16 +1463,16 @@ class Player:
     This class contains attributes of a player in this game.
     """
 
-    def __init__(self, name, level=1, exp=mpf("0"), required_exp=mpf("1e6")):
-        # type: (str, int, mpf, mpf) -> None
+    def __init__(self, name, level=1, exp=LogNumber(0), required_exp=LogNumber.power_of_ten(6)):
+        # type: (str, int, LogNumber, LogNumber) -> None
         self.player_id: str = str(uuid.uuid1())  # Randomly generate an ID for the player
         self.name: str = name
         self.level: int = level
-        self.exp: mpf = exp
-        self.required_exp: mpf = required_exp
+        self.exp: LogNumber = exp
+        self.required_exp: LogNumber = required_exp
         self.hero_to_control: Hero or None = None  # initial value
-        self.battle_coins: mpf = mpf("0")  # initial value
-        self.global_coins: mpf = mpf("0")  # initial value
+        self.battle_coins: LogNumber = LogNumber(0)  # initial value
+        self.global_coins: LogNumber = LogNumber(0)  # initial value
         self.rank: Rank = Rank("WARRIOR")
         self.wins: int = 0
         self.loses: int = 0
@@ -292,20 +1480,13 @@ class Player:
 
     def update_rank(self):
         # type: () -> None
-        if self.wins < 10:
-            self.rank = Rank("WARRIOR")
-        elif 10 <= self.wins < 100:
-            self.rank = Rank("ELITE")
-        elif 100 <= self.wins < 200:
-            self.rank = Rank("MASTER")
-        elif 200 <= self.wins < 500:
-            self.rank = Rank("GRANDMASTER")
-        elif 500 <= self.wins < 1000:
-            self.rank = Rank("EPIC")
-        elif 1000 <= self.wins < 2000:
-            self.rank = Rank("LEGEND")
-        else:
-            self.rank = Rank("MYTHIC")
+        rank_value: str = Rank.get_value_for_wins(self.wins)
+        if rank_value != self.rank.value:
+            self.rank = Rank(rank_value)
+
+    def get_win_rate(self):
+        # type: () -> float
+        return self.wins / (self.wins + self.loses) if self.wins + self.loses > 0 else 0.0
 
     def __str__(self):
         # type: () -> str
@@ -340,7 +1521,7 @@ class Player:
 
     def restore_battle_coins(self):
         # type: () -> None
-        self.battle_coins = mpf("0")
+        self.battle_coins = LogNumber(0)
 
     def set_hero_to_control(self, hero):
         # type: (Hero) -> None
@@ -356,8 +1537,8 @@ class HumanPlayer(Player):
     This class contains attributes of a human player.
     """
 
-    def __init__(self, name, level=1, exp=mpf("0"), required_exp=mpf("1e6")):
-        # type: (str, int, mpf, mpf) -> None
+    def __init__(self, name, level=1, exp=LogNumber(0), required_exp=LogNumber.power_of_ten(6)):
+        # type: (str, int, LogNumber, LogNumber) -> None
         Player.__init__(self, name, level, exp, required_exp)
 
 
@@ -366,9 +1547,9 @@ class CPUPlayer(Player):
     This class contains attributes of a player controlled by the CPU.
     """
 
-    def __init__(self, level=1, exp=mpf("0"), required_exp=mpf("1e6")):
-        # type: (int, mpf, mpf) -> None
-        Player.__init__(self, generate_random_name(), level, exp, required_exp)
+    def __init__(self, level=1, exp=LogNumber(0), required_exp=LogNumber.power_of_ten(6), name=None):
+        # type: (int, LogNumber, LogNumber, str or None) -> None
+        Player.__init__(self, name if name is not None else generate_random_name(), level, exp, required_exp)
 
 
 class Team:
@@ -376,8 +1557,9 @@ class Team:
     This class contains attributes of teams of players brought to battles.
     """
 
-    def __init__(self, battle_squad):
-        # type: (BattleSquad) -> None
+    def __init__(self, battle_squad, name="Team"):
+        # type: (BattleSquad, str) -> None
+        self.name: str = name
         self.battle_squad: BattleSquad = battle_squad
         self.__players: list = [hero.controlling_player for hero in self.battle_squad.get_heroes()]
 
@@ -385,6 +1567,10 @@ class Team:
         # type: () -> str
         return str(self.battle_squad)
 
+    def get_players(self):
+        # type: () -> list
+        return self.__players
+
     def clone(self):
         # type: () -> Team
         return copy.deepcopy(self)
@@ -395,18 +1581,18 @@ class BattleSquad:
     This class contains attributes of a squad of game characters together with buildings brought to battles.
     """
 
+    # Sizes of standard battle squads. Squads of other sizes are used for stress tests.
     NUM_HEROES: int = 5
     NUM_VILLAGERS: int = 5
     NUM_DEFENSE_TOWERS: int = 3
 
     def __init__(self, heroes, villagers, defense_towers, town_center):
         # type: (list, list, list, TownCenter) -> None
-        self.__heroes: list = heroes if len(heroes) == self.NUM_HEROES else []
-        self.__villagers: list = villagers if len(villagers) == self.NUM_VILLAGERS else []
-        self.__defense_towers: list = defense_towers if len(defense_towers) == self.NUM_DEFENSE_TOWERS else []
-        assert self.__heroes != [] and self.__villagers != [] and \
-               self.__defense_towers != [], "Failed to initialise battle squad! Must have 5 heroes, " \
-                                            "5 villagers, 3 battle towers, and a town center!"
+        self.__heroes: list = heroes
+        self.__villagers: list = villagers
+        self.__defense_towers: list = defense_towers
+        assert len(self.__heroes) > 0 and town_center is not None, "Failed to initialise battle squad! Must have " \
+                                                                   "at least a hero and a town center!"
         self.town_center: TownCenter = town_center
 
     def all_died(self):
@@ -463,17 +1649,25 @@ class Building:
         # type: (str, mpf, mpf, int, int) -> None
         self.name: str = name
         self.battle_level: int = 1
-        self.battle_exp: mpf = mpf("0")
-        self.required_battle_exp: mpf = mpf("0")
+        self.battle_exp: LogNumber = LogNumber(0)
+        self.required_battle_exp: LogNumber = LogNumber.power_of_ten(6)
         self.curr_hp: mpf = max_hp
         self.max_hp: mpf = max_hp
         self.defense: mpf = defense
-        self.crit_resistance: mpf = mpf("200")  # Default value
+        self.crit_resistance: mpf = to_number("200")  # Default value
         self.x: int = x
         self.y: int = y
-        self.hp_heal_rate: mpf = self.max_hp / mpf("12")
+        self.hp_heal_rate: mpf = self.max_hp / 12
         self.is_alive: bool = self.get_is_alive()
         self.corresponding_team: Team or None = None  # initial value
+        self.stats_version: int = new_stats_version()
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Units pickled by older versions of this game have no stats version
+        self.__dict__.update(state)
+        if "stats_version" not in state:
+            self.stats_version = new_stats_version()
 
     def __str__(self):
         # type: () -> str
@@ -487,18 +1681,20 @@ class Building:
         res += "Location: (" + str(self.x) + ", " + str(self.y) + ")\n"
         res += "HP heal rate: " + str(self.hp_heal_rate) + " per turn\n"
         res += "Is this building still alive? " + str(self.get_is_alive()) + "\n"
-        res += "Corresponding team:\n" + str(self.corresponding_team) + "\n"
+        res += "Corresponding team: " + str(None if self.corresponding_team is None else
+                                            self.corresponding_team.name) + "\n"
         return res
 
     def spawn(self, x, y, battlefield):
         # type: (int, int, Battlefield) -> bool
-        if 0 <= x < battlefield.BATTLEFIELD_WIDTH and 0 <= y <= \
+        if 0 <= x < battlefield.BATTLEFIELD_WIDTH and 0 <= y < \
                 battlefield.BATTLEFIELD_HEIGHT:
             if battlefield.get_tiles()[y][x].building is None \
                               and battlefield.get_tiles()[y][x].game_character is None:
                 self.x = x
                 self.y = y
                 battlefield.get_tiles()[self.y][self.x].add_building(self)
+                battlefield.update_unit_hash(self)
                 return True
             return False
         return False
@@ -542,11 +1738,12 @@ class BattleTower(Building):
         # type: () -> None
         while self.battle_exp >= self.required_battle_exp:
             self.battle_level += 1
-            self.required_battle_exp *= mpf("10") ** mpf(self.battle_level ** 2)
+            self.required_battle_exp *= LogNumber.power_of_ten(self.battle_level ** 2)
             self.attack_power *= 2
             self.max_hp *= 2
             self.curr_hp = self.max_hp
             self.defense *= 2
+            self.stats_version = new_stats_version()
 
     def restore_battle_level(self):
         # type: () -> None
@@ -555,28 +1752,34 @@ class BattleTower(Building):
         self.curr_hp = self.max_hp
         self.defense /= 2 ** (self.battle_level - 1)
         self.battle_level = 1
+        self.stats_version = new_stats_version()
 
-    def attack(self, target, battlefield):
-        # type: (GameCharacter, Battlefield) -> bool
+    def attack(self, target, battlefield, rng=random):
+        # type: (GameCharacter, Battlefield, random.Random) -> bool
         if self.corresponding_team == target.corresponding_team:
             return False  # cannot attack
 
-        if battlefield.get_tiles()[target.y][target.x].get_distance(battlefield.get_tiles()[self.y][self.x]) > 1:
+        if abs(target.x - self.x) + abs(target.y - self.y) > 1:
             return False  # cannot attack
 
-        is_crit: bool = random.random() <= (self.crit_rate - target.crit_resistance) / 3000
+        is_crit: bool = rng.random() <= (self.crit_rate - target.crit_resistance) / 3000
         raw_damage: mpf = self.attack_power - target.defense if not is_crit else \
             self.attack_power * self.crit_damage - target.defense
         damage: mpf = raw_damage if raw_damage > 0 else 0
         target.curr_hp -= damage
+        self.record_kill(target, battlefield)
+        self.has_attacked = True
+        battlefield.update_unit_hash(self, target)
+        return True
+
+    def record_kill(self, target, battlefield):
+        # type: (GameCharacter, Battlefield) -> None
         if not target.get_is_alive():
             target.times_killed += 1
-            self.battle_exp += mpf("10") ** mpf(target.battle_level ** 2)
+            battlefield.get_tiles()[target.y][target.x].remove_game_character()
+            self.battle_exp += LogNumber.power_of_ten(target.battle_level ** 2)
             self.level_up()
 
-        self.has_attacked = True
-        return True
-
     def restore_attacked_status(self):
         # type: () -> None
         self.has_attacked = False
@@ -597,13 +1800,15 @@ class GameCharacter:
     This class contains attributes of a game character.
     """
 
+    RANDOM_DESTINATION_ATTEMPTS: int = 8
+
     def __init__(self, name, max_hp, max_magic_points, attack_power, defense, crit_rate, crit_resistance, crit_damage,
                  max_steps, x, y):
         # type: (str, mpf, mpf, mpf, mpf, mpf, mpf, mpf, int, int, int) -> None
         self.name: str = name
         self.battle_level: int = 1
-        self.battle_exp: mpf = mpf("0")
-        self.required_battle_exp: mpf = mpf("1e6")
+        self.battle_exp: LogNumber = LogNumber(0)
+        self.required_battle_exp: LogNumber = LogNumber.power_of_ten(6)
         self.curr_hp: mpf = max_hp
         self.max_hp: mpf = max_hp
         self.curr_magic_points: mpf = max_magic_points
@@ -616,8 +1821,8 @@ class GameCharacter:
         self.max_steps: int = max_steps
         self.x: int = x
         self.y: int = y
-        self.hp_heal_rate: mpf = self.max_hp / mpf("12")
-        self.mp_heal_rate: mpf = self.max_magic_points / mpf("12")
+        self.hp_heal_rate: mpf = self.max_hp / 12
+        self.mp_heal_rate: mpf = self.max_magic_points / 12
         self.is_alive: bool = self.get_is_alive()
         self.__upgrades_applied: list = []  # initial value
         self.corresponding_team: Team or None = None  # initial value
@@ -625,6 +1830,14 @@ class GameCharacter:
         self.has_attacked: bool = False  # initial value
         self.kills: int = 0
         self.times_killed: int = 0
+        self.stats_version: int = new_stats_version()
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Units pickled by older versions of this game have no stats version
+        self.__dict__.update(state)
+        if "stats_version" not in state:
+            self.stats_version = new_stats_version()
 
     def __str__(self):
         # type: () -> str
@@ -649,7 +1862,8 @@ class GameCharacter:
         for upgrade in self.__upgrades_applied:
             res += str(upgrade) + "\n"
 
-        res += "Corresponding team:\n" + str(self.corresponding_team) + "\n"
+        res += "Corresponding team: " + str(None if self.corresponding_team is None else
+                                            self.corresponding_team.name) + "\n"
         res += "Has this game character moved? " + str(self.has_moved) + "\n"
         res += "Has this game character attacked? " + str(self.has_attacked) + "\n"
         res += "Number of kills done during battle: " + str(self.kills) + "\n"
@@ -660,13 +1874,18 @@ class GameCharacter:
         # type: () -> None
         while self.battle_exp >= self.required_battle_exp:
             self.battle_level += 1
-            self.required_battle_exp *= mpf("10") ** mpf(self.battle_level ** 2)
+            self.required_battle_exp *= LogNumber.power_of_ten(self.battle_level ** 2)
             self.attack_power *= 2
             self.max_hp *= 2
             self.curr_hp = self.max_hp
             self.max_magic_points *= 2
             self.curr_magic_points = self.max_magic_points
             self.defense *= 2
+            self.stats_version = new_stats_version()
+
+    def get_upgrades_applied(self):
+        # type: () -> list
+        return self.__upgrades_applied
 
     def restore_to_initial(self):
         # type: () -> None
@@ -685,23 +1904,25 @@ class GameCharacter:
         self.curr_magic_points = self.max_magic_points
         self.defense /= 2 ** (self.battle_level - 1)
         self.battle_level = 1
+        self.stats_version = new_stats_version()
 
     def spawn(self, x, y, battlefield):
         # type: (int, int, Battlefield) -> bool
-        if 0 <= x < battlefield.BATTLEFIELD_WIDTH and 0 <= y <= \
+        if 0 <= x < battlefield.BATTLEFIELD_WIDTH and 0 <= y < \
                 battlefield.BATTLEFIELD_HEIGHT:
             if battlefield.get_tiles()[y][x].building is None \
                               and battlefield.get_tiles()[y][x].game_character is None:
                 self.x = x
                 self.y = y
                 battlefield.get_tiles()[self.y][self.x].add_game_character(self)
+                battlefield.update_unit_hash(self)
                 return True
             return False
         return False
 
     def respawn(self, x, y, battlefield):
         # type: (int, int, Battlefield) -> bool
-        if not self.get_is_alive() and 0 <= x < battlefield.BATTLEFIELD_WIDTH and 0 <= y <= \
+        if not self.get_is_alive() and 0 <= x < battlefield.BATTLEFIELD_WIDTH and 0 <= y < \
                 battlefield.BATTLEFIELD_HEIGHT:
             if battlefield.get_tiles()[y][x].building is None \
                     and battlefield.get_tiles()[y][x].game_character is None:
@@ -709,6 +1930,7 @@ class GameCharacter:
                 self.x = x
                 self.y = y
                 battlefield.get_tiles()[self.y][self.x].add_game_character(self)
+                battlefield.update_unit_hash(self)
                 return True
             return False
         return False
@@ -731,29 +1953,40 @@ class GameCharacter:
         if self.curr_magic_points > self.max_magic_points:
             self.curr_magic_points = self.max_magic_points
 
-    def attack(self, target, battlefield):
-        # type: (Building or GameCharacter, Battlefield) -> bool
+    def attack(self, target, battlefield, rng=random):
+        # type: (Building or GameCharacter, Battlefield, random.Random) -> bool
         if self.corresponding_team == target.corresponding_team:
             return False  # cannot attack
 
-        if battlefield.get_tiles()[target.y][target.x].get_distance(battlefield.get_tiles()[self.y][self.x]) > 1:
+        if abs(target.x - self.x) + abs(target.y - self.y) > 1:
             return False  # cannot attack
 
-        is_crit: bool = random.random() <= (self.crit_rate - target.crit_resistance) / 3000
+        is_crit: bool = rng.random() <= (self.crit_rate - target.crit_resistance) / 3000
         raw_damage: mpf = self.attack_power - target.defense if not is_crit \
             else self.attack_power * self.crit_damage - target.defense
         damage: mpf = raw_damage if raw_damage > 0 else 0
         target.curr_hp -= damage
+        self.record_kill(target, battlefield)
+        self.has_attacked = True
+        battlefield.update_unit_hash(self, target)
+        return True
+
+    def record_kill(self, target, battlefield):
+        # type: (Building or GameCharacter, Battlefield) -> None
+        """
+        This method gives kill rewards to this game character if the target it has just attacked has died.
+        :param target: the game character or building which has just been attacked
+        :param battlefield: the battlefield the battle takes place in
+        :return: None
+        """
         if isinstance(target, GameCharacter) and not target.get_is_alive():
             self.kills += 1
             target.times_killed += 1
-            self.battle_exp += mpf("10") ** mpf(target.battle_level ** 2)
+            battlefield.get_tiles()[target.y][target.x].remove_game_character()
+            self.battle_exp += LogNumber.power_of_ten(target.battle_level ** 2)
             self.level_up()
 
-        self.has_attacked = True
-        return True
-
-    def move(self, dest_x, dest_y, battlefield):
+    def can_move(self, dest_x, dest_y, battlefield):
         # type: (int, int, Battlefield) -> bool
         if self.has_moved:
             return False
@@ -763,14 +1996,67 @@ class GameCharacter:
             return False
 
         move: Move = Move(battlefield.get_tiles()[self.y][self.x], battlefield.get_tiles()[dest_y][dest_x])
-        move_is_valid: bool = move.from_tile.get_distance(move.to_tile) <= self.max_steps \
-                              and battlefield.get_tiles()[dest_y][dest_x].building is None \
-                              and battlefield.get_tiles()[dest_y][dest_x].game_character is None
-        if move_is_valid:
-            self.x = move.to_tile.x
-            self.y = move.to_tile.y
+        return move.from_tile.get_distance(move.to_tile) <= self.max_steps \
+            and move.to_tile.building is None and move.to_tile.game_character is None
+
+    def get_reachable_tiles(self, battlefield):
+        # type: (Battlefield) -> list
+        """
+        This method gets coordinates of all tiles this game character can move to in a single pass over the tiles
+        within its maximum number of steps.
+        :param battlefield: the battlefield the battle takes place in
+        :return: a list of (x, y) coordinates
+        """
+        if self.has_moved:
+            return []
+
+        reachable_tiles: list = []  # initial value
+        for y in range(max(0, self.y - self.max_steps),
+                       min(battlefield.BATTLEFIELD_HEIGHT, self.y + self.max_steps + 1)):
+            # Only the part of each row of the diamond which lies inside the battlefield is visited
+            steps_left: int = self.max_steps - abs(y - self.y)
+            for x in range(max(0, self.x - steps_left), min(battlefield.BATTLEFIELD_WIDTH, self.x + steps_left + 1)):
+                if battlefield.is_free(x, y):
+                    reachable_tiles.append((x, y))
+
+        return reachable_tiles
+
+    def choose_random_destination(self, battlefield, rng=random):
+        # type: (Battlefield, random.Random) -> tuple or None
+        """
+        This method chooses a tile this game character can move to uniformly at random. A few random offsets within
+        the maximum number of steps are tried first, and all reachable tiles are listed only if they all fail, so
+        the cost of choosing a destination is bounded however crowded the battlefield is.
+        :param battlefield: the battlefield the battle takes place in
+        :param rng: random number generator used to choose the tile
+        :return: (x, y) coordinates of the chosen tile, or None if this game character cannot move anywhere
+        """
+        if self.has_moved:
+            return None
+
+        offsets: tuple = get_diamond_offsets(self.max_steps)
+        for i in range(self.RANDOM_DESTINATION_ATTEMPTS):
+            dx, dy = offsets[rng.randint(0, len(offsets) - 1)]
+            x: int = self.x + dx
+            y: int = self.y + dy
+            if 0 <= x < battlefield.BATTLEFIELD_WIDTH and 0 <= y < battlefield.BATTLEFIELD_HEIGHT and \
+                    battlefield.is_free(x, y):
+                return x, y
+
+        reachable_tiles: list = self.get_reachable_tiles(battlefield)
+        if len(reachable_tiles) == 0:
+            return None
+        return reachable_tiles[rng.randint(0, len(reachable_tiles) - 1)]
+
+    def move(self, dest_x, dest_y, battlefield):
+        # type: (int, int, Battlefield) -> bool
+        if self.can_move(dest_x, dest_y, battlefield):
+            battlefield.get_tiles()[self.y][self.x].remove_game_character()
+            self.x = dest_x
+            self.y = dest_y
             battlefield.get_tiles()[self.y][self.x].add_game_character(self)
             self.has_moved = True
+            battlefield.update_unit_hash(self)
             return True
         return False
 
@@ -829,7 +2115,7 @@ class Hero(PlayerCharacter):
     def restore_to_initial(self):
         # type: () -> None
         self.restore_battle_level()
-        for rune in self.__runes:
+        for rune in list(self.__runes):
             self.remove_rune(rune)
 
         self.kills = 0
@@ -837,13 +2123,16 @@ class Hero(PlayerCharacter):
         self.restore_attacked_status()
         self.restore_moved_status()
 
-    def attack(self, target, battlefield, skill_to_use=None):
-        # type: (Building or GameCharacter, Battlefield, Skill or None) -> bool
+    def attack(self, target, battlefield, skill_to_use=None, rng=random):
+        # type: (Building or GameCharacter, Battlefield, Skill or None, random.Random) -> bool
         curr_skill: Skill or None = None  # initial value
-        if battlefield.get_tiles()[target.y][target.x].get_distance(battlefield.get_tiles()[self.y][self.x]) > 1:
+        if self.corresponding_team == target.corresponding_team:
+            return False  # cannot attack
+
+        if abs(target.x - self.x) + abs(target.y - self.y) > 1:
             return False  # cannot attack
 
-        if skill_to_use not in self.__skills:
+        if skill_to_use is not None and skill_to_use not in self.__skills:
             return False  # skill is not owned by the hero
 
         if isinstance(skill_to_use, Skill) and self.curr_magic_points < skill_to_use.magic_points_cost:
@@ -851,21 +2140,17 @@ class Hero(PlayerCharacter):
         else:
             curr_skill = skill_to_use
 
-        is_crit: bool = random.random() <= (self.crit_rate - target.crit_resistance) / 3000
-        raw_damage: mpf = self.attack_power - target.defense if not is_crit and curr_skill is None \
-            else self.attack_power * self.crit_damage - target.defense if is_crit and curr_skill is None \
-            else (self.max_hp * skill_to_use.damage_multiplier_to_max_hp + self.max_magic_points *
-                  skill_to_use.damage_multiplier_to_max_magic_points + self.attack_power *
-                  skill_to_use.damage_multiplier_to_attack_power + self.defense *
-                  skill_to_use.damage_multiplier_to_defense) - target.defense if curr_skill is not None and not is_crit \
-            else (self.max_hp * skill_to_use.damage_multiplier_to_max_hp + self.max_magic_points *
-                  skill_to_use.damage_multiplier_to_max_magic_points + self.attack_power *
-                  skill_to_use.damage_multiplier_to_attack_power + self.defense *
-                  skill_to_use.damage_multiplier_to_defense) * self.crit_damage - target.defense if curr_skill is not None \
-                                                                                                    and is_crit else 0
+        is_crit: bool = rng.random() <= (self.crit_rate - target.crit_resistance) / 3000
+        base_damage: mpf = self.attack_power if curr_skill is None \
+            else self.max_hp * curr_skill.damage_multiplier_to_max_hp + self.max_magic_points * \
+            curr_skill.damage_multiplier_to_max_magic_points + self.attack_power * \
+            curr_skill.damage_multiplier_to_attack_power + self.defense * curr_skill.damage_multiplier_to_defense
+        raw_damage: mpf = (base_damage * self.crit_damage if is_crit else base_damage) - target.defense
         damage: mpf = raw_damage if raw_damage > 0 else 0
         target.curr_hp -= damage
+        self.record_kill(target, battlefield)
         self.has_attacked = True
+        battlefield.update_unit_hash(self, target)
         return True
 
     def set_controlling_player(self, player):
@@ -884,6 +2169,7 @@ class Hero(PlayerCharacter):
         self.crit_rate += rune.crit_rate_up
         self.crit_damage += rune.crit_damage_up
         self.crit_resistance += rune.crit_resistance_up
+        self.stats_version = new_stats_version()
 
     def remove_rune(self, rune):
         # type: (Rune) -> bool
@@ -898,16 +2184,13 @@ class Hero(PlayerCharacter):
             self.crit_rate -= rune.crit_rate_up
             self.crit_damage -= rune.crit_damage_up
             self.crit_resistance -= rune.crit_resistance_up
+            self.stats_version = new_stats_version()
             return True
         return False
 
-    def get_upgrades_applied(self):
-        # type: () -> list
-        return self.__upgrades_applied
-
     def apply_upgrade(self, upgrade):
         # type: (Upgrade) -> None
-        self.__upgrades_applied.append(upgrade)
+        self.get_upgrades_applied().append(upgrade)
         self.max_hp *= upgrade.max_hp_multiplier
         self.curr_hp = self.max_hp
         self.max_magic_points *= upgrade.max_magic_points_multiplier
@@ -917,15 +2200,18 @@ class Hero(PlayerCharacter):
         self.crit_rate += upgrade.crit_rate_up
         self.crit_damage += upgrade.crit_damage_up
         self.crit_resistance += upgrade.crit_resistance_up
+        self.stats_version = new_stats_version()
 
     def add_skill(self, skill):
         # type: (Skill) -> None
         self.__skills.append(skill)
+        self.stats_version = new_stats_version()
 
     def remove_skill(self, skill):
         # type: (Skill) -> bool
         if skill in self.__skills:
             self.__skills.remove(skill)
+            self.stats_version = new_stats_version()
             return True
         return False
 
@@ -933,6 +2219,10 @@ class Hero(PlayerCharacter):
         # type: () -> list
         return self.__skills
 
+    def get_runes(self):
+        # type: () -> list
+        return self.__runes
+
 
 class Villager(PlayerCharacter):
     """
@@ -1129,57 +2419,3535 @@ class GlobalShop(Shop):
         return self.__runes_sold
 
 
-class Game:
+class SkipList:
     """
-    This class contains attributes of saved game data.
+    This class contains attributes of a sorted collection of distinct keys stored as an indexable skip list. Every
+    link records how many keys it skips over, so that adding a key, removing a key, and finding the position of a key
+    take O(log n) expected time.
     """
 
-    def __init__(self, human_players):
-        # type: (list) -> None
-        self.__human_players: list = human_players
+    MAX_LEVEL: int = 32
 
-    def __str__(self):
-        # type: () -> str
-        res: str = ""  # initial value
+    def __init__(self, keys=()):
+        # type: (iter) -> None
+        # Nodes are lists of a key, the next node at each level, and the number of positions each link skips
+        self.__random: random.Random = random.Random(0)
+        self.__tail: list = [None, [], []]
+        self.__head: list = [None, [self.__tail] * self.MAX_LEVEL, [1] * self.MAX_LEVEL]
+        self.__size: int = 0
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        # type: () -> int
+        return self.__size
+
+    def __getstate__(self):
+        # type: () -> list
+        # Nodes are only stored as the sorted keys, since pickling the linked nodes would recurse once per key
+        return list(self)
+
+    def __setstate__(self, state):
+        # type: (list) -> None
+        self.__init__(state)
+
+    def __iter__(self):
+        # type: () -> iter
+        node: list = self.__head[1][0]
+        while node is not self.__tail:
+            yield node[0]
+            node = node[1][0]
+
+    def __find_predecessors(self, key):
+        # type: (object) -> tuple
+        # The last node before the key at each level, and the position of each of these nodes (-1 for the head)
+        predecessors: list = [self.__head] * self.MAX_LEVEL
+        positions: list = [-1] * self.MAX_LEVEL
+        node: list = self.__head
+        position: int = -1  # initial value
+        for level in range(self.MAX_LEVEL - 1, -1, -1):
+            while node[1][level] is not self.__tail and node[1][level][0] < key:
+                position += node[2][level]
+                node = node[1][level]
+
+            predecessors[level] = node
+            positions[level] = position
+
+        return predecessors, positions
+
+    def add(self, key):
+        # type: (object) -> None
+        predecessors, positions = self.__find_predecessors(key)
+        height: int = 1  # initial value
+        while height < self.MAX_LEVEL and self.__random.random() < 0.5:
+            height += 1
+
+        new_node: list = [key, [None] * height, [0] * height]
+        new_position: int = positions[0] + 1
+        for level in range(height):
+            predecessor: list = predecessors[level]
+            new_node[1][level] = predecessor[1][level]
+            new_node[2][level] = predecessor[2][level] - (new_position - positions[level]) + 1
+            predecessor[1][level] = new_node
+            predecessor[2][level] = new_position - positions[level]
+
+        for level in range(height, self.MAX_LEVEL):
+            predecessors[level][2][level] += 1
+
+        self.__size += 1
+
+    def remove(self, key):
+        # type: (object) -> bool
+        predecessors, positions = self.__find_predecessors(key)
+        node: list = predecessors[0][1][0]
+        if node is self.__tail or node[0] != key:
+            return False
+
+        height: int = len(node[1])
+        for level in range(height):
+            predecessor: list = predecessors[level]
+            predecessor[1][level] = node[1][level]
+            predecessor[2][level] += node[2][level] - 1
+
+        for level in range(height, self.MAX_LEVEL):
+            predecessors[level][2][level] -= 1
+
+        self.__size -= 1
+        return True
+
+    def index(self, key):
+        # type: (object) -> int or None
+        """
+        This method gets the position of a key in this skip list.
+        :param key: the key to be found
+        :return: the position (starting from 0) of the key, or None if it is not in this skip list
+        """
+        predecessors, positions = self.__find_predecessors(key)
+        node: list = predecessors[0][1][0]
+        return positions[0] + 1 if node is not self.__tail and node[0] == key else None
+
+    def get_first(self, k):
+        # type: (int) -> list
+        return list(itertools.islice(self, k))
+
+
+class Leaderboard:
+    """
+    This class contains attributes of a leaderboard of players kept in order in a skip list, so that updating a player
+    after a battle and getting the position of a player take O(log n) expected time, and getting the top k players
+    takes O(k) time.
+    """
+
+    ORDERS: dict = {
+        "WINS": lambda player: (-player.wins, player.loses, player.name),
+        "WIN RATE": lambda player: (-player.get_win_rate(), -player.wins, player.name),
+        "RANK": lambda player: (-player.rank.get_index(), -player.wins, player.loses, player.name)
+    }
+
+    def __init__(self, players, order="WINS"):
+        # type: (list, str) -> None
+        if order not in self.ORDERS:
+            raise ValueError("Unknown leaderboard order '" + str(order) + "'! Must be one of " +
+                             ", ".join(self.ORDERS) + ".")
+
+        self.order: str = order
+        self.__get_key = self.ORDERS[order]
+        self.__keys_by_id: dict = {player.player_id: self.__get_key(player) + (player.player_id,)
+                                   for player in players}
+        self.__players_by_id: dict = {player.player_id: player for player in players}
+        self.__sorted_keys: SkipList = SkipList(self.__keys_by_id.values())
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.__sorted_keys)
+
+    def update_player(self, player):
+        # type: (Player) -> None
+        """
+        This method moves a player to its new position after its wins or loses have changed, or adds the player if it
+        is not on the leaderboard yet.
+        :param player: the player to be updated
+        :return: None
+        """
+        self.remove_player(player)
+        key: tuple = self.__get_key(player) + (player.player_id,)
+        self.__sorted_keys.add(key)
+        self.__keys_by_id[player.player_id] = key
+        self.__players_by_id[player.player_id] = player
+
+    def remove_player(self, player):
+        # type: (Player) -> bool
+        key: tuple or None = self.__keys_by_id.pop(player.player_id, None)
+        if key is None:
+            return False
+
+        self.__sorted_keys.remove(key)
+        del self.__players_by_id[player.player_id]
+        return True
+
+    def get_top_players(self, k):
+        # type: (int) -> list
+        return [self.__players_by_id[key[-1]] for key in self.__sorted_keys.get_first(k)]
+
+    def get_position(self, player):
+        # type: (Player) -> int or None
+        """
+        This method gets the position of a player on this leaderboard.
+        :param player: the player whose position is to be found
+        :return: the position (starting from 1) of the player, or None if the player is not on this leaderboard
+        """
+        key: tuple or None = self.__keys_by_id.get(player.player_id)
+        if key is None:
+            return None
+        return self.__sorted_keys.index(key) + 1
+
+
+class Game:
+    """
+    This class contains attributes of saved game data. Human players are indexed by name and by ID so that looking
+    them up takes constant time however many human players have been saved. If the game data is backed by a player
+    store, human players are only loaded from the store when they are looked up.
+    """
+
+    def __init__(self, human_players, player_store=None):
+        # type: (list, SQLitePlayerStore or None) -> None
+        self.__human_players: list = human_players
+        self.__human_players_by_name: dict = {}  # initial value
+        self.__human_players_by_id: dict = {}  # initial value
+        self.__leaderboards: dict = {}  # initial value
+        self.__player_store: SQLitePlayerStore or None = player_store
+        self.__has_loaded_all_human_players: bool = player_store is None
+        self.__index_human_players()
+
+    def __index_human_players(self):
+        # type: () -> None
+        # Game data saved before names had to be unique may have several human players with the same name, in which
+        # case the first one is found by name as it always was
+        self.__human_players_by_name = {}
+        self.__human_players_by_id = {}
+        for human_player in self.__human_players:
+            self.__human_players_by_name.setdefault(human_player.name, human_player)
+            self.__human_players_by_id.setdefault(human_player.player_id, human_player)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Game data pickled by older versions of this game has no indexes or leaderboards
+        leaderboard_orders: list = state.pop("_Game__leaderboard_orders", [])
+        self.__dict__.update(state)
+        self.__player_store = None
+        self.__has_loaded_all_human_players = True
+        self.__index_human_players()
+        self.__build_leaderboards(leaderboard_orders)
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Connections to player stores cannot be copied, so copies only hold the human players loaded so far. Only
+        # the orders of the leaderboards are copied, and the leaderboards are built again from the copied players.
+        state: dict = self.__dict__.copy()
+        state["_Game__player_store"] = None
+        state["_Game__leaderboard_orders"] = list(state.pop("_Game__leaderboards"))
+        return state
+
+    def __build_leaderboards(self, orders):
+        # type: (list) -> None
+        self.__leaderboards = {order: Leaderboard(self.get_human_players(), order) for order in orders}
+
+    def __add_loaded_human_player(self, human_player):
+        # type: (HumanPlayer) -> HumanPlayer
+        self.__human_players.append(human_player)
+        self.__human_players_by_name[human_player.name] = human_player
+        self.__human_players_by_id[human_player.player_id] = human_player
+        for leaderboard in self.__leaderboards.values():
+            leaderboard.update_player(human_player)
+
+        return human_player
+
+    def __str__(self):
+        # type: () -> str
+        res: str = ""  # initial value
         res += "Below is a list of human players saved in this saved game data:\n"
         for human_player in self.__human_players:
             res += str(human_player) + "\n"
 
-        return res
+        return res
+
+    def add_human_player(self, human_player):
+        # type: (HumanPlayer) -> bool
+        if self.get_human_player_by_name(human_player.name) is not None or \
+                self.get_human_player_by_id(human_player.player_id) is not None:
+            return False  # names and IDs must be unique
+
+        self.__add_loaded_human_player(human_player)
+        if self.__player_store is not None:
+            self.__player_store.save_players(self, [human_player])
+
+        return True
+
+    def import_human_players(self, human_players):
+        # type: (list) -> list
+        """
+        This method adds many human players at once.
+        :param human_players: the human players to be added
+        :return: a list of the human players which were not added as their names or IDs are already taken
+        """
+        return [human_player for human_player in human_players if not self.add_human_player(human_player)]
+
+    def import_player_records(self, records):
+        # type: (list) -> list
+        """
+        This method adds human players rebuilt from saved data made by player_to_record().
+        :param records: the saved data of the human players to be added
+        :return: a list of the saved data of the human players which were not added as their names or IDs are
+        already taken
+        """
+        return [record for record in records if not self.add_human_player(player_from_record(record))]
+
+    def export_player_records(self):
+        # type: () -> list
+        return [player_to_record(human_player) for human_player in self.get_human_players()]
+
+    def get_human_players(self):
+        # type: () -> list
+        if not self.__has_loaded_all_human_players:
+            human_players: list = self.__player_store.load_players(self.__human_players_by_id)
+            for human_player in human_players:
+                if human_player.player_id not in self.__human_players_by_id:
+                    self.__add_loaded_human_player(human_player)
+
+            # Human players are kept in the order they were added rather than the order they were looked up
+            self.__human_players[:] = human_players
+            self.__has_loaded_all_human_players = True
+
+        return self.__human_players
+
+    def get_num_human_players(self):
+        # type: () -> int
+        if not self.__has_loaded_all_human_players:
+            return self.__player_store.get_num_players()
+        return len(self.__human_players)
+
+    def get_human_player_by_name(self, name):
+        # type: (str) -> HumanPlayer or None
+        human_player: HumanPlayer or None = self.__human_players_by_name.get(name)
+        if human_player is None and not self.__has_loaded_all_human_players:
+            human_player = self.__player_store.load_player_by_name(name)
+            if human_player is not None:
+                self.__add_loaded_human_player(human_player)
+
+        return human_player
+
+    def get_human_player_by_id(self, player_id):
+        # type: (str) -> HumanPlayer or None
+        human_player: HumanPlayer or None = self.__human_players_by_id.get(player_id)
+        if human_player is None and not self.__has_loaded_all_human_players:
+            human_player = self.__player_store.load_player_by_id(player_id)
+            if human_player is not None:
+                self.__add_loaded_human_player(human_player)
+
+        return human_player
+
+    def get_loaded_human_players(self):
+        # type: () -> list
+        return self.__human_players
+
+    def get_leaderboard(self, order="WINS"):
+        # type: (str) -> Leaderboard
+        """
+        This method gets the leaderboard of the human players in the given order. The leaderboard is built the first
+        time it is asked for and kept up to date by update_leaderboards() afterwards.
+        :param order: either 'WINS', 'WIN RATE', or 'RANK'
+        :return: the leaderboard
+        """
+        if order not in self.__leaderboards:
+            self.__leaderboards[order] = Leaderboard(self.get_human_players(), order)
+        return self.__leaderboards[order]
+
+    def update_leaderboards(self, players):
+        # type: (list) -> None
+        for player in players:
+            if self.__human_players_by_id.get(player.player_id) is player:
+                for leaderboard in self.__leaderboards.values():
+                    leaderboard.update_player(player)
+
+    def get_human_player_by_index(self, index):
+        # type: (int) -> HumanPlayer or None
+        human_players: list = self.get_human_players()
+        if index < 0 or index >= len(human_players):
+            return None
+        return human_players[index]
+
+    def clone(self):
+        # type: () -> Game
+        return copy.deepcopy(self)
+
+
+class SaveJournal:
+    """
+    This class contains attributes of an append-only journal kept next to saved game data. Whenever players change,
+    only what changed is appended to the journal, and the journal is periodically compacted into the saved game
+    data. Loading replays the journal on top of the saved game data, so no more than the last change is lost if the
+    game stops unexpectedly. Compaction can be left to an autosave worker so that the game does not wait for the
+    saved game data to be written.
+    """
+
+    JOURNAL_FILE_SUFFIX: str = " JOURNAL"
+    COMPACTING_JOURNAL_FILE_SUFFIX: str = " COMPACTING"
+    DEFAULT_COMPACTION_THRESHOLD: int = 200
+
+    def __init__(self, file_name, compaction_threshold=DEFAULT_COMPACTION_THRESHOLD, compact_in_background=False):
+        # type: (str, int, bool) -> None
+        self.file_name: str = file_name
+        self.journal_file_name: str = file_name + self.JOURNAL_FILE_SUFFIX
+        self.compacting_journal_file_name: str = self.journal_file_name + self.COMPACTING_JOURNAL_FILE_SUFFIX
+        self.compaction_threshold: int = compaction_threshold
+        self.compact_in_background: bool = compact_in_background
+        self.__saved_records: dict = {}  # initial value
+        self.__num_entries: int = 0  # initial value
+        self.__autosave_worker: AutosaveWorker or None = None  # initial value
+
+    def get_num_entries(self):
+        # type: () -> int
+        return self.__num_entries
+
+    def load(self):
+        # type: () -> Game
+        """
+        This method loads the saved game data and replays the journal on top of it.
+        :return: the loaded game data, or game data without any players if nothing has been saved yet
+        """
+        records: dict = {}  # initial value
+        if os.path.exists(self.file_name):
+            if is_pickled_game_data(self.file_name):
+                records = {human_player.player_id: player_to_record(human_player)
+                           for human_player in load_game_data(self.file_name).get_human_players()}
+            else:
+                records = {record["player_id"]: record for record in load_player_records(self.file_name)}
+
+        self.__num_entries = 0
+        # A journal which was being compacted when the game stopped holds older changes than the current journal
+        for journal_file_name in (self.compacting_journal_file_name, self.journal_file_name):
+            if os.path.exists(journal_file_name):
+                with open(journal_file_name, "r", encoding="utf-8") as file:
+                    for line in file:
+                        try:
+                            delta: dict = json.loads(line)
+                        except json.JSONDecodeError:
+                            break  # the game stopped while this entry was being written
+
+                        apply_record_delta(records, delta)
+                        self.__num_entries += 1
+
+        self.__saved_records = records
+        if self.compact_in_background and self.__autosave_worker is None:
+            self.__autosave_worker = AutosaveWorker(self.file_name, list(records.values()))
+
+        return Game([player_from_record(record) for record in records.values()])
+
+    def save_players(self, game, players):
+        # type: (Game, list) -> int
+        """
+        This method appends the changes to the given players since they were last saved to the journal, and compacts
+        the journal if it has grown too long.
+        :param game: the game data the players are in
+        :param players: the players which may have changed (players which are not human players are ignored)
+        :return: the number of players which had changed
+        """
+        lines: list = []  # initial value
+        for player in players:
+            if isinstance(player, HumanPlayer):
+                record: dict = player_to_record(player)
+                delta: dict = get_record_delta(self.__saved_records.get(player.player_id), record)
+                if len(delta) > 1:
+                    lines.append(json.dumps(delta, separators=(",", ":")) + "\n")
+                    self.__saved_records[player.player_id] = record
+                    if self.__autosave_worker is not None:
+                        self.__autosave_worker.update_records([record])
+
+        if len(lines) > 0:
+            with open(self.journal_file_name, "a", encoding="utf-8") as file:
+                file.writelines(lines)
+                file.flush()
+                os.fsync(file.fileno())
+
+            self.__num_entries += len(lines)
+            if self.__num_entries >= self.compaction_threshold:
+                self.compact(game)
+
+        return len(lines)
+
+    def compact(self, game):
+        # type: (Game) -> None
+        """
+        This method saves the whole game data and empties the journal. Journal entries hold new values rather than
+        differences, so replaying them again after the game stops between the two steps does no harm. When compacting
+        in the background, the journal is set aside for the autosave worker to remove once the saved game data has
+        been written, and the game data is saved as it was when the players in it were last journaled.
+        :param game: the game data to be saved
+        :return: None
+        """
+        if self.__autosave_worker is None:
+            save_game_data(game, self.file_name)
+            self.__saved_records = {human_player.player_id: player_to_record(human_player)
+                                    for human_player in game.get_human_players()}
+            open(self.journal_file_name, "w").close()
+            self.__num_entries = 0
+        elif not os.path.exists(self.compacting_journal_file_name):
+            if os.path.exists(self.journal_file_name):
+                os.replace(self.journal_file_name, self.compacting_journal_file_name)
+                fsync_directory(self.compacting_journal_file_name)
+
+            self.__num_entries = 0
+            self.__autosave_worker.request_save([self.compacting_journal_file_name])
+        # Otherwise, the previous compaction is still being written, and the journal keeps growing until it is done
+
+    def close(self):
+        # type: () -> None
+        """
+        This method waits for the autosave worker to finish writing and stops it.
+        :return: None
+        """
+        if self.__autosave_worker is not None:
+            self.__autosave_worker.stop()
+            self.__autosave_worker = None
+
+
+class AutosaveWorker:
+    """
+    This class contains attributes of a background thread saving game data, so that the game does not wait for the
+    saved game data to be written. The worker keeps its own copy of the saved data of every human player, which is
+    updated with the saved data of players as they change, so saves are consistent however the players change while
+    a save is being written. Saves requested while a save is being written are combined into one save.
+    """
+
+    def __init__(self, file_name, records=(), interval=None):
+        # type: (str, list or tuple, float or None) -> None
+        self.file_name: str = file_name
+        self.interval: float or None = interval
+        self.__records: dict = {record["player_id"]: record for record in records}
+        self.__pending_records: dict = {}  # initial value
+        self.__files_to_remove: list = []  # initial value
+        self.__is_save_requested: bool = False  # initial value
+        self.__is_stopping: bool = False  # initial value
+        self.__num_requests: int = 0  # initial value
+        self.__num_requests_saved: int = 0  # initial value
+        self.__num_saves: int = 0  # initial value
+        self.__condition: threading.Condition = threading.Condition()
+        self.__thread: threading.Thread = threading.Thread(target=self.__run, name="Autosave", daemon=True)
+        self.__thread.start()
+
+    def get_num_saves(self):
+        # type: () -> int
+        return self.__num_saves
+
+    def update_records(self, records):
+        # type: (list) -> None
+        with self.__condition:
+            for record in records:
+                self.__pending_records[record["player_id"]] = record
+
+    def request_save(self, files_to_remove=()):
+        # type: (list or tuple) -> None
+        """
+        This method asks for the game data to be saved without waiting for it to be saved.
+        :param files_to_remove: files to be removed once the game data has been saved
+        :return: None
+        """
+        with self.__condition:
+            self.__files_to_remove += files_to_remove
+            self.__is_save_requested = True
+            self.__num_requests += 1
+            self.__condition.notify_all()
+
+    def wait(self):
+        # type: () -> None
+        with self.__condition:
+            num_requests: int = self.__num_requests
+            self.__condition.wait_for(lambda: self.__num_requests_saved >= num_requests or
+                                      not self.__thread.is_alive())
+
+    def stop(self):
+        # type: () -> None
+        """
+        This method saves any changes which have not been saved yet and stops the worker.
+        :return: None
+        """
+        with self.__condition:
+            if len(self.__pending_records) > 0:
+                self.__is_save_requested = True
+                self.__num_requests += 1
+
+            self.__is_stopping = True
+            self.__condition.notify_all()
+
+        self.__thread.join()
+
+    def __run(self):
+        # type: () -> None
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__is_save_requested or self.__is_stopping, self.interval)
+                if not self.__is_save_requested and (self.__is_stopping or len(self.__pending_records) == 0):
+                    if self.__is_stopping:
+                        return
+                    continue
+
+                pending_records: dict = self.__pending_records
+                files_to_remove: list = self.__files_to_remove
+                num_requests: int = self.__num_requests
+                self.__pending_records = {}
+                self.__files_to_remove = []
+                self.__is_save_requested = False
+
+            self.__records.update(pending_records)
+            save_player_records(list(self.__records.values()), self.file_name)
+            for file_name in files_to_remove:
+                if os.path.exists(file_name):
+                    os.remove(file_name)
+
+            with self.__condition:
+                self.__num_saves += 1
+                self.__num_requests_saved = num_requests
+                self.__condition.notify_all()
+
+
+class SQLitePlayerStore:
+    """
+    This class contains attributes of a store of human players in a local SQLite database. Players, heroes, skills,
+    and applied upgrades are kept in indexed tables, so that a single human player can be loaded without loading the
+    others and the game starts just as fast however many human players have been saved. When the database is
+    created, the human players in the game data saved in a file (with its journal) are imported into it.
+    """
+
+    SCHEMA_VERSION: int = 1
+    PLAYER_COLUMNS: tuple = ("player_id", "name", "level", "exp", "required_exp", "global_coins", "rank", "wins",
+                             "loses")
+    HERO_COLUMNS: tuple = ("player_id", "name") + HERO_STAT_NAMES + HERO_HEAL_RATE_NAMES + ("max_steps",)
+    SKILL_COLUMNS: tuple = ("player_id", "position", "name", "description") + SKILL_FIELD_NAMES
+    UPGRADE_COLUMNS: tuple = ("player_id", "position", "name", "purchase_global_coin_cost") + UPGRADE_FIELD_NAMES
+
+    def __init__(self, file_name, import_file_name=None):
+        # type: (str, str or None) -> None
+        self.file_name: str = file_name
+        self.__connection: sqlite3.Connection = sqlite3.connect(file_name)
+        is_new: bool = self.__connection.execute("PRAGMA user_version").fetchone()[0] == 0
+        with self.__connection:
+            # Stats are stored in columns without a type so that they keep whatever type they were saved with
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS players (player_id TEXT PRIMARY KEY, "
+                                      "name TEXT NOT NULL UNIQUE, level INTEGER, exp REAL, required_exp REAL, "
+                                      "global_coins REAL, rank TEXT, wins INTEGER, loses INTEGER)")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS heroes (player_id TEXT PRIMARY KEY REFERENCES "
+                                      "players (player_id), name TEXT, " +
+                                      ", ".join(HERO_STAT_NAMES + HERO_HEAL_RATE_NAMES) + ", max_steps INTEGER)")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS skills (player_id TEXT REFERENCES players "
+                                      "(player_id), position INTEGER, name TEXT, description TEXT, " +
+                                      ", ".join(SKILL_FIELD_NAMES) + ", PRIMARY KEY (player_id, position))")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS upgrades (player_id TEXT REFERENCES players "
+                                      "(player_id), position INTEGER, name TEXT, purchase_global_coin_cost REAL, " +
+                                      ", ".join(UPGRADE_FIELD_NAMES) + ", PRIMARY KEY (player_id, position))")
+
+        # The schema version is only set once the import has finished, so an interrupted import is done again
+        if is_new and import_file_name is not None and os.path.exists(import_file_name):
+            imported_game: Game = SaveJournal(import_file_name).load()
+            self.save_players(imported_game, imported_game.get_human_players())
+
+        with self.__connection:
+            self.__connection.execute("PRAGMA user_version = " + str(self.SCHEMA_VERSION))
+
+    @staticmethod
+    def __get_insert_statement(table_name, columns, update_on_conflict=False):
+        # type: (str, tuple, bool) -> str
+        statement: str = "INSERT INTO " + table_name + " (" + ", ".join(columns) + ") VALUES (" + \
+            ", ".join("?" * len(columns)) + ")"
+        if update_on_conflict:
+            # Existing rows are updated in place so that human players stay in the order they were added
+            statement += " ON CONFLICT (" + columns[0] + ") DO UPDATE SET " + \
+                ", ".join(column + " = excluded." + column for column in columns[1:])
+
+        return statement
+
+    def close(self):
+        # type: () -> None
+        self.__connection.close()
+
+    def load(self):
+        # type: () -> Game
+        return Game([], self)
+
+    def get_num_players(self):
+        # type: () -> int
+        return self.__connection.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def __load_player(self, player_row):
+        # type: (tuple or None) -> HumanPlayer or None
+        if player_row is None:
+            return None
+
+        record: dict = dict(zip(self.PLAYER_COLUMNS, player_row))
+        hero_row: tuple or None = self.__connection.execute(
+            "SELECT " + ", ".join(self.HERO_COLUMNS) + " FROM heroes WHERE player_id = ?",
+            (record["player_id"],)).fetchone()
+        if hero_row is None:
+            record["hero"] = None
+            return player_from_record(record)
+
+        num_stats: int = len(HERO_STAT_NAMES)
+        record["hero"] = {
+            "name": hero_row[1],
+            "stats": list(hero_row[2:2 + num_stats]),
+            "heal_rates": list(hero_row[2 + num_stats:-1]),
+            "max_steps": hero_row[-1],
+            "skills": [list(skill_row) for skill_row in self.__connection.execute(
+                "SELECT " + ", ".join(self.SKILL_COLUMNS[2:]) + " FROM skills WHERE player_id = ? ORDER BY position",
+                (record["player_id"],))],
+            "upgrades": [list(upgrade_row) for upgrade_row in self.__connection.execute(
+                "SELECT " + ", ".join(self.UPGRADE_COLUMNS[2:]) + " FROM upgrades WHERE player_id = ? "
+                "ORDER BY position", (record["player_id"],))]
+        }
+        return player_from_record(record)
+
+    def load_player_by_name(self, name):
+        # type: (str) -> HumanPlayer or None
+        return self.__load_player(self.__connection.execute(
+            "SELECT " + ", ".join(self.PLAYER_COLUMNS) + " FROM players WHERE name = ?", (name,)).fetchone())
+
+    def load_player_by_id(self, player_id):
+        # type: (str) -> HumanPlayer or None
+        return self.__load_player(self.__connection.execute(
+            "SELECT " + ", ".join(self.PLAYER_COLUMNS) + " FROM players WHERE player_id = ?", (player_id,)).fetchone())
+
+    def load_players(self, loaded_players_by_id=None):
+        # type: (dict or None) -> list
+        """
+        This method loads every human player in this store in the order they were added.
+        :param loaded_players_by_id: a dictionary mapping IDs to human players which have already been loaded and
+        are not loaded again
+        :return: a list of the human players
+        """
+        loaded_players_by_id = loaded_players_by_id if loaded_players_by_id is not None else {}
+        return [loaded_players_by_id[player_row[0]] if player_row[0] in loaded_players_by_id
+                else self.__load_player(player_row) for player_row in self.__connection.execute(
+                    "SELECT " + ", ".join(self.PLAYER_COLUMNS) + " FROM players ORDER BY rowid").fetchall()]
+
+    def save_players(self, game, players):
+        # type: (Game, list) -> int
+        """
+        This method writes the given players to this store in a single transaction.
+        :param game: the game data the players are in
+        :param players: the players to be saved (players which are not human players are ignored)
+        :return: the number of players saved
+        """
+        player_rows: list = []  # initial value
+        hero_rows: list = []  # initial value
+        skill_rows: list = []  # initial value
+        upgrade_rows: list = []  # initial value
+        for player in players:
+            if isinstance(player, HumanPlayer):
+                record: dict = player_to_record(player)
+                player_rows.append(tuple(record[column] for column in self.PLAYER_COLUMNS))
+                hero_record: dict or None = record["hero"]
+                if hero_record is not None:
+                    hero_rows.append((player.player_id, hero_record["name"], *hero_record["stats"],
+                                      *hero_record["heal_rates"], hero_record["max_steps"]))
+                    skill_rows += [(player.player_id, position, *skill)
+                                   for position, skill in enumerate(hero_record["skills"])]
+                    upgrade_rows += [(player.player_id, position, *upgrade)
+                                     for position, upgrade in enumerate(hero_record["upgrades"])]
+
+        with self.__connection:
+            player_ids: list = [(player_row[0],) for player_row in player_rows]
+            for table_name in ("heroes", "skills", "upgrades"):
+                self.__connection.executemany("DELETE FROM " + table_name + " WHERE player_id = ?", player_ids)
+
+            self.__connection.executemany(self.__get_insert_statement("players", self.PLAYER_COLUMNS, True),
+                                          player_rows)
+            self.__connection.executemany(self.__get_insert_statement("heroes", self.HERO_COLUMNS), hero_rows)
+            self.__connection.executemany(self.__get_insert_statement("skills", self.SKILL_COLUMNS), skill_rows)
+            self.__connection.executemany(self.__get_insert_statement("upgrades", self.UPGRADE_COLUMNS),
+                                          upgrade_rows)
+
+        return len(player_rows)
+
+    def compact(self, game):
+        # type: (Game) -> None
+        """
+        This method saves every human player loaded from or added to the game data. Changes are written to the
+        database as they happen, so there is no journal to empty.
+        :param game: the game data to be saved
+        :return: None
+        """
+        self.save_players(game, game.get_loaded_human_players())
+
+
+# Creating classes used to run battles without any console input and output
+
+
+class BattleRandom:
+    """
+    This class contains attributes of the random number generators owned by a battle. Each purpose (generating
+    teams, spawning, critical hits, and CPU decisions) draws from its own substream derived from the seed of the
+    battle, so a battle can be replayed exactly from its seed and drawing more numbers for one purpose never
+    changes the numbers drawn for another.
+    """
+
+    PURPOSES: tuple = ("generation", "spawning", "crits", "ai")
+
+    def __init__(self, seed=None):
+        # type: (int or None) -> None
+        # Without a seed, the seed is drawn from the module level random number generator so that seeding it still
+        # makes battles reproducible
+        self.seed: int = seed if seed is not None else random.getrandbits(64)
+        self.generation: random.Random = self.substream("generation")
+        self.spawning: random.Random = self.substream("spawning")
+        self.crits: random.Random = self.substream("crits")
+        self.ai: random.Random = self.substream("ai")
+
+    def substream(self, purpose):
+        # type: (str) -> random.Random
+        return random.Random(str(self.seed) + ":" + purpose)
+
+    def get_state(self):
+        # type: () -> tuple
+        return tuple(getattr(self, purpose).getstate() for purpose in self.PURPOSES)
+
+    def set_state(self, state):
+        # type: (tuple) -> None
+        for purpose, purpose_state in zip(self.PURPOSES, state):
+            getattr(self, purpose).setstate(purpose_state)
+
+
+class BattleController:
+    """
+    This class contains attributes of a controller deciding what a game character does during its turn in a battle.
+    By default, the decisions are made randomly the same way CPU controlled players make them.
+    """
+
+    def choose_rune_to_buy(self, engine, hero):
+        # type: (BattleEngine, Hero) -> Rune or None
+        runes_sold: list = engine.battlefield_shop.get_runes_sold()
+        if len(runes_sold) > 0 and engine.battle_random.ai.random() <= 0.75:
+            return runes_sold[engine.battle_random.ai.randint(0, len(runes_sold) - 1)]
+        return None
+
+    def choose_destination(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        return game_character.choose_random_destination(engine.battlefield, engine.battle_random.ai)
+
+    def choose_attack(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        """
+        This method chooses what the game character attacks after moving.
+        :param engine: the battle engine running the battle
+        :param game_character: the game character having its turn
+        :return: a tuple of the target and the skill to use (or None), or None if nothing is attacked
+        """
+        battlefield: Battlefield = engine.battlefield
+        for x, y in ((game_character.x - 1, game_character.y), (game_character.x + 1, game_character.y),
+                     (game_character.x, game_character.y - 1), (game_character.x, game_character.y + 1)):
+            curr_tile: Tile or None = battlefield.get_tile_at(x, y)
+            if isinstance(curr_tile, Tile):
+                # Only the first tile next to the game character is considered
+                if engine.battle_random.ai.random() > 0.75:
+                    return None
+
+                target: Building or GameCharacter or None = curr_tile.building if curr_tile.building is not None \
+                    else curr_tile.game_character
+                if target is None:
+                    return None
+
+                return target, self.choose_skill(engine, game_character)
+
+        return None
+
+    def choose_tower_target(self, engine, battle_tower):
+        # type: (BattleEngine, BattleTower) -> GameCharacter or None
+        enemies: list = engine.battlefield.get_enemies_within(battle_tower.x, battle_tower.y, 1,
+                                                              battle_tower.corresponding_team, buildings=False)
+        return enemies[0] if len(enemies) > 0 else None
+
+    def choose_skill(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> Skill or None
+        if not isinstance(game_character, Hero):
+            return None
+
+        usable_skills: list = [skill for skill in game_character.get_skills()
+                               if skill.magic_points_cost <= game_character.curr_magic_points]
+        if len(usable_skills) > 0 and engine.battle_random.ai.random() <= 0.75:
+            return usable_skills[engine.battle_random.ai.randint(0, len(usable_skills) - 1)]
+        return None
+
+
+class ConsoleController(BattleController):
+    """
+    This class contains attributes of a controller asking the user on the console what a hero controlled by a human
+    player does during its turn in a battle.
+    """
+
+    def choose_rune_to_buy(self, engine, hero):
+        # type: (BattleEngine, Hero) -> Rune or None
+        runes_sold: list = engine.battlefield_shop.get_runes_sold()
+        print("Below is a list of runes sold in the battlefield shop:\n")
+        for rune in runes_sold:
+            print(str(rune) + "\n")
+
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        buy_ask: str = input("Do you want to buy a rune? ")
+        if buy_ask != "Y":
+            return None
+
+        rune_index: int = int(input("Please enter the index of the rune you want to buy: "))
+        while rune_index < 0 or rune_index >= len(runes_sold):
+            rune_index = int(input("Sorry, invalid input! Please enter the index of the rune you want to buy: "))
+
+        to_buy: Rune = runes_sold[rune_index]
+        if hero.controlling_player.battle_coins < to_buy.purchase_battle_coin_cost:
+            print("Sorry, insufficient battle coins!")
+            return None
+
+        print("You have successfully purchased " + str(to_buy.name) + ".")
+        return to_buy
+
+    def choose_destination(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        x: int = int(input("Please enter x-coordinates of the tile to move the hero to: "))
+        y: int = int(input("Please enter y-coordinates of the tile to move the hero to: "))
+        while not game_character.can_move(x, y, engine.battlefield):
+            print("Invalid move! Please try again!")
+            x = int(input("Please enter x-coordinates of the tile to move the hero to: "))
+            y = int(input("Please enter y-coordinates of the tile to move the hero to: "))
+
+        return x, y
+
+    def choose_attack(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        for x, y in ((game_character.x - 1, game_character.y), (game_character.x + 1, game_character.y),
+                     (game_character.x, game_character.y - 1), (game_character.x, game_character.y + 1)):
+            curr_tile: Tile or None = engine.battlefield.get_tile_at(x, y)
+            if isinstance(curr_tile, Tile):
+                # Only the first tile next to the hero is considered, like for CPU controlled players
+                target: Building or GameCharacter or None = curr_tile.building if curr_tile.building is not None \
+                    else curr_tile.game_character
+                if target is None:
+                    return None
+
+                print("Enter 'Y' for yes.")
+                print("Enter anything else for no.")
+                attack_ask: str = input("Do you want to attack the game character or building at (" + str(x) + ", " +
+                                        str(y) + ")? ")
+                if attack_ask != "Y":
+                    return None
+
+                return target, self.choose_skill(engine, game_character)
+
+        return None
+
+    def choose_skill(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> Skill or None
+        if not isinstance(game_character, Hero):
+            return None
+
+        skills: list = game_character.get_skills()
+        if all(skill.magic_points_cost > game_character.curr_magic_points for skill in skills):
+            return None
+
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        use_skill_ask: str = input("Do you want to use a skill? ")
+        if use_skill_ask != "Y":
+            return None
+
+        print("Below is a list of skills the hero has:\n")
+        for skill in skills:
+            print(str(skill) + "\n")
+
+        skill_index: int = int(input("Please enter index of skill to use: "))
+        while skill_index < 0 or skill_index >= len(skills) or \
+                skills[skill_index].magic_points_cost > game_character.curr_magic_points:
+            skill_index = int(input("Sorry, invalid input! Please enter index of skill to use: "))
+
+        return skills[skill_index]
+
+
+class ExpectedDamageCache:
+    """
+    This class contains attributes of a cache of the expected damage, the damage of critical hits, and the chance of
+    critical hits of attacks with each skill, keyed by the stat signatures of the attacker and the target. The
+    signature of a unit is worked out once for each of its stats versions. Every change to the stats of a unit (runes,
+    upgrades, skills, and battle levels) gives it a new stats version, so entries are never stale, and units with the
+    same stats (e.g. villagers and towers of the same battle level) share them. Entries are dropped oldest first once
+    the cache is full.
+    """
+
+    def __init__(self, max_entries=1 << 16):
+        # type: (int) -> None
+        self.max_entries: int = max_entries
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+        self.__entries: dict = {}  # initial value
+        self.__signatures: dict = {}  # initial value
+        self.__signature_ids: dict = {}  # initial value
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.__entries)
+
+    def clear(self):
+        # type: () -> None
+        self.__entries.clear()
+        self.__signatures.clear()
+        self.__signature_ids.clear()
+
+    def get_hit_rate(self):
+        # type: () -> float
+        num_lookups: int = self.num_hits + self.num_misses
+        return self.num_hits / num_lookups if num_lookups > 0 else 0.0
+
+    def get_signature(self, unit):
+        # type: (Building or GameCharacter) -> tuple
+        """
+        This method finds the stat signatures of a unit, which are the same for units whose attacks deal the same
+        damage, and for units which take the same damage from attacks.
+        :param unit: a game character or building
+        :return: a tuple of the ids of the signatures of the unit as an attacker and as a target
+        """
+        signature: tuple or None = self.__signatures.get(unit.stats_version)
+        if signature is None:
+            skills: list = unit.get_skills() if isinstance(unit, Hero) else []
+            attacker_signature: tuple = (isinstance(unit, Hero), getattr(unit, "attack_power", 0), unit.max_hp,
+                                         getattr(unit, "max_magic_points", 0), unit.defense,
+                                         getattr(unit, "crit_rate", 0), getattr(unit, "crit_damage", 0)) + \
+                tuple((skill.damage_multiplier_to_max_hp, skill.damage_multiplier_to_max_magic_points,
+                       skill.damage_multiplier_to_attack_power, skill.damage_multiplier_to_defense)
+                      for skill in skills)
+            target_signature: tuple = (unit.defense, unit.crit_resistance)
+            signature = (self.__signature_ids.setdefault(attacker_signature, len(self.__signature_ids)),
+                         self.__signature_ids.setdefault(target_signature, len(self.__signature_ids)))
+            if len(self.__signatures) >= self.max_entries:
+                del self.__signatures[next(iter(self.__signatures))]
+
+            self.__signatures[unit.stats_version] = signature
+
+        return signature
+
+    def get_damages(self, attackers, targets):
+        # type: (list, list) -> tuple
+        """
+        This method looks up the damage of every attack of some attackers on some targets. The attacks which are not
+        cached yet are computed in at most two vectorized calls to compute_expected_damages().
+        :param attackers: game characters or battle towers attacking
+        :param targets: game characters or buildings being attacked
+        :return: a tuple of the expected damage, the damage of critical hits, and the chance of critical hits, all
+        indexed by attacker, skill (0 for basic attacks and i + 1 for the i-th skill), and target, and whether each
+        attacker can use each skill
+        """
+        if len(self.__signature_ids) >= self.max_entries:
+            # Signatures are never dropped one by one, since entries refer to them
+            self.clear()
+
+        is_usable: np.ndarray = get_usable_skills(attackers)
+        num_skills: int = is_usable.shape[1]
+        attacker_ids: list = [self.get_signature(attacker)[0] for attacker in attackers]
+        target_ids: list = [self.get_signature(target)[1] for target in targets]
+        entries: dict = self.__entries
+        damages: list = []  # initial value
+        missing_target_indices: dict = {}  # initial value
+        for attacker_index, attacker_id in enumerate(attacker_ids):
+            attacker_damages: list = []  # initial value
+            for target_index, target_id in enumerate(target_ids):
+                entry: tuple or None = entries.get((attacker_id, target_id))
+                if entry is None:
+                    missing_target_indices.setdefault(attacker_index, []).append(target_index)
+                attacker_damages.append(entry)
+
+            damages.append(attacker_damages)
+
+        num_misses: int = sum(len(target_indices) for target_indices in missing_target_indices.values())
+        self.num_misses += num_misses
+        self.num_hits += len(attackers) * len(targets) - num_misses
+        # Attackers whose stats changed miss every target and are computed against all of them, while the remaining
+        # misses (mostly targets whose stats changed) are computed together for the attackers missing them
+        new_attacker_indices: list = [attacker_index for attacker_index, target_indices in
+                                      missing_target_indices.items() if len(target_indices) == len(targets)]
+        other_attacker_indices: list = [attacker_index for attacker_index, target_indices in
+                                        missing_target_indices.items() if len(target_indices) < len(targets)]
+        self.__add_entries(attackers, targets, new_attacker_indices, list(range(len(targets))), attacker_ids,
+                           target_ids, damages)
+        self.__add_entries(attackers, targets, other_attacker_indices, sorted(set(
+            target_index for attacker_index in other_attacker_indices
+            for target_index in missing_target_indices[attacker_index])), attacker_ids, target_ids, damages)
+        padding: tuple = ((0, 0, 0.0),) * num_skills
+        expected_damages, crit_hit_damages, crit_chances = (np.array(values) for values in zip(*(
+            skill_damages for attacker_damages in damages for entry in attacker_damages
+            for skill_damages in (entry + padding)[:num_skills])))
+        shape: tuple = (len(attackers), len(targets), num_skills)
+        return tuple(values.reshape(shape).transpose(0, 2, 1) for values in
+                     (expected_damages, crit_hit_damages, crit_chances)) + (is_usable,)
+
+    def __add_entries(self, attackers, targets, attacker_indices, target_indices, attacker_ids, target_ids, damages):
+        # type: (list, list, list, list, list, list, list) -> None
+        if len(attacker_indices) == 0 or len(target_indices) == 0:
+            return
+
+        expected_damages, crit_hit_damages, crit_chances = compute_expected_damages(
+            [attackers[attacker_index] for attacker_index in attacker_indices],
+            [targets[target_index] for target_index in target_indices])
+        for i, attacker_index in enumerate(attacker_indices):
+            attacker: GameCharacter = attackers[attacker_index]
+            num_attacker_skills: int = 1 + (len(attacker.get_skills()) if isinstance(attacker, Hero) else 0)
+            for j, target_index in enumerate(target_indices):
+                entry: tuple = tuple((expected_damages[i, skill_index, j], crit_hit_damages[i, skill_index, j],
+                                      float(crit_chances[i, 0, j])) for skill_index in range(num_attacker_skills))
+                if len(self.__entries) >= self.max_entries:
+                    del self.__entries[next(iter(self.__entries))]
+
+                self.__entries[(attacker_ids[attacker_index], target_ids[target_index])] = entry
+                damages[attacker_index][target_index] = entry
+
+
+class GreedyController(BattleController):
+    """
+    This class contains attributes of a controller making CPU controlled players act greedily on a utility score.
+    At the start of each turn of a team, the expected damage of every attack (with every skill) of its heroes and
+    villagers on every enemy they can reach is computed in a single vectorized pass. The attacks are then handed out
+    from the best score down, each unit getting at most one attack and a free tile next to its target, and targets
+    which are expected to die are not attacked again. Units without any attack move toward the nearest enemy
+    building.
+
+    Scores are the fraction of the target's max HP which is expected to be dealt, worth more against buildings since
+    they decide who wins, with a bonus for likely kills. Attacks do not spend magic points, so skills cost nothing
+    once they can be afforded. The damage of attacks is looked up in an expected damage cache, since the stats of
+    most units stay the same for many turns. Float stats are simply computed again, which is faster.
+    """
+
+    KILL_BONUS: float = 1.0
+    OBJECTIVE_WEIGHT: float = 2.0
+
+    def __init__(self):
+        # type: () -> None
+        self.__planned_turn: tuple or None = None  # initial value
+        self.__plans: dict = {}  # initial value
+        self.damage_cache: ExpectedDamageCache = ExpectedDamageCache()
+
+    def choose_rune_to_buy(self, engine, hero):
+        # type: (BattleEngine, Hero) -> Rune or None
+        # The most expensive rune which can be afforded is taken to be the strongest
+        affordable_runes: list = [rune for rune in engine.battlefield_shop.get_runes_sold()
+                                  if rune.purchase_battle_coin_cost <= hero.controlling_player.battle_coins]
+        return max(affordable_runes, key=lambda rune: rune.purchase_battle_coin_cost) \
+            if len(affordable_runes) > 0 else None
+
+    def score_attacks(self, attackers, targets):
+        # type: (list, list) -> tuple
+        """
+        This method scores every attack of some attackers on some targets. Attacks are counted as kills if they are
+        expected to kill their target, or with the chance of a critical hit if only critical hits would.
+        :param attackers: game characters or battle towers attacking
+        :param targets: living game characters or buildings which may be attacked
+        :return: a tuple of the scores and the expected damage, both indexed by attacker, skill (0 for basic attacks
+        and i + 1 for the i-th skill), and target. Attacks with skills the attacker does not have or cannot afford
+        score minus infinity.
+        """
+        if isinstance(attackers[0].attack_power, float):
+            # Float stats are computed again in one vectorized pass faster than they are looked up
+            expected_damages, crit_hit_damages, crit_chances = compute_expected_damages(attackers, targets)
+            is_usable: np.ndarray = get_usable_skills(attackers)
+        else:
+            expected_damages, crit_hit_damages, crit_chances, is_usable = self.damage_cache.get_damages(attackers,
+                                                                                                         targets)
+        curr_hp: np.ndarray = np.array([target.curr_hp for target in targets])
+        max_hp: np.ndarray = np.array([target.max_hp for target in targets])
+        dealt_fractions: np.ndarray = (np.where(expected_damages < curr_hp, expected_damages, curr_hp) / max_hp) \
+            .astype(float)
+        kill_chances: np.ndarray = np.where((expected_damages >= curr_hp).astype(bool), 1.0,
+                                            np.where((crit_hit_damages >= curr_hp).astype(bool), crit_chances, 0.0))
+        weights: np.ndarray = np.array([self.OBJECTIVE_WEIGHT if isinstance(target, Building) else 1.0
+                                        for target in targets])
+        scores: np.ndarray = weights * (dealt_fractions + self.KILL_BONUS * kill_chances)
+        return np.where(is_usable[:, :, None], scores, -math.inf), expected_damages
+
+    def plan_team_turn(self, engine, team):
+        # type: (BattleEngine, Team) -> dict
+        """
+        This method chooses the destination and attack of every living hero and villager of a team for this turn.
+        :param engine: the battle engine running the battle
+        :param team: the team whose turn it is
+        :return: a dictionary mapping ids of game characters to tuples of their destination (or None to stay) and
+        their attack (a tuple of the target and the skill, or None)
+        """
+        battlefield: Battlefield = engine.battlefield
+        attackers: list = [game_character for game_character in team.battle_squad.get_heroes() +
+                           team.battle_squad.get_villagers() if game_character.get_is_alive()]
+        targets: list = [unit for unit in BattleEngine.get_units(engine.get_opposing_team(team))
+                         if unit.get_is_alive()]
+        plans: dict = {}  # initial value
+        if len(attackers) == 0:
+            return plans
+
+        claimed_tiles: set = set()
+        if len(targets) > 0:
+            scores, expected_damages = self.score_attacks(attackers, targets)
+            distances: np.ndarray = np.abs(np.array([attacker.x for attacker in attackers])[:, None] -
+                                           np.array([target.x for target in targets])) + \
+                np.abs(np.array([attacker.y for attacker in attackers])[:, None] -
+                       np.array([target.y for target in targets]))
+            max_steps: np.ndarray = np.array([0 if attacker.has_moved else attacker.max_steps
+                                              for attacker in attackers])
+            scores = np.where((distances <= max_steps[:, None] + 1)[:, None, :], scores, -math.inf)
+            remaining_hp: list = [target.curr_hp for target in targets]
+            for flat_index in np.argsort(-scores, axis=None, kind="stable"):
+                attacker_index, skill_index, target_index = np.unravel_index(flat_index, scores.shape)
+                if scores[attacker_index, skill_index, target_index] == -math.inf or len(plans) == len(attackers):
+                    break
+
+                attacker: GameCharacter = attackers[attacker_index]
+                target: Building or GameCharacter = targets[target_index]
+                if id(attacker) in plans or remaining_hp[target_index] <= 0:
+                    continue
+
+                destination: tuple or None = self.__get_attack_destination(battlefield, attacker, target,
+                                                                           claimed_tiles)
+                if destination is False:
+                    continue
+
+                claimed_tiles.add(destination)
+                remaining_hp[target_index] -= expected_damages[attacker_index, skill_index, target_index]
+                plans[id(attacker)] = (destination, (target, None if skill_index == 0 else
+                                                     attacker.get_skills()[skill_index - 1]))
+
+        for attacker in attackers:
+            if id(attacker) not in plans:
+                destination: tuple or None = self.__get_approach_destination(battlefield, attacker, claimed_tiles)
+                claimed_tiles.add(destination)
+                plans[id(attacker)] = (destination, None)
+
+        return plans
+
+    @staticmethod
+    def __get_attack_destination(battlefield, attacker, target, claimed_tiles):
+        # type: (Battlefield, GameCharacter, Building or GameCharacter, set) -> tuple or None or bool
+        if abs(attacker.x - target.x) + abs(attacker.y - target.y) == 1:
+            return None
+
+        for x, y in ((target.x - 1, target.y), (target.x + 1, target.y), (target.x, target.y - 1),
+                     (target.x, target.y + 1)):
+            if (x, y) not in claimed_tiles and attacker.can_move(x, y, battlefield):
+                return x, y
+        return False
+
+    @staticmethod
+    def __get_approach_destination(battlefield, game_character, claimed_tiles):
+        # type: (Battlefield, GameCharacter, set) -> tuple or None
+        building: Building or None = battlefield.get_nearest_enemy_building(game_character.x, game_character.y,
+                                                                            game_character.corresponding_team)
+        if building is None or game_character.has_moved:
+            return None
+
+        # Steps are taken along the x-axis first, and tiles next to the furthest tile reached are tried if it is taken
+        dx: int = building.x - game_character.x
+        dy: int = building.y - game_character.y
+        num_steps: int = min(game_character.max_steps, abs(dx) + abs(dy) - 1)
+        x_steps: int = min(abs(dx), num_steps)
+        x: int = game_character.x + (x_steps if dx > 0 else -x_steps)
+        y: int = game_character.y + (min(abs(dy), num_steps - x_steps) if dy > 0 else
+                                     -min(abs(dy), num_steps - x_steps))
+        for curr_x, curr_y in ((x, y), (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if (curr_x, curr_y) not in claimed_tiles and game_character.can_move(curr_x, curr_y, battlefield):
+                return curr_x, curr_y
+        return None
+
+    def __get_plan(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        planned_turn: tuple = (id(engine), engine.turn, id(game_character.corresponding_team))
+        if self.__planned_turn != planned_turn:
+            self.__planned_turn = planned_turn
+            self.__plans = self.plan_team_turn(engine, game_character.corresponding_team)
+        return self.__plans.get(id(game_character))
+
+    def choose_destination(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        plan: tuple or None = self.__get_plan(engine, game_character)
+        return plan[0] if plan is not None else None
+
+    def choose_attack(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        plan: tuple or None = self.__get_plan(engine, game_character)
+        if plan is not None and plan[1] is not None:
+            target, skill = plan[1]
+            if target.get_is_alive() and can_attack(game_character, target, engine.battlefield, skill) and \
+                    (skill is None or skill.magic_points_cost <= game_character.curr_magic_points):
+                return target, skill
+
+        # The planned target may have been killed by another unit, so the best adjacent target is attacked instead
+        targets: list = engine.get_attackable_targets(game_character)
+        if len(targets) == 0:
+            return None
+
+        scores: np.ndarray = self.score_attacks([game_character], targets)[0][0]
+        skill_index, target_index = np.unravel_index(np.argmax(scores), scores.shape)
+        return targets[target_index], None if skill_index == 0 else game_character.get_skills()[skill_index - 1]
+
+    def choose_tower_target(self, engine, battle_tower):
+        # type: (BattleEngine, BattleTower) -> GameCharacter or None
+        enemies: list = engine.battlefield.get_enemies_within(battle_tower.x, battle_tower.y, 1,
+                                                              battle_tower.corresponding_team, buildings=False)
+        if len(enemies) == 0:
+            return None
+        return enemies[int(np.argmax(self.score_attacks([battle_tower], enemies)[0][0, 0]))]
+
+
+CPU_POLICIES: dict = {
+    "RANDOM": BattleController,
+    "GREEDY": GreedyController
+}
+
+
+class ZobristHash:
+    """
+    This class contains attributes of a Zobrist hash of the state of a battle: where each unit is, its HP, magic
+    points and battle level, and whether it has moved or attacked. Every feature of every unit has its own random
+    64-bit key, and the key of a value of that feature is made by mixing the hash of the value into it, so HP and
+    magic points, which take countless values, need no memory for their keys. The hash is the XOR of the keys of the
+    current values. A change is hashed by XOR-ing the key of the old value out and the key of the new value in, so the
+    hash is updated in constant time and equal positions reached in different orders have equal hashes. Stats changed
+    by runes are only hashed through the HP and magic points they restore.
+    """
+
+    POSITION: int = -1  # feature index of the positions of units
+    KEY_MASK: int = (1 << 64) - 1
+    GAME_CHARACTER_FIELDS: tuple = ("curr_hp", "curr_magic_points", "battle_level", "has_moved", "has_attacked")
+    BATTLE_TOWER_FIELDS: tuple = ("curr_hp", "battle_level", "has_attacked")
+    BUILDING_FIELDS: tuple = ("curr_hp", "battle_level")
+
+    def __init__(self, units, seed=0):
+        # type: (list, int) -> None
+        self.__random: random.Random = random.Random(seed)
+        self.units: list = list(units)
+        self.turn_key: int = self.__random.getrandbits(64)
+        # The last key of each unit is the key of its position
+        self.feature_keys: list = [[self.__random.getrandbits(64) for i in range(len(self.__get_fields(unit)) + 1)]
+                                   for unit in self.units]
+        self.value: int = 0  # initial value
+        self.__unit_indices: dict = {}  # initial value
+        self.__state_getters: list = []  # initial value
+        self.__unit_states: list = [()] * len(self.units)
+        self.__index_units()
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Units are indexed by their ids, which change when the hash is copied to another process
+        return {name: value for name, value in vars(self).items() if name not in (
+            "_ZobristHash__unit_indices", "_ZobristHash__state_getters")}
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        vars(self).update(state)
+        self.__index_units()
+
+    def __index_units(self):
+        # type: () -> None
+        self.__unit_indices = {id(unit): index for index, unit in enumerate(self.units)}
+        self.__state_getters = [attrgetter(*self.__get_fields(unit)) for unit in self.units]
+
+    def __get_fields(self, unit):
+        # type: (Building or GameCharacter) -> tuple
+        return self.GAME_CHARACTER_FIELDS if isinstance(unit, GameCharacter) else self.BATTLE_TOWER_FIELDS \
+            if isinstance(unit, BattleTower) else self.BUILDING_FIELDS
+
+    def get_key(self, unit_index, feature_index, value):
+        # type: (int, int, object) -> int
+        """
+        This method gets the key of a value of a feature of a unit by mixing the hash of the value into the random key
+        of the feature with the finalizer of SplitMix64, so that values with nearby hashes get unrelated keys.
+        :param unit_index: index of the unit
+        :param feature_index: index of the feature in the fields of the unit, or POSITION for its position
+        :param value: value of the feature
+        :return: the key
+        """
+        key: int = (self.feature_keys[unit_index][feature_index] ^ hash(value)) & self.KEY_MASK
+        key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & self.KEY_MASK
+        key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & self.KEY_MASK
+        return key ^ (key >> 31)
+
+    def toggle_position(self, unit, x, y):
+        # type: (Building or GameCharacter, int, int) -> None
+        index: int or None = self.__unit_indices.get(id(unit))
+        if index is not None:
+            self.value ^= self.get_key(index, self.POSITION, (x, y))
+
+    def update_unit(self, unit):
+        # type: (Building or GameCharacter) -> None
+        index: int or None = self.__unit_indices.get(id(unit))
+        if index is None:
+            return
+
+        old_state: tuple = self.__unit_states[index]
+        new_state: tuple = self.__state_getters[index](unit)
+        if new_state != old_state:
+            for feature_index, (old_value, new_value) in enumerate(zip(old_state, new_state)):
+                if old_value != new_value:
+                    self.value ^= self.get_key(index, feature_index, old_value) ^ \
+                        self.get_key(index, feature_index, new_value)
+
+            self.__unit_states[index] = new_state
+
+    def recompute(self, battlefield):
+        # type: (Battlefield) -> int
+        """
+        This method computes the hash from scratch, e.g. when hashing is enabled in the middle of a battle.
+        :param battlefield: the battlefield the battle takes place in
+        :return: the hash
+        """
+        self.value = 0
+        tiles: list = battlefield.get_tiles()
+        for index, unit in enumerate(self.units):
+            curr_tile: Tile = tiles[unit.y][unit.x]
+            if curr_tile.game_character is unit or curr_tile.building is unit:
+                self.toggle_position(unit, unit.x, unit.y)
+
+            self.__unit_states[index] = self.__state_getters[index](unit)
+            for feature_index, value in enumerate(self.__unit_states[index]):
+                self.value ^= self.get_key(index, feature_index, value)
+
+        return self.value
+
+    def save(self):
+        # type: () -> tuple
+        """
+        This method saves the hash and the hashed values of the units, e.g. in a battle snapshot.
+        :return: a tuple of the hash and the hashed values of each unit
+        """
+        return self.value, tuple(self.__unit_states)
+
+    def load(self, state):
+        # type: (tuple) -> None
+        """
+        This method sets the hash back to what it was when it was saved, without hashing anything again.
+        :param state: a tuple made by save()
+        :return: None
+        """
+        self.value = state[0]
+        self.__unit_states[:] = state[1]
+
+    def get_value(self, turn):
+        # type: (int) -> int
+        return self.value ^ self.turn_key if turn % 2 == 1 else self.value
+
+
+class TranspositionTable:
+    """
+    This class contains attributes of a table of the results of playouts from positions a search has reached, keyed
+    by the Zobrist hashes of the positions. The table has a fixed number of slots chosen by the lowest bits of the
+    hash. When another position needs a taken slot, the position in it is only replaced if it was stored by an
+    earlier search or has fewer playouts, so the most searched positions of the current search stay in the table.
+    """
+
+    def __init__(self, size_bits=16):
+        # type: (int) -> None
+        self.__slots: list = [None] * (1 << size_bits)
+        self.__mask: int = (1 << size_bits) - 1
+        self.generation: int = 0  # initial value
+        self.num_lookups: int = 0  # initial value
+        self.num_hits: int = 0  # initial value
+
+    def __len__(self):
+        # type: () -> int
+        return sum(1 for entry in self.__slots if entry is not None)
+
+    def new_search(self):
+        # type: () -> None
+        self.generation += 1
+
+    def get(self, key):
+        # type: (int) -> list or None
+        """
+        This method looks up the results of the playouts from a position.
+        :param key: the Zobrist hash of the position
+        :return: a list of the key, the number of playouts, the sum of their values, and the generation of the search
+        which stored it, or None if the position is not in the table
+        """
+        self.num_lookups += 1
+        entry: list or None = self.__slots[key & self.__mask]
+        if entry is None or entry[0] != key:
+            return None
+
+        self.num_hits += 1
+        return entry
+
+    def add(self, key, value):
+        # type: (int, float) -> bool
+        """
+        This method adds the result of a playout from a position to the table.
+        :param key: the Zobrist hash of the position
+        :param value: the value of the playout
+        :return: whether the result has been stored
+        """
+        slot: int = key & self.__mask
+        entry: list or None = self.__slots[slot]
+        if entry is not None and entry[0] == key:
+            entry[1] += 1
+            entry[2] += value
+            entry[3] = self.generation
+            return True
+
+        if entry is None or entry[3] < self.generation or entry[1] <= 1:
+            self.__slots[slot] = [key, 1, value, self.generation]
+            return True
+        return False
+
+    def get_hit_rate(self):
+        # type: () -> float
+        return self.num_hits / self.num_lookups if self.num_lookups > 0 else 0.0
+
+
+class MCTSNode:
+    """
+    This class contains attributes of a node in the search tree of a Monte Carlo tree search. Each node is reached
+    by taking an action (a destination or an attack) from its parent and keeps the results of the playouts run
+    through it.
+    """
+
+    def __init__(self, action=None):
+        # type: (tuple or None) -> None
+        self.action: tuple or None = action
+        self.visits: int = 0  # initial value
+        self.total_value: float = 0.0  # initial value
+        self.children: list = []  # initial value
+        self.untried_actions: list or None = None  # initial value
+
+    def get_mean_value(self):
+        # type: () -> float
+        return self.total_value / self.visits if self.visits > 0 else 0.0
+
+    def get_ucb_score(self, parent_visits, exploration):
+        # type: (int, float) -> float
+        return self.get_mean_value() + exploration * math.sqrt(math.log(parent_visits) / self.visits)
+
+    def get_most_visited_child(self):
+        # type: () -> MCTSNode or None
+        return max(self.children, key=lambda child: child.visits) if len(self.children) > 0 else None
+
+    def merge(self, other):
+        # type: (MCTSNode) -> None
+        """
+        This method adds the results of another search of the same position to this node and its descendants.
+        :param other: the root of the other search tree
+        :return: None
+        """
+        self.visits += other.visits
+        self.total_value += other.total_value
+        children: dict = {child.action: child for child in self.children}
+        for other_child in other.children:
+            if other_child.action in children:
+                children[other_child.action].merge(other_child)
+            else:
+                self.children.append(other_child)
+
+
+class MCTSController(BattleController):
+    """
+    This class contains attributes of a controller making CPU controlled players choose where their game characters
+    move, what they attack and which skills they use with a Monte Carlo tree search. The tree has a level for the
+    destination and a level for the attack. Each playout takes the chosen actions in place in the order the battle
+    engine runs its stages, so a hero searched in the move stage only attacks after the rest of its team has moved
+    and the heroes before it have attacked. It then finishes the turn and plays a few more turns with random
+    decisions, evaluates the battle, and undoes everything with a snapshot.
+
+    With more than one worker, each turn is searched at the same time in this process and in worker processes, each
+    searching its own copy of the battle with its own random number generators, and the visits of the destinations
+    and attacks of all the searches are added up before choosing. Worker processes are given a copy of the battle
+    when they start, and each search only sends them a snapshot of the battle to restore their copy to. Workers only
+    add playouts when there are idle CPU cores for them; with fewer cores than workers, the searches share the cores
+    and each turn gets fewer playouts than with one process.
+
+    The results of playouts are also kept in a transposition table keyed by the Zobrist hash of the position reached
+    by the searched actions. Once a position has been played out often enough, in this search or an earlier one, its
+    mean value is reused instead of playing it out again.
+    """
+
+    EXPLORATION: float = math.sqrt(2)
+
+    def __init__(self, time_budget=0.05, max_playouts=None, playout_turns=4, max_destinations=24,
+                 num_random_destinations=4, num_workers=1, transposition_table_bits=16, reuse_visits=16):
+        # type: (float, int or None, int, int, int, int, int or None, int) -> None
+        """
+        :param time_budget: wall-clock seconds spent searching for each game character's turn
+        :param max_playouts: maximum number of playouts for each turn, or None to search until the time runs out
+        :param playout_turns: number of turns played after finishing the current turn in each playout
+        :param max_destinations: maximum number of tiles next to enemies considered as destinations
+        :param num_random_destinations: number of random reachable tiles also considered as destinations
+        :param num_workers: number of processes searching each turn, including this one
+        :param transposition_table_bits: base 2 logarithm of the number of slots in the transposition table, or None
+        to search without one
+        :param reuse_visits: number of playouts from a position after which their mean value is reused
+        """
+        self.time_budget: float = time_budget
+        self.max_playouts: int or None = max_playouts
+        self.playout_turns: int = playout_turns
+        self.max_destinations: int = max_destinations
+        self.num_random_destinations: int = num_random_destinations
+        self.num_workers: int = num_workers
+        self.transposition_table_bits: int or None = transposition_table_bits
+        self.transposition_table: TranspositionTable or None = TranspositionTable(transposition_table_bits) \
+            if transposition_table_bits is not None else None
+        self.reuse_visits: int = reuse_visits
+        self.playout_controller: BattleController = BattleController()
+        self.num_searches: int = 0  # initial value
+        self.num_playouts: int = 0  # initial value
+        self.search_seconds: float = 0.0  # initial value
+        self.__plans: dict = {}  # initial value
+        self.__executor: ProcessPoolExecutor or None = None  # initial value
+        self.__searched_engine: BattleEngine or None = None  # initial value
+        self.__searched_units: list = []  # initial value
+
+    def __getstate__(self):
+        # type: () -> dict
+        # Worker processes only need the settings of the search, and start with empty transposition tables
+        state: dict = dict(vars(self))
+        state["_MCTSController__plans"] = {}
+        state["_MCTSController__executor"] = None
+        state["_MCTSController__searched_engine"] = None
+        state["_MCTSController__searched_units"] = []
+        state["transposition_table"] = None
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        vars(self).update(state)
+        self.transposition_table = TranspositionTable(self.transposition_table_bits) \
+            if self.transposition_table_bits is not None else None
+
+    def close(self):
+        # type: () -> None
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+        self.__searched_engine = None
+        self.__searched_units = []
+
+    def get_playouts_per_second(self):
+        # type: () -> float
+        return self.num_playouts / self.search_seconds if self.search_seconds > 0 else 0.0
+
+    def get_candidate_destinations(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> list
+        """
+        This method gets the destinations searched for a game character: staying where it is, free tiles next to
+        the nearest enemies it can reach, and a few random reachable tiles.
+        :param engine: the battle engine running the battle
+        :param game_character: the game character having its turn
+        :return: a list of (x, y) coordinates, with None for staying where it is
+        """
+        destinations: list = [None]
+        if game_character.has_moved:
+            return destinations
+
+        battlefield: Battlefield = engine.battlefield
+        enemies: list = sorted(battlefield.get_enemies_within(game_character.x, game_character.y,
+                                                              game_character.max_steps + 1,
+                                                              game_character.corresponding_team),
+                               key=lambda enemy: abs(enemy.x - game_character.x) + abs(enemy.y - game_character.y))
+        for enemy in enemies:
+            for x, y in ((enemy.x - 1, enemy.y), (enemy.x + 1, enemy.y), (enemy.x, enemy.y - 1),
+                         (enemy.x, enemy.y + 1)):
+                if len(destinations) <= self.max_destinations and (x, y) not in destinations and \
+                        game_character.can_move(x, y, battlefield):
+                    destinations.append((x, y))
+
+        for i in range(self.num_random_destinations):
+            destination: tuple or None = game_character.choose_random_destination(battlefield,
+                                                                                  engine.battle_random.ai)
+            if destination is not None and destination not in destinations:
+                destinations.append(destination)
+
+        return destinations
+
+    @staticmethod
+    def get_candidate_attacks(engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> list
+        """
+        This method gets the attacks searched for a game character at its current position: not attacking, and
+        attacking each adjacent enemy without a skill or with each skill it has enough magic points for.
+        :param engine: the battle engine running the battle
+        :param game_character: the game character having its turn
+        :return: a list of (x, y, skill index) tuples, with None for not attacking
+        """
+        attacks: list = [None]
+        if game_character.has_attacked:
+            return attacks
+
+        skills: list = game_character.get_skills() if isinstance(game_character, Hero) else []
+        for target in engine.get_attackable_targets(game_character):
+            attacks.append((target.x, target.y, None))
+            for skill_index, skill in enumerate(skills):
+                if skill.magic_points_cost <= game_character.curr_magic_points:
+                    attacks.append((target.x, target.y, skill_index))
+
+        return attacks
+
+    @staticmethod
+    def get_attack(engine, game_character, action):
+        # type: (BattleEngine, GameCharacter, tuple or None) -> tuple or None
+        """
+        This method turns an attack searched by the tree into a target and a skill.
+        :param engine: the battle engine running the battle
+        :param game_character: the game character having its turn
+        :param action: an (x, y, skill index) tuple, or None for not attacking
+        :return: a tuple of the target and the skill to use (or None), or None if the attack is not possible
+        """
+        if action is None:
+            return None
+
+        curr_tile: Tile or None = engine.battlefield.get_tile_at(action[0], action[1])
+        target: Building or GameCharacter or None = None if curr_tile is None else \
+            curr_tile.building if curr_tile.building is not None else curr_tile.game_character
+        skill: Skill or None = None if action[2] is None else game_character.get_skills()[action[2]]
+        if target is None or not target.get_is_alive() or not can_attack(game_character, target, engine.battlefield,
+                                                                         skill):
+            return None
+        return target, skill
+
+    @staticmethod
+    def evaluate(engine, team):
+        # type: (BattleEngine, Team) -> float
+        """
+        This method evaluates how well a battle is going for a team. Won and lost battles are worth 1 and 0. Other
+        battles are mostly judged by the HP left in the buildings of each team, which decide who wins, and then by
+        the HP left in their game characters.
+        :param engine: the battle engine running the battle
+        :param team: the team the battle is evaluated for
+        :return: a value between 0 and 1
+        """
+        opposing_team: Team = engine.get_opposing_team(team)
+        if opposing_team.battle_squad.all_died():
+            return 1.0
+        if team.battle_squad.all_died():
+            return 0.0
+
+        hp_fractions: list = []  # initial value
+        for curr_team in (team, opposing_team):
+            battle_squad: BattleSquad = curr_team.battle_squad
+            buildings: list = battle_squad.get_defense_towers() + [battle_squad.town_center]
+            game_characters: list = battle_squad.get_heroes() + battle_squad.get_villagers()
+            hp_fractions.append((
+                sum(float(unit.curr_hp / unit.max_hp) for unit in buildings if unit.get_is_alive()) / len(buildings),
+                sum(float(unit.curr_hp / unit.max_hp) for unit in game_characters if unit.get_is_alive()) /
+                max(len(game_characters), 1)
+            ))
+
+        return 0.5 + 0.35 * (hp_fractions[0][0] - hp_fractions[1][0]) + 0.15 * (hp_fractions[0][1] -
+                                                                                 hp_fractions[1][1])
+
+    def __select_child(self, node, engine, game_character, get_candidate_actions):
+        # type: (MCTSNode, BattleEngine, GameCharacter, callable) -> MCTSNode
+        if node.untried_actions is None:
+            node.untried_actions = get_candidate_actions(engine, game_character)
+
+        if len(node.untried_actions) > 0:
+            child: MCTSNode = MCTSNode(node.untried_actions.pop())
+            node.children.append(child)
+            return child
+        return max(node.children, key=lambda curr_child: curr_child.get_ucb_score(node.visits, self.EXPLORATION))
+
+    def search(self, engine, game_character, destinations=None, stage_name="move"):
+        # type: (BattleEngine, GameCharacter, list or None, str) -> MCTSNode
+        """
+        This method searches for the best destination and attack of a game character within the time budget, in
+        worker processes too if there is more than one worker.
+        :param engine: the battle engine running the battle
+        :param game_character: the game character having its turn
+        :param destinations: destinations to search, or None to search the candidate destinations
+        :param stage_name: "move" or "attack", the stage of the turn the battle engine is running for heroes
+        :return: the root of the search tree, whose children are destinations and grandchildren attacks
+        """
+        start_time: float = time.perf_counter()
+        root: MCTSNode = self.__search_in_parallel(engine, game_character, destinations, stage_name) \
+            if self.num_workers > 1 \
+            else self.search_in_place(engine, game_character, destinations, self.time_budget, stage_name)
+        self.num_searches += 1
+        self.num_playouts += root.visits
+        self.search_seconds += time.perf_counter() - start_time
+        return root
+
+    def __search_in_parallel(self, engine, game_character, destinations, stage_name):
+        # type: (BattleEngine, GameCharacter, list or None, str) -> MCTSNode
+        deadline: float = time.time() + self.time_budget
+        if self.__executor is None or self.__searched_engine is not engine:
+            # Worker processes are started again for each battle with a copy of it
+            self.close()
+            self.__searched_engine = engine
+            self.__searched_units = get_searched_units(engine)
+            self.__executor = ProcessPoolExecutor(max_workers=self.num_workers - 1,
+                                                  initializer=initialize_search_worker,
+                                                  initargs=(numeric_backend.name, pickle.dumps((self, engine))))
+
+        # Every search is given the same destinations so that their visits can be added up, and a seed of its own
+        destinations = destinations if destinations is not None else \
+            self.get_candidate_destinations(engine, game_character)
+        search_seed: int = engine.battle_random.ai.getrandbits(64)
+        snapshot: BattleSnapshot = engine.snapshot()
+        unit_index: int = next(i for i, unit in enumerate(self.__searched_units) if unit is game_character)
+        futures: list = [self.__executor.submit(search_in_worker, snapshot, unit_index, destinations, search_seed + i,
+                                                deadline, stage_name) for i in range(1, self.num_workers)]
+        battle_random: BattleRandom = engine.battle_random
+        engine.battle_random = BattleRandom(search_seed)
+        try:
+            root: MCTSNode = self.search_in_place(engine, game_character, list(destinations),
+                                                  deadline - time.time(), stage_name)
+        finally:
+            engine.battle_random = battle_random
+
+        for future in futures:
+            root.merge(future.result())
+        return root
+
+    def search_in_place(self, engine, game_character, destinations, time_budget, stage_name="move"):
+        # type: (BattleEngine, GameCharacter, list or None, float, str) -> MCTSNode
+        """
+        This method runs playouts on the battle itself for the given time, leaving the battle and its random number
+        generators as they were before the search.
+        :param engine: the battle engine running the battle
+        :param game_character: the game character having its turn
+        :param destinations: destinations to search, or None to search the candidate destinations
+        :param time_budget: wall-clock seconds spent searching
+        :param stage_name: "move" or "attack", the stage of the turn the battle engine is running for heroes
+        :return: the root of the search tree, whose children are destinations and grandchildren attacks
+        """
+        start_time: float = time.perf_counter()
+        team: Team = game_character.corresponding_team
+        # Heroes move in one stage and attack in the next while villagers move and attack one at a time, so the
+        # game characters of the same kind before and after this one act around its move and its attack
+        is_hero: bool = isinstance(game_character, Hero)
+        squad_members: list = team.battle_squad.get_heroes() if is_hero else team.battle_squad.get_villagers()
+        index: int = next(i for i, squad_member in enumerate(squad_members) if squad_member is game_character)
+        earlier_members: list = squad_members[:index]
+        later_members: list = squad_members[index + 1:]
+        remaining_stage_names: tuple = BattleEngine.STAGE_NAMES[
+            BattleEngine.STAGE_NAMES.index("attack" if is_hero else "villagers") + 1:]
+        transposition_table: TranspositionTable or None = self.transposition_table
+        if transposition_table is not None:
+            engine.enable_zobrist_hash()
+            transposition_table.new_search()
+
+        snapshot: BattleSnapshot = engine.snapshot()
+        random_state: tuple = engine.battle_random.get_state()
+        root: MCTSNode = MCTSNode()
+        root.untried_actions = destinations
+        num_playouts: int = 0  # initial value
+
+        engine.playout_controller = self.playout_controller
+        try:
+            while (self.max_playouts is None or num_playouts < self.max_playouts) and \
+                    (num_playouts == 0 or time.perf_counter() - start_time < time_budget):
+                destination_node: MCTSNode = self.__select_child(root, engine, game_character,
+                                                                 self.get_candidate_destinations)
+                if destination_node.action is not None:
+                    game_character.move(destination_node.action[0], destination_node.action[1], engine.battlefield)
+
+                if is_hero and stage_name == "move":
+                    for hero in later_members:
+                        if hero.get_is_alive():
+                            engine.move(hero)
+
+                    for hero in earlier_members:
+                        if hero.get_is_alive():
+                            engine.make_attack(hero)
+
+                attack_node: MCTSNode = self.__select_child(destination_node, engine, game_character,
+                                                            self.get_candidate_attacks)
+                attack: tuple or None = self.get_attack(engine, game_character, attack_node.action)
+                if attack is not None:
+                    engine.attack(game_character, attack[0], attack[1])
+
+                position_hash: int or None = None if transposition_table is None else engine.get_position_hash()
+                entry: list or None = None if transposition_table is None else transposition_table.get(position_hash)
+                value: float = 0.0  # initial value
+                if entry is not None and entry[1] >= self.reuse_visits:
+                    value = entry[2] / entry[1]
+                else:
+                    # The rest of the turn and the next few turns are played with random decisions, without keeping
+                    # the hash up to date since it is restored along with the battle
+                    zobrist_hash: ZobristHash or None = engine.battlefield.zobrist_hash
+                    engine.battlefield.zobrist_hash = None
+                    for squad_member in later_members:
+                        if squad_member.get_is_alive():
+                            if not is_hero:
+                                engine.move(squad_member)
+
+                            engine.make_attack(squad_member)
+
+                    engine.run_stages(team, remaining_stage_names)
+                    for i in range(self.playout_turns):
+                        if not engine.step():
+                            break
+
+                    engine.battlefield.zobrist_hash = zobrist_hash
+                    value = self.evaluate(engine, team)
+                    if transposition_table is not None:
+                        transposition_table.add(position_hash, value)
+                for node in (root, destination_node, attack_node):
+                    node.visits += 1
+                    node.total_value += value
+
+                engine.restore(snapshot)
+                num_playouts += 1
+        finally:
+            engine.playout_controller = None
+            engine.restore(snapshot)
+            engine.battle_random.set_state(random_state)
+
+        return root
+
+    def choose_destination(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        destination_node: MCTSNode = self.search(engine, game_character).get_most_visited_child()
+        self.__plans[id(game_character)] = destination_node
+        return destination_node.action
+
+    def choose_attack(self, engine, game_character):
+        # type: (BattleEngine, GameCharacter) -> tuple or None
+        destination_node: MCTSNode or None = self.__plans.pop(id(game_character), None)
+        if destination_node is None or (destination_node.action is not None and (game_character.x, game_character.y)
+                                        != destination_node.action):
+            # Game characters which have not been searched for in this turn are searched for where they are
+            destination_node = self.search(engine, game_character, [None], "attack").get_most_visited_child()
+
+        # Targets may have been killed by other game characters since the search, so the next best attack is made
+        for attack_node in sorted(destination_node.children, key=lambda child: -child.visits):
+            if attack_node.action is None:
+                return None
+
+            attack: tuple or None = self.get_attack(engine, game_character, attack_node.action)
+            if attack is not None:
+                return attack
+
+        return None
+
+
+# The battle copied into a worker process searching battles, with the controller searching it and its units
+search_worker_battle: tuple or None = None
+
+
+def get_searched_units(engine):
+    # type: (BattleEngine) -> list
+    return [unit for team in engine.get_teams() for unit in BattleEngine.get_units(team)]
+
+
+def initialize_search_worker(numeric_backend_name, battle_data):
+    # type: (str, bytes) -> None
+    """
+    This function prepares a worker process to search a battle.
+    :param numeric_backend_name: name of the numeric backend used by the battle
+    :param battle_data: the pickled controller searching the battle and battle engine
+    :return: None
+    """
+    global search_worker_battle
+    set_numeric_backend(numeric_backend_name)
+    mcts_controller, engine = pickle.loads(battle_data)
+    search_worker_battle = (mcts_controller, engine, get_searched_units(engine))
+
+
+def search_in_worker(snapshot, unit_index, destinations, seed, deadline, stage_name="move"):
+    # type: (BattleSnapshot, int, list, int, float, str) -> MCTSNode
+    """
+    This function searches the copy of a battle in a worker process until the deadline, with random number
+    generators seeded for this worker.
+    :param snapshot: a snapshot of the battle to restore the copy to
+    :param unit_index: index of the game character having its turn among the units of both teams
+    :param destinations: destinations to search
+    :param seed: seed of the random number generators used by this search
+    :param deadline: time (as given by time.time()) by which the search must be over
+    :param stage_name: "move" or "attack", the stage of the turn the battle engine is running for heroes
+    :return: the root of the search tree
+    """
+    mcts_controller, engine, units = search_worker_battle
+    engine.restore(snapshot)
+    engine.battle_random = BattleRandom(seed)
+    return mcts_controller.search_in_place(engine, units[unit_index], destinations, deadline - time.time(),
+                                           stage_name)
+
+
+class BattleSnapshot:
+    """
+    This class contains attributes of a snapshot of the mutable state of a battle (stats, positions, flags, runes,
+    battle coins, free tiles, and the Zobrist hash if there is one) which can be restored in place by the battle engine
+    the snapshot was taken from.
+    """
+
+    def __init__(self, engine_values, unit_values, units_on_battlefield, runes, battle_coins, free_cells,
+                 zobrist_state=None):
+        # type: (tuple, tuple, tuple, tuple, tuple, tuple, tuple or None) -> None
+        self.engine_values: tuple = engine_values
+        self.unit_values: tuple = unit_values
+        self.units_on_battlefield: tuple = units_on_battlefield
+        self.runes: tuple = runes
+        self.battle_coins: tuple = battle_coins
+        self.free_cells: tuple = free_cells
+        self.zobrist_state: tuple or None = zobrist_state
+
+
+class ArrayBattleState:
+    """
+    This class contains attributes of the state of the units in a battle stored as NumPy arrays with one element per
+    unit, so that the upkeep at the end of each turn and the search for dead game characters to respawn run as a few
+    vectorized operations however many units there are. Stats are stored as 64-bit floats, so only units whose stats
+    are numbers of the FLOAT numeric backend can be stored, and reading a stat gives back exactly the float stored.
+    While the state is bound, game characters, battle towers, and the players controlling heroes are array views
+    whose attributes read and write the arrays, so the rest of the game uses them as usual.
+    """
+
+    FLOAT_COLUMNS: tuple = ("curr_hp", "max_hp", "curr_magic_points", "max_magic_points", "hp_heal_rate",
+                            "mp_heal_rate")
+    BOOL_COLUMNS: tuple = ("is_alive", "has_moved", "has_attacked")
+
+    def __init__(self, teams):
+        # type: (list) -> None
+        self.__units: list = [unit for team in teams for unit in team.battle_squad.get_heroes() +
+                              team.battle_squad.get_villagers() + team.battle_squad.get_defense_towers()]
+        self.__players: list = list({id(hero.controlling_player): hero.controlling_player for team in teams
+                                     for hero in team.battle_squad.get_heroes()}.values())
+        for obj in self.__units + self.__players:
+            if type(obj) not in ARRAY_VIEW_CLASSES:
+                raise TypeError("Cannot store a " + type(obj).__name__ + " in an array battle state!")
+            if any(getattr(obj, column_name).__class__ is not float for column_name in
+                   ARRAY_VIEW_CLASSES[type(obj)].ARRAY_FIELDS if column_name in self.FLOAT_COLUMNS):
+                raise TypeError("Array battle states can only store stats of the FLOAT numeric backend!")
+
+        self.columns: dict = {column_name: np.zeros(len(self.__units), dtype=np.float64 if column_name in
+                                                    self.FLOAT_COLUMNS else np.bool_)
+                              for column_name in self.FLOAT_COLUMNS + self.BOOL_COLUMNS}
+        self.columns["battle_coins"] = np.full(len(self.__players), -np.inf)
+        # The units of each team are stored next to each other, so they are selected with slices rather than indices
+        self.__game_character_slices: list = []  # initial value
+        self.__battle_tower_slices: list = []  # initial value
+        self.__player_indices: list = []  # initial value
+        player_indices_by_id: dict = {id(player): index for index, player in enumerate(self.__players)}
+        unit_index: int = 0  # initial value
+        for team in teams:
+            num_game_characters: int = len(team.battle_squad.get_heroes()) + len(team.battle_squad.get_villagers())
+            num_battle_towers: int = len(team.battle_squad.get_defense_towers())
+            self.__game_character_slices.append(slice(unit_index, unit_index + num_game_characters))
+            unit_index += num_game_characters
+            self.__battle_tower_slices.append(slice(unit_index, unit_index + num_battle_towers))
+            unit_index += num_battle_towers
+            self.__player_indices.append(np.array([player_indices_by_id[id(hero.controlling_player)]
+                                                   for hero in team.battle_squad.get_heroes()], dtype=np.int64))
+
+        self.__has_shared_players: bool = len(self.__players) < sum(len(player_indices) for player_indices in
+                                                                     self.__player_indices)
+        for index, obj in enumerate(self.__units):
+            self.__bind(obj, index)
+
+        for index, obj in enumerate(self.__players):
+            self.__bind(obj, index)
+
+    @staticmethod
+    def make_property(column_name):
+        # type: (str) -> property
+        def get_value(view):
+            return view.array_columns[column_name].item(view.array_index)
+
+        def set_value(view, value):
+            view.array_columns[column_name][view.array_index] = value
+
+        return property(get_value, set_value)
+
+    def __bind(self, obj, index):
+        # type: (object, int) -> None
+        view_class: type = ARRAY_VIEW_CLASSES[type(obj)]
+        values: list = [vars(obj).pop(field) for field in view_class.ARRAY_FIELDS]
+        obj.array_columns = self.columns
+        obj.array_index = index
+        obj.__class__ = view_class
+        for field, value in zip(view_class.ARRAY_FIELDS, values):
+            setattr(obj, field, value)
+
+    def unbind(self):
+        # type: () -> None
+        """
+        This method copies the values in the arrays back into the units and players and turns them back into
+        ordinary objects.
+        :return: None
+        """
+        for obj in self.__units + self.__players:
+            view_class: type = type(obj)
+            values: list = [getattr(obj, field) for field in view_class.ARRAY_FIELDS]
+            obj.__class__ = view_class.__bases__[-1]  # array views derive from the class they are views of last
+            del obj.array_columns
+            del obj.array_index
+            vars(obj).update(zip(view_class.ARRAY_FIELDS, values))
+
+        self.__units = []
+        self.__players = []
+
+    def upkeep(self, team_index, turn, battle_coin_production_rate):
+        # type: (int, int, LogNumber) -> LogNumber
+        """
+        This method restores the moved and attacked statuses of the units in a team, gives battle coins to the
+        players controlling its heroes, and heals its living game characters, all at once.
+        :param team_index: index of the team (0 or 1)
+        :param turn: the turn which has just been played
+        :param battle_coin_production_rate: battle coin production rate before the upkeep
+        :return: battle coin production rate after the upkeep
+        """
+        columns: dict = self.columns
+        game_characters: slice = self.__game_character_slices[team_index]
+        columns["has_moved"][game_characters] = False
+        columns["has_attacked"][game_characters] = False
+        columns["has_attacked"][self.__battle_tower_slices[team_index]] = False
+
+        # The production rate grows by a factor of 10 ** turn before each hero receives battle coins
+        player_indices: np.ndarray = self.__player_indices[team_index]
+        rates: np.ndarray = battle_coin_production_rate.log10 + turn * np.arange(1, len(player_indices) + 1)
+        if self.__has_shared_players:
+            for player_index, rate in zip(player_indices, rates):
+                columns["battle_coins"][player_index] = \
+                    (LogNumber(log10=columns["battle_coins"][player_index]) + LogNumber(log10=rate)).log10
+        else:
+            battle_coins: np.ndarray = columns["battle_coins"][player_indices]
+            larger: np.ndarray = np.maximum(battle_coins, rates)
+            smaller: np.ndarray = np.minimum(battle_coins, rates)
+            with np.errstate(invalid="ignore"):
+                columns["battle_coins"][player_indices] = np.where(
+                    smaller == -np.inf, larger, larger + np.log10(1 + 10 ** (smaller - larger)))
+
+        is_alive: np.ndarray = np.greater(columns["curr_hp"][game_characters], 0,
+                                          out=columns["is_alive"][game_characters])
+        for curr_column_name, max_column_name, heal_rate_column_name in (
+                ("curr_hp", "max_hp", "hp_heal_rate"),
+                ("curr_magic_points", "max_magic_points", "mp_heal_rate")):
+            curr_values: np.ndarray = columns[curr_column_name][game_characters]
+            np.minimum(curr_values + columns[heal_rate_column_name][game_characters],
+                       columns[max_column_name][game_characters], out=curr_values, where=is_alive)
+
+        return LogNumber(log10=battle_coin_production_rate.log10 + turn * len(player_indices))
+
+    def get_dead_game_characters(self, team_index):
+        # type: (int) -> list
+        game_characters: slice = self.__game_character_slices[team_index]
+        is_alive: np.ndarray = np.greater(self.columns["curr_hp"][game_characters], 0,
+                                          out=self.columns["is_alive"][game_characters])
+        return [self.__units[game_characters.start + index] for index in np.flatnonzero(~is_alive)]
+
+
+class GameCharacterArrayView(GameCharacter):
+    """
+    This class contains attributes of a game character whose state is stored in an array battle state.
+    """
+
+    ARRAY_FIELDS: tuple = ArrayBattleState.FLOAT_COLUMNS + ArrayBattleState.BOOL_COLUMNS
+    curr_hp: property = ArrayBattleState.make_property("curr_hp")
+    max_hp: property = ArrayBattleState.make_property("max_hp")
+    curr_magic_points: property = ArrayBattleState.make_property("curr_magic_points")
+    max_magic_points: property = ArrayBattleState.make_property("max_magic_points")
+    hp_heal_rate: property = ArrayBattleState.make_property("hp_heal_rate")
+    mp_heal_rate: property = ArrayBattleState.make_property("mp_heal_rate")
+    is_alive: property = ArrayBattleState.make_property("is_alive")
+    has_moved: property = ArrayBattleState.make_property("has_moved")
+    has_attacked: property = ArrayBattleState.make_property("has_attacked")
 
-    def add_human_player(self, human_player):
-        # type: (HumanPlayer) -> None
-        self.__human_players.append(human_player)
 
-    def get_human_players(self):
+class BattleTowerArrayView(BattleTower):
+    """
+    This class contains attributes of a battle tower whose state is stored in an array battle state.
+    """
+
+    ARRAY_FIELDS: tuple = ("has_attacked",)
+    has_attacked: property = ArrayBattleState.make_property("has_attacked")
+
+
+class HeroArrayView(GameCharacterArrayView, Hero):
+    """
+    This class contains attributes of a hero whose state is stored in an array battle state.
+    """
+
+
+class VillagerArrayView(GameCharacterArrayView, Villager):
+    """
+    This class contains attributes of a villager whose state is stored in an array battle state.
+    """
+
+
+class PlayerArrayView(Player):
+    """
+    This class contains attributes of a player whose battle coins are stored in an array battle state.
+    """
+
+    ARRAY_FIELDS: tuple = ("battle_coins",)
+
+    @property
+    def battle_coins(self):
+        # type: () -> LogNumber
+        return LogNumber(log10=self.array_columns["battle_coins"].item(self.array_index))
+
+    @battle_coins.setter
+    def battle_coins(self, value):
+        # type: (object) -> None
+        self.array_columns["battle_coins"][self.array_index] = LogNumber.of(value).log10
+
+
+class HumanPlayerArrayView(PlayerArrayView, HumanPlayer):
+    """
+    This class contains attributes of a human player whose battle coins are stored in an array battle state.
+    """
+
+
+class CPUPlayerArrayView(PlayerArrayView, CPUPlayer):
+    """
+    This class contains attributes of a CPU player whose battle coins are stored in an array battle state.
+    """
+
+
+ARRAY_VIEW_CLASSES: dict = {GameCharacter: GameCharacterArrayView, Hero: HeroArrayView, Villager: VillagerArrayView,
+                            BattleTower: BattleTowerArrayView, HumanPlayer: HumanPlayerArrayView,
+                            CPUPlayer: CPUPlayerArrayView}
+
+
+def can_attack(attacker, target, battlefield, skill_to_use=None):
+    # type: (BattleTower or GameCharacter, Building or GameCharacter, Battlefield, Skill or None) -> bool
+    if attacker.corresponding_team == target.corresponding_team:
+        return False
+
+    if abs(target.x - attacker.x) + abs(target.y - attacker.y) > 1:
+        return False
+
+    return skill_to_use is None or not isinstance(attacker, Hero) or skill_to_use in attacker.get_skills()
+
+
+def get_usable_skills(attackers):
+    # type: (list) -> np.ndarray
+    """
+    This function finds which attacks some attackers can make with the magic points they have now.
+    :param attackers: game characters or battle towers attacking
+    :return: whether each attacker can use each skill (0 for basic attacks and i + 1 for the i-th skill)
+    """
+    num_skills: int = 1 + max(len(attacker.get_skills()) if isinstance(attacker, Hero) else 0
+                              for attacker in attackers)
+    is_usable: np.ndarray = np.zeros((len(attackers), num_skills), dtype=bool)
+    is_usable[:, 0] = True
+    for attacker_index, attacker in enumerate(attackers):
+        if isinstance(attacker, Hero):
+            for skill_index, skill in enumerate(attacker.get_skills()):
+                is_usable[attacker_index, skill_index + 1] = skill.magic_points_cost <= attacker.curr_magic_points
+
+    return is_usable
+
+
+def compute_expected_damages(attackers, targets):
+    # type: (list, list) -> tuple
+    """
+    This function computes the expected damage of every attack of some attackers on some targets, averaged over
+    critical hits, with the same formulas as the attack methods. Stats which are not floats (e.g. mpf) are kept as
+    objects.
+    :param attackers: game characters or battle towers attacking
+    :param targets: game characters or buildings being attacked
+    :return: a tuple of the expected damage and the damage of critical hits, both indexed by attacker, skill (0 for
+    basic attacks and i + 1 for the i-th skill), and target, and the chance of critical hits indexed by attacker,
+    a single skill, and target. Skills which an attacker does not have deal no damage.
+    """
+    num_skills: int = 1 + max(len(attacker.get_skills()) if isinstance(attacker, Hero) else 0
+                              for attacker in attackers)
+    base_damages: list = []  # initial value
+    for attacker in attackers:
+        skills: list = attacker.get_skills() if isinstance(attacker, Hero) else []
+        base_damages.append([attacker.attack_power] + [
+            attacker.max_hp * skill.damage_multiplier_to_max_hp + attacker.max_magic_points *
+            skill.damage_multiplier_to_max_magic_points + attacker.attack_power *
+            skill.damage_multiplier_to_attack_power + attacker.defense * skill.damage_multiplier_to_defense
+            for skill in skills] + [0] * (num_skills - 1 - len(skills)))
+
+    base_damage: np.ndarray = np.array(base_damages)[:, :, None]
+    crit_damage: np.ndarray = np.array([attacker.crit_damage for attacker in attackers])[:, None, None]
+    target_defense: np.ndarray = np.array([target.defense for target in targets])[None, None, :]
+    crit_chances: np.ndarray = np.clip((np.array([attacker.crit_rate for attacker in attackers])[:, None] -
+                                        np.array([target.crit_resistance for target in targets])[None, :])
+                                       .astype(float) / 3000, 0, 1)[:, None, :]
+    damage: np.ndarray = base_damage - target_defense
+    crit_hit_damage: np.ndarray = base_damage * crit_damage - target_defense
+    crit_hit_damage = np.where(crit_hit_damage > 0, crit_hit_damage, 0)
+    return crit_chances * crit_hit_damage + (1 - crit_chances) * np.where(damage > 0, damage, 0), crit_hit_damage, \
+        crit_chances
+
+
+class BattleEngine:
+    """
+    This class contains attributes of a battle between two teams which runs without any console input and output.
+    Each turn runs the stages in STAGE_NAMES in order for the team whose turn it is, and any stage can be replaced
+    with another function taking the battle engine and the team. Since each stage handles the whole team, all heroes
+    of the team shop first, then all of them move, and then all of them attack, rather than each hero shopping, moving,
+    and attacking before the next one does. Defense towers also attack enemies next to them in the "towers" stage.
+    Decisions of each game character are delegated to the battle controller assigned to it. Teams take turns, starting
+    with the first team (team 1 unless another is given).
+    """
+
+    ENGINE_FIELDS: tuple = ("turn", "num_attacks", "battle_coin_production_rate", "winner", "has_finished")
+    GAME_CHARACTER_FIELDS: tuple = ("curr_hp", "max_hp", "curr_magic_points", "max_magic_points", "attack_power",
+                                    "defense", "crit_rate", "crit_resistance", "crit_damage", "battle_level",
+                                    "battle_exp", "required_battle_exp", "x", "y", "is_alive", "has_moved",
+                                    "has_attacked", "kills", "times_killed", "stats_version")
+    BUILDING_FIELDS: tuple = ("curr_hp", "max_hp", "defense", "battle_level", "battle_exp", "required_battle_exp",
+                              "x", "y", "is_alive", "stats_version")
+    BATTLE_TOWER_FIELDS: tuple = BUILDING_FIELDS + ("attack_power", "has_attacked")
+    STAGE_NAMES: tuple = ("shop", "move", "attack", "villagers", "towers", "upkeep", "respawn")
+    X_INDEX: int = GAME_CHARACTER_FIELDS.index("x")
+    Y_INDEX: int = GAME_CHARACTER_FIELDS.index("y")
+
+    def __init__(self, team1, team2, battlefield, battlefield_shop, default_controller=None,
+                 spawn_in_team_halves=False, battle_random=None, profile_stages=False, use_array_state=False,
+                 first_team=None):
+        # type: (Team, Team, Battlefield, BattlefieldShop, BattleController or None, bool, BattleRandom or None,
+        #        bool, bool, Team or None) -> None
+        self.team1: Team = team1
+        self.team2: Team = team2
+        self.first_team: Team = first_team if first_team is not None else team1
+        self.battlefield: Battlefield = battlefield
+        self.battlefield_shop: BattlefieldShop = battlefield_shop
+        self.default_controller: BattleController = default_controller if default_controller is not None \
+            else BattleController()
+        self.__controllers: dict = {}  # initial value
+        self.playout_controller: BattleController or None = None  # initial value
+        self.battle_random: BattleRandom = battle_random if battle_random is not None else BattleRandom()
+        self.battle_coin_production_rate: LogNumber = LogNumber.power_of_ten(5)
+        self.turn: int = 0  # initial value
+        self.num_attacks: int = 0  # initial value
+        self.winner: Team or None = None  # initial value
+        self.has_finished: bool = False  # initial value
+        self.__stages: dict = {stage_name: getattr(BattleEngine, "run_" + stage_name + "_stage")
+                               for stage_name in self.STAGE_NAMES}
+        self.__stage_times: dict or None = {stage_name: 0.0 for stage_name in self.STAGE_NAMES} \
+            if profile_stages else None
+        self.spawn_in_team_halves: bool = spawn_in_team_halves
+        if self.spawn_in_team_halves:
+            self.battlefield.add_team_spawn_zones(self.team1.name, self.team2.name)
+
+        for team in self.get_teams():
+            for hero in team.battle_squad.get_heroes():
+                hero.controlling_player.corresponding_team = team
+
+            for unit in self.get_units(team):
+                unit.corresponding_team = team
+
+        self.__units: list = self.get_units(self.team1) + self.get_units(self.team2)
+        self.__unit_fields: list = [self.GAME_CHARACTER_FIELDS if isinstance(unit, GameCharacter) else
+                                    self.BATTLE_TOWER_FIELDS if isinstance(unit, BattleTower) else
+                                    self.BUILDING_FIELDS for unit in self.__units]
+        self.__unit_getters: list = [attrgetter(*fields) for fields in self.__unit_fields]
+        self.__game_character_indices: list = [index for index, unit in enumerate(self.__units)
+                                               if isinstance(unit, GameCharacter)]
+        self.__game_characters: list = [self.__units[index] for index in self.__game_character_indices]
+        self.__heroes: list = [unit for unit in self.__units if isinstance(unit, Hero)]
+        self.__spawn_all()
+        self.__array_state: ArrayBattleState or None = ArrayBattleState(self.get_teams()) if use_array_state else None
+
+    def get_teams(self):
         # type: () -> list
-        return self.__human_players
+        return [self.team1, self.team2]
 
-    def get_human_player_by_name(self, name):
-        # type: (str) -> HumanPlayer or None
-        for human_player in self.__human_players:
-            if name == human_player.name:
-                return human_player
+    def get_opposing_team(self, team):
+        # type: (Team) -> Team
+        return self.team2 if team is self.team1 else self.team1
 
-        return None
+    def get_array_state(self):
+        # type: () -> ArrayBattleState or None
+        return self.__array_state
 
-    def get_human_player_by_index(self, index):
-        # type: (int) -> HumanPlayer or None
-        if index < 0 or index >= len(self.__human_players):
-            return None
-        return self.__human_players[index]
+    def enable_zobrist_hash(self):
+        # type: () -> ZobristHash
+        """
+        This method makes the battlefield, its tiles, and the units keep a Zobrist hash of this battle up to date.
+        :return: the Zobrist hash
+        """
+        if self.battlefield.zobrist_hash is None:
+            self.battlefield.zobrist_hash = ZobristHash(self.__units)
+            self.battlefield.zobrist_hash.recompute(self.battlefield)
+        return self.battlefield.zobrist_hash
 
-    def clone(self):
-        # type: () -> Game
-        return copy.deepcopy(self)
+    def get_position_hash(self):
+        # type: () -> int or None
+        """
+        This method gets the Zobrist hash of the current position, including which team is to move.
+        :return: the hash, or None if Zobrist hashing is not enabled
+        """
+        zobrist_hash: ZobristHash or None = self.battlefield.zobrist_hash
+        return None if zobrist_hash is None else zobrist_hash.get_value(self.turn)
+
+    def set_stage(self, stage_name, stage):
+        # type: (str, callable) -> None
+        """
+        This method replaces a stage of each turn, e.g. with a faster implementation of it.
+        :param stage_name: name of the stage in STAGE_NAMES
+        :param stage: a function taking the battle engine and the team whose turn it is
+        :return: None
+        """
+        if stage_name not in self.__stages:
+            raise ValueError("There is no stage named " + str(stage_name) + "!")
+
+        self.__stages[stage_name] = stage
+
+    def get_stage_times(self):
+        # type: () -> dict or None
+        """
+        This method gets the total time in seconds spent in each stage if the stages are profiled.
+        :return: a dictionary mapping names of stages to seconds, or None if the stages are not profiled
+        """
+        return None if self.__stage_times is None else dict(self.__stage_times)
+
+    def get_acting_team(self):
+        # type: () -> Team
+        """
+        This method gets the team which will make moves in the next turn.
+        :return: the team which will make moves in the next turn
+        """
+        return self.first_team if self.turn % 2 == 0 else self.get_opposing_team(self.first_team)
+
+    def get_attackable_targets(self, game_character):
+        # type: (GameCharacter or BattleTower) -> list
+        return self.battlefield.get_adjacent_enemies(game_character.x, game_character.y,
+                                                     game_character.corresponding_team)
+
+    @staticmethod
+    def get_units(team):
+        # type: (Team) -> list
+        battle_squad: BattleSquad = team.battle_squad
+        return battle_squad.get_heroes() + battle_squad.get_villagers() + battle_squad.get_defense_towers() + \
+            [battle_squad.town_center]
+
+    def set_controller(self, game_character, controller):
+        # type: (GameCharacter, BattleController) -> None
+        self.__controllers[id(game_character)] = controller
+
+    def get_controller(self, game_character):
+        # type: (GameCharacter) -> BattleController
+        # While a search plays the battle out, every game character is controlled by the playout controller
+        if self.playout_controller is not None:
+            return self.playout_controller
+        return self.__controllers.get(id(game_character), self.default_controller)
+
+    def __spawn_at_random_tile(self, unit):
+        # type: (Building or GameCharacter) -> bool
+        curr_tile: Tile or None = None  # initial value
+        if self.spawn_in_team_halves and self.battlefield.get_num_free_tiles(unit.corresponding_team.name) > 0:
+            curr_tile = self.battlefield.get_random_free_tile(unit.corresponding_team.name,
+                                                              self.battle_random.spawning)
+        else:
+            curr_tile = self.battlefield.get_random_free_tile(rng=self.battle_random.spawning)
+
+        if curr_tile is None:
+            return False
+        if isinstance(unit, GameCharacter) and not unit.get_is_alive():
+            return unit.respawn(curr_tile.x, curr_tile.y, self.battlefield)
+        return unit.spawn(curr_tile.x, curr_tile.y, self.battlefield)
+
+    def __spawn_all(self):
+        # type: () -> None
+        for team in self.get_teams():
+            for hero in team.battle_squad.get_heroes():
+                self.__spawn_at_random_tile(hero)
+
+        for team in self.get_teams():
+            for villager in team.battle_squad.get_villagers():
+                self.__spawn_at_random_tile(villager)
+
+        for team in self.get_teams():
+            for defense_tower in team.battle_squad.get_defense_towers():
+                self.__spawn_at_random_tile(defense_tower)
+
+        for team in self.get_teams():
+            self.__spawn_at_random_tile(team.battle_squad.town_center)
+
+    def snapshot(self):
+        # type: () -> BattleSnapshot
+        """
+        This method copies the mutable state of this battle into a compact snapshot. Unlike cloning, nothing else in
+        the object graph (players' saved data, skills, shops, and so on) is copied.
+        :return: the snapshot
+        """
+        tiles: list = self.battlefield.get_tiles()
+        zobrist_hash: ZobristHash or None = self.battlefield.zobrist_hash
+        return BattleSnapshot(
+            attrgetter(*self.ENGINE_FIELDS)(self),
+            tuple(getter(unit) for getter, unit in zip(self.__unit_getters, self.__units)),
+            tuple(tiles[game_character.y][game_character.x].game_character is game_character
+                  for game_character in self.__game_characters),
+            tuple(tuple(hero.get_runes()) for hero in self.__heroes),
+            tuple(hero.controlling_player.battle_coins for hero in self.__heroes),
+            self.battlefield.get_free_cells(),
+            None if zobrist_hash is None else zobrist_hash.save()
+        )
+
+    def restore(self, snapshot):
+        # type: (BattleSnapshot) -> None
+        """
+        This method restores this battle in place to the state it was in when the snapshot was taken.
+        :param snapshot: a snapshot taken from this battle engine
+        :return: None
+        """
+        tiles: list = self.battlefield.get_tiles()
+        # The hash is restored from the snapshot rather than updated as game characters are moved back
+        zobrist_hash: ZobristHash or None = self.battlefield.zobrist_hash
+        self.battlefield.zobrist_hash = None
+        vars(self).update(zip(self.ENGINE_FIELDS, snapshot.engine_values))
+        moved_game_characters: list = []  # initial value
+        for game_character, unit_index, was_on_battlefield in zip(self.__game_characters,
+                                                                  self.__game_character_indices,
+                                                                  snapshot.units_on_battlefield):
+            # Only game characters which have moved, died, or respawned since the snapshot touch the battlefield
+            is_on_battlefield: bool = tiles[game_character.y][game_character.x].game_character is game_character
+            values: tuple = snapshot.unit_values[unit_index]
+            if is_on_battlefield != was_on_battlefield or (is_on_battlefield and (
+                    game_character.x != values[self.X_INDEX] or game_character.y != values[self.Y_INDEX])):
+                if is_on_battlefield:
+                    tiles[game_character.y][game_character.x].remove_game_character()
+
+                moved_game_characters.append((game_character, was_on_battlefield))
+
+        for unit, fields, values in zip(self.__units, self.__unit_fields, snapshot.unit_values):
+            if self.__array_state is None:
+                vars(unit).update(zip(fields, values))
+            else:
+                for field, value in zip(fields, values):
+                    setattr(unit, field, value)
+
+        for game_character, was_on_battlefield in moved_game_characters:
+            if was_on_battlefield:
+                tiles[game_character.y][game_character.x].add_game_character(game_character)
+
+        for hero, runes, battle_coins in zip(self.__heroes, snapshot.runes, snapshot.battle_coins):
+            hero.get_runes()[:] = runes
+            hero.controlling_player.battle_coins = battle_coins
+
+        self.battlefield.set_free_cells(snapshot.free_cells)
+        self.battlefield.zobrist_hash = zobrist_hash
+        if zobrist_hash is not None:
+            if snapshot.zobrist_state is not None:
+                zobrist_hash.load(snapshot.zobrist_state)
+            else:
+                # The snapshot was taken before hashing was enabled
+                zobrist_hash.recompute(self.battlefield)
+
+    def is_over(self):
+        # type: () -> bool
+        return self.team1.battle_squad.all_died() or self.team2.battle_squad.all_died()
+
+    def attack(self, attacker, target, skill_to_use=None):
+        # type: (GameCharacter, Building or GameCharacter, Skill or None) -> bool
+        has_attacked: bool = attacker.attack(target, self.battlefield, skill_to_use, self.battle_random.crits) \
+            if isinstance(attacker, Hero) else attacker.attack(target, self.battlefield, self.battle_random.crits)
+        if has_attacked:
+            self.num_attacks += 1
+
+        return has_attacked
+
+    def resolve_attacks(self, attackers, targets, skills=None):
+        # type: (list, list, list or None) -> list
+        """
+        This method makes many attackers attack their targets in order. An attack is only made if its target is
+        still alive and the attacker can make it when its turn in the batch comes, so a target killed earlier in the
+        batch is neither attacked nor paid out for again, and the results are exactly those of calling attack() for
+        each of those attacks.
+        :param attackers: game characters or battle towers attacking
+        :param targets: game characters or buildings being attacked
+        :param skills: skills used by the attackers (None for basic attacks), or None if no skills are used
+        :return: whether each attack took place
+        """
+        has_attacked: list = []  # initial value
+        for attacker, target, skill_to_use in zip(attackers, targets,
+                                                  skills if skills is not None else [None] * len(attackers)):
+            skill_to_use = skill_to_use if isinstance(attacker, Hero) else None
+            has_attacked.append(target.get_is_alive() and can_attack(attacker, target, self.battlefield, skill_to_use)
+                                and self.attack(attacker, target, skill_to_use))
+
+        return has_attacked
+
+    def buy_rune(self, hero):
+        # type: (Hero) -> bool
+        rune: Rune or None = self.get_controller(hero).choose_rune_to_buy(self, hero)
+        if rune is None or not hero.controlling_player.buy_rune(rune):
+            return False
+
+        self.battlefield.update_unit_hash(hero)
+        return True
+
+    def move(self, game_character):
+        # type: (GameCharacter) -> bool
+        destination: tuple or None = self.get_controller(game_character).choose_destination(self, game_character)
+        return destination is not None and game_character.move(destination[0], destination[1], self.battlefield)
+
+    def make_attack(self, game_character):
+        # type: (GameCharacter) -> bool
+        if game_character.has_attacked:
+            return False
+
+        attack: tuple or None = self.get_controller(game_character).choose_attack(self, game_character)
+        return attack is not None and self.attack(game_character, attack[0], attack[1])
+
+    def take_turn(self, game_character):
+        # type: (GameCharacter) -> None
+        """
+        This method makes a game character buy a rune (heroes only), move, and attack as decided by its controller.
+        :param game_character: the game character having its turn
+        :return: None
+        """
+        if isinstance(game_character, Hero):
+            self.buy_rune(game_character)
+
+        self.move(game_character)
+        self.make_attack(game_character)
+
+    def run_shop_stage(self, team):
+        # type: (Team) -> None
+        for hero in team.battle_squad.get_heroes():
+            if hero.get_is_alive():
+                self.buy_rune(hero)
+
+    def run_move_stage(self, team):
+        # type: (Team) -> None
+        for hero in team.battle_squad.get_heroes():
+            if hero.get_is_alive():
+                self.move(hero)
+
+    def run_attack_stage(self, team):
+        # type: (Team) -> None
+        for hero in team.battle_squad.get_heroes():
+            if hero.get_is_alive():
+                self.make_attack(hero)
+
+    def run_villagers_stage(self, team):
+        # type: (Team) -> None
+        for villager in team.battle_squad.get_villagers():
+            if villager.get_is_alive():
+                self.move(villager)
+                self.make_attack(villager)
+
+    def run_towers_stage(self, team):
+        # type: (Team) -> None
+        for defense_tower in team.battle_squad.get_defense_towers():
+            if defense_tower.get_is_alive():
+                target: GameCharacter or None = self.get_controller(defense_tower).choose_tower_target(self,
+                                                                                                      defense_tower)
+                if target is not None:
+                    self.attack(defense_tower, target)
+
+    def run_upkeep_stage(self, team):
+        # type: (Team) -> None
+        """
+        This method restores the moved and attacked statuses of the units in the team, gives battle coins to the
+        players controlling its heroes, and heals its living game characters.
+        :param team: the team whose turn it is
+        :return: None
+        """
+        if self.__array_state is not None:
+            self.battle_coin_production_rate = self.__array_state.upkeep(self.get_teams().index(team), self.turn,
+                                                                         self.battle_coin_production_rate)
+            if self.battlefield.zobrist_hash is not None:
+                self.battlefield.update_unit_hash(*self.get_units(team))
+            return
+
+        for hero in team.battle_squad.get_heroes():
+            hero.restore_moved_status()
+            hero.restore_attacked_status()
+            self.battle_coin_production_rate *= LogNumber.power_of_ten(self.turn)
+            hero.controlling_player.battle_coins += self.battle_coin_production_rate
+            if hero.get_is_alive():
+                hero.heal()
+
+        for villager in team.battle_squad.get_villagers():
+            villager.restore_moved_status()
+            villager.restore_attacked_status()
+            if villager.get_is_alive():
+                villager.heal()
+
+        for defense_tower in team.battle_squad.get_defense_towers():
+            defense_tower.restore_attacked_status()
+
+        self.battlefield.update_unit_hash(*self.get_units(team))
+
+    def run_respawn_stage(self, team):
+        # type: (Team) -> None
+        """
+        This method respawns the game characters of the opposing team which have died during the team's turn.
+        :param team: the team whose turn it is
+        :return: None
+        """
+        opposing_team: Team = self.get_opposing_team(team)
+        dead_game_characters: list = []  # initial value
+        if self.__array_state is not None:
+            dead_game_characters = self.__array_state.get_dead_game_characters(self.get_teams().index(opposing_team))
+        else:
+            dead_game_characters = [game_character for game_character in opposing_team.battle_squad.get_heroes() +
+                                    opposing_team.battle_squad.get_villagers() if not game_character.get_is_alive()]
+
+        for game_character in dead_game_characters:
+            self.__spawn_at_random_tile(game_character)
+
+    def run_stages(self, team, stage_names):
+        # type: (Team, tuple) -> None
+        """
+        This method runs some of the stages of a turn for a team, e.g. to finish a turn which has been started.
+        :param team: the team whose turn it is
+        :param stage_names: names of the stages to run in order
+        :return: None
+        """
+        for stage_name in stage_names:
+            self.__stages[stage_name](self, team)
+
+    def step(self):
+        # type: () -> bool
+        """
+        This method runs a single turn of the battle for the team whose turn it is.
+        :return: whether the battle is still going on after the turn
+        """
+        if self.is_over():
+            return False
+
+        team: Team = self.get_acting_team()
+        self.turn += 1
+        for stage_name, stage in self.__stages.items():
+            if self.__stage_times is None:
+                stage(self, team)
+            else:
+                start_time: float = time.perf_counter()
+                stage(self, team)
+                self.__stage_times[stage_name] += time.perf_counter() - start_time
+
+        return not self.is_over()
+
+    def finish(self):
+        # type: () -> Team or None
+        """
+        This method gives rewards to the players and restores their heroes once the battle is over.
+        :return: the team which won the battle, or None if the battle has not been won by any team
+        """
+        if self.has_finished:
+            return self.winner
+
+        if self.team1.battle_squad.all_died():
+            self.winner = self.team2
+        elif self.team2.battle_squad.all_died():
+            self.winner = self.team1
+
+        if self.winner is not None:
+            for hero in self.winner.battle_squad.get_heroes():
+                corresponding_player: Player = hero.controlling_player
+                corresponding_player.global_coins += LogNumber.power_of_ten(hero.kills)
+                corresponding_player.wins += 1
+
+            for hero in self.get_opposing_team(self.winner).battle_squad.get_heroes():
+                corresponding_player: Player = hero.controlling_player
+                corresponding_player.global_coins += LogNumber.power_of_ten(hero.kills // 5)
+                corresponding_player.loses += 1
+
+        if self.__array_state is not None:
+            self.__array_state.unbind()
+            self.__array_state = None
+
+        for team in self.get_teams():
+            for hero in team.battle_squad.get_heroes():
+                hero.restore_to_initial()
+                hero.controlling_player.restore_battle_coins()
+                hero.controlling_player.update_rank()
+
+        self.has_finished = True
+        return self.winner
+
+    def run_until_done(self, max_turns=None):
+        # type: (int or None) -> Team or None
+        while self.step():
+            if max_turns is not None and self.turn >= max_turns:
+                break
+
+        return self.finish()
+
+
+# Creating benchmarks used to measure how fast battles are simulated
+
+
+def generate_random_cpu_battle(seed, battlefield_width=None, battlefield_height=None,
+                               num_heroes=BattleSquad.NUM_HEROES, num_villagers=BattleSquad.NUM_VILLAGERS,
+                               num_defense_towers=BattleSquad.NUM_DEFENSE_TOWERS, profile_stages=False,
+                               use_array_state=False):
+    # type: (int, int or None, int or None, int, int, int, bool, bool) -> BattleEngine
+    battle_random: BattleRandom = BattleRandom(seed)
+    cpu_players: list = [generate_random_cpu_player(battle_random.generation) for i in range(2 * num_heroes)]
+    heroes: list = [cpu_player.hero_to_control for cpu_player in cpu_players]
+    return generate_random_battle(heroes[:num_heroes], heroes[num_heroes:], battle_random, battlefield_width,
+                                  battlefield_height, num_villagers, num_defense_towers, profile_stages,
+                                  use_array_state)
+
+
+def benchmark_numeric_backends(num_attacks=20000, num_battles=10, seed=0, max_turns=1000):
+    # type: (int, int, int, int) -> dict
+    """
+    This function compares the numeric backends on identical seeded attacks and battles.
+    :param num_attacks: number of attacks simulated by each backend
+    :param num_battles: number of CPU versus CPU battles simulated by each backend
+    :param seed: seed of the first battle
+    :param max_turns: maximum number of turns in each battle
+    :return: a dictionary mapping names of numeric backends to attacks per second and battles per second
+    """
+    previous_backend: NumericBackend = numeric_backend
+    results: dict = {}  # initial value
+    try:
+        for name in NUMERIC_BACKENDS:
+            set_numeric_backend(name)
+            engine: BattleEngine = generate_random_cpu_battle(seed)
+            attacker: Hero = engine.team1.battle_squad.get_heroes()[0]
+            target: GameCharacter = engine.team2.battle_squad.get_villagers()[0]
+            battlefield: Battlefield = Battlefield(generate_random_name())
+            attacker.spawn(0, 0, battlefield)
+            target.spawn(1, 0, battlefield)
+            skills: list = [None] + attacker.get_skills()
+            start_time: float = time.perf_counter()
+            for i in range(num_attacks):
+                target.curr_hp = target.max_hp
+                attacker.attack(target, battlefield, skills[i % len(skills)])
+
+            attack_time: float = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for i in range(num_battles):
+                generate_random_cpu_battle(seed + i).run_until_done(max_turns)
+
+            battle_time: float = time.perf_counter() - start_time
+            results[name] = (num_attacks / attack_time, num_battles / battle_time)
+    finally:
+        set_numeric_backend(previous_backend.name)
+
+    for name, (attacks_per_second, battles_per_second) in results.items():
+        print(name.ljust(8) + str(round(attacks_per_second)).rjust(12) + " attacks/sec" +
+              str(round(battles_per_second, 2)).rjust(12) + " battles/sec")
+
+    return results
+
+
+def benchmark_battle_snapshots(num_copies=200, seed=0, num_turns=20):
+    # type: (int, int, int) -> dict
+    """
+    This function compares taking and restoring battle snapshots against deep copying the battle engine.
+    :param num_copies: number of copies made by each method
+    :param seed: seed of the battle
+    :param num_turns: number of turns played before copying
+    :return: a dictionary mapping names of methods to copies per second
+    """
+    engine: BattleEngine = generate_random_cpu_battle(seed)
+    for i in range(num_turns):
+        engine.step()
+
+    start_time: float = time.perf_counter()
+    for i in range(num_copies):
+        copy.deepcopy(engine)
+
+    deepcopy_time: float = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for i in range(num_copies):
+        engine.restore(engine.snapshot())
+
+    snapshot_time: float = time.perf_counter() - start_time
+    results: dict = {"deepcopy": num_copies / deepcopy_time, "snapshot and restore": num_copies / snapshot_time}
+    for name, copies_per_second in results.items():
+        print(name.ljust(24) + str(round(copies_per_second)).rjust(12) + " copies/sec")
+
+    return results
+
+
+def benchmark_battlefield_sizes(sizes=(20, 200, 1000), num_turns=200, seed=0):
+    # type: (tuple, int, int) -> dict
+    """
+    This function measures how much memory battlefields of different sizes take and how fast turns are played on them.
+    :param sizes: widths (and heights) of the battlefields
+    :param num_turns: number of turns played on each battlefield
+    :param seed: seed of the battles
+    :return: a dictionary mapping sizes to the peak memory used in bytes and turns per second
+    """
+    results: dict = {}  # initial value
+    for size in sizes:
+        # Memory is traced on one copy of the battle and turns are timed on another, since tracing slows them down
+        tracemalloc.start()
+        engine: BattleEngine = generate_random_cpu_battle(seed, battlefield_width=size, battlefield_height=size)
+        for i in range(num_turns):
+            if not engine.step():
+                break
+
+        peak_memory: int = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        engine = generate_random_cpu_battle(seed, battlefield_width=size, battlefield_height=size)
+        start_time: float = time.perf_counter()
+        for i in range(num_turns):
+            if not engine.step():
+                break
+
+        turns_per_second: float = engine.turn / (time.perf_counter() - start_time)
+        results[size] = (peak_memory, turns_per_second)
+        print((str(size) + "x" + str(size)).ljust(12) + ("sparse" if engine.battlefield.is_sparse else "dense").ljust(8)
+              + str(round(peak_memory / 1024)).rjust(10) + " KiB" + str(round(turns_per_second)).rjust(10) +
+              " turns/sec")
+
+    return results
+
+
+def benchmark_squad_sizes(squad_sizes=((5, 5), (10, 40), (25, 100), (50, 200)), num_turns=100, seed=0):
+    # type: (tuple, int, int) -> dict
+    """
+    This function measures how long turns take in battles between squads of different sizes, and plots the time per
+    turn against the number of units.
+    :param squad_sizes: pairs of the number of heroes and the number of villagers in each squad
+    :param num_turns: number of turns played in each battle
+    :param seed: seed of the battles
+    :return: a dictionary mapping pairs of squad sizes to milliseconds per turn
+    """
+    results: dict = {}  # initial value
+    for num_heroes, num_villagers in squad_sizes:
+        engine: BattleEngine = generate_random_cpu_battle(seed, num_heroes=num_heroes, num_villagers=num_villagers)
+        start_time: float = time.perf_counter()
+        for i in range(num_turns):
+            if not engine.step():
+                break
+
+        results[(num_heroes, num_villagers)] = (time.perf_counter() - start_time) * 1000 / max(engine.turn, 1)
+
+    longest_time: float = max(results.values())
+    for (num_heroes, num_villagers), milliseconds_per_turn in results.items():
+        print((str(num_heroes) + "v" + str(num_heroes) + " + " + str(num_villagers) + " villagers").ljust(24) +
+              str(round(milliseconds_per_turn, 3)).rjust(10) + " ms/turn  " +
+              "#" * max(1, round(40 * milliseconds_per_turn / longest_time)))
+
+    return results
+
+
+def benchmark_array_battle_states(squad_sizes=((5, 5), (10, 40), (25, 100), (50, 200), (100, 1000)), num_turns=100,
+                                  seed=0):
+    # type: (tuple, int, int) -> dict
+    """
+    This function measures how long the upkeep stage, the respawn stage, and whole turns take in battles between
+    squads of different sizes, with units storing their state as attributes and in an array battle state. Battles are
+    played with the FLOAT numeric backend, which array battle states need.
+    :param squad_sizes: pairs of the number of heroes and the number of villagers in each squad
+    :param num_turns: number of turns played in each battle
+    :param seed: seed of the battles
+    :return: a dictionary mapping (storage, number of heroes, number of villagers) to microseconds per turn spent in
+    the upkeep stage, in the respawn stage, and in whole turns
+    """
+    previous_backend: NumericBackend = numeric_backend
+    results: dict = {}  # initial value
+    try:
+        set_numeric_backend("FLOAT")
+        for num_heroes, num_villagers in squad_sizes:
+            for storage_name, use_array_state in (("attributes", False), ("array state", True)):
+                engine: BattleEngine = generate_random_cpu_battle(seed, num_heroes=num_heroes,
+                                                                  num_villagers=num_villagers, profile_stages=True,
+                                                                  use_array_state=use_array_state)
+                while engine.turn < num_turns and engine.step():
+                    pass
+
+                stage_times: dict = engine.get_stage_times()
+                microseconds_per_turn: tuple = tuple(seconds * 1000000 / max(engine.turn, 1) for seconds in (
+                    stage_times["upkeep"], stage_times["respawn"], sum(stage_times.values())))
+                results[(storage_name, num_heroes, num_villagers)] = microseconds_per_turn
+                engine.finish()
+                print((str(num_heroes) + "v" + str(num_heroes) + " + " + str(num_villagers) + " villagers").ljust(26)
+                      + storage_name.ljust(12) + str(round(microseconds_per_turn[0], 1)).rjust(10) + " us upkeep" +
+                      str(round(microseconds_per_turn[1], 1)).rjust(10) + " us respawn" +
+                      str(round(microseconds_per_turn[2], 1)).rjust(12) + " us/turn")
+    finally:
+        set_numeric_backend(previous_backend.name)
+
+    return results
+
+
+def benchmark_turn_stages(num_battles=10, seed=0, max_turns=1000):
+    # type: (int, int, int) -> dict
+    """
+    This function profiles how long each stage of the turns in seeded CPU versus CPU battles takes.
+    :param num_battles: number of battles played
+    :param seed: seed of the first battle
+    :param max_turns: maximum number of turns in each battle
+    :return: a dictionary mapping names of stages to the total seconds spent in them
+    """
+    results: dict = {stage_name: 0.0 for stage_name in BattleEngine.STAGE_NAMES}
+    num_turns: int = 0  # initial value
+    for i in range(num_battles):
+        engine: BattleEngine = generate_random_cpu_battle(seed + i, profile_stages=True)
+        while engine.turn < max_turns and engine.step():
+            pass
+
+        num_turns += engine.turn
+        for stage_name, seconds in engine.get_stage_times().items():
+            results[stage_name] += seconds
+        engine.finish()
+
+    total_seconds: float = sum(results.values())
+    for stage_name, seconds in results.items():
+        print(stage_name.ljust(12) + str(round(seconds * 1000000 / max(num_turns, 1), 2)).rjust(10) +
+              " us/turn" + str(round(100 * seconds / total_seconds if total_seconds > 0 else 0, 1)).rjust(8) + "%")
+
+    return results
+
+
+def benchmark_mcts(time_budgets=(0.005, 0.02, 0.05), num_battles=4, seed=0, max_turns=200):
+    # type: (tuple, int, int, int) -> dict
+    """
+    This function measures how many playouts the Monte Carlo tree search of CPU controlled players runs per second,
+    and how often team 1 wins seeded battles when its heroes search with each time budget against random decisions.
+    :param time_budgets: seconds searched for each hero's turn
+    :param num_battles: number of battles played with each time budget
+    :param seed: seed of the first battle
+    :param max_turns: maximum number of turns in each battle
+    :return: a dictionary mapping time budgets to playouts per second and the fraction of battles won by team 1
+    """
+    results: dict = {}  # initial value
+    for time_budget in (None,) + tuple(time_budgets):
+        mcts_controller: MCTSController = MCTSController(time_budget if time_budget is not None else 0)
+        num_wins: int = 0  # initial value
+        for i in range(num_battles):
+            engine: BattleEngine = generate_random_cpu_battle(seed + i)
+            if time_budget is not None:
+                for hero in engine.team1.battle_squad.get_heroes():
+                    engine.set_controller(hero, mcts_controller)
+
+            if engine.run_until_done(max_turns) is engine.team1:
+                num_wins += 1
+
+        results[time_budget] = (mcts_controller.get_playouts_per_second(), num_wins / num_battles)
+        print(("random" if time_budget is None else str(round(time_budget * 1000)) + " ms/turn").ljust(16) +
+              str(round(results[time_budget][0])).rjust(8) + " playouts/sec" +
+              str(round(100 * results[time_budget][1], 1)).rjust(8) + "% won by team 1" +
+              str(round(100 * mcts_controller.transposition_table.get_hit_rate(), 1)).rjust(8) + "% table hits")
+
+    return results
+
+
+def benchmark_cpu_policies(num_battles=20, seed=0, max_turns=1000):
+    # type: (int, int, int) -> dict
+    """
+    This function measures how fast seeded battles are simulated with each policy of CPU controlled players, and how
+    often team 1 wins when only its heroes and villagers follow each policy while team 2 makes random decisions.
+    Each team moves first in half of the battles.
+    :param num_battles: number of battles played with each policy
+    :param seed: seed of the first battle
+    :param max_turns: maximum number of turns in each battle
+    :return: a dictionary mapping names of policies to battles per second and the fraction of battles won by team 1
+    """
+    results: dict = {}  # initial value
+    for name, policy in CPU_POLICIES.items():
+        num_wins: int = 0  # initial value
+        num_turns: int = 0  # initial value
+        start_time: float = time.perf_counter()
+        for i in range(num_battles):
+            engine: BattleEngine = generate_random_cpu_battle(seed + i)
+            engine.first_team = engine.team2 if (seed + i) % 2 == 1 else engine.team1
+            controller: BattleController = policy()
+            for unit in engine.team1.battle_squad.get_heroes() + engine.team1.battle_squad.get_villagers() + \
+                    engine.team1.battle_squad.get_defense_towers():
+                engine.set_controller(unit, controller)
+
+            if engine.run_until_done(max_turns) is engine.team1:
+                num_wins += 1
+            num_turns += engine.turn
+
+        results[name] = (num_battles / (time.perf_counter() - start_time), num_wins / num_battles)
+        print(name.ljust(8) + str(round(results[name][0], 2)).rjust(10) + " battles/sec" +
+              str(round(num_turns / num_battles, 1)).rjust(10) + " turns/battle" +
+              str(round(100 * results[name][1], 1)).rjust(8) + "% won by team 1")
+
+    return results
+
+
+def benchmark_damage_cache(num_battles=4, seed=0, max_turns=200):
+    # type: (int, int, int) -> dict
+    """
+    This function measures how fast the damage of every attack of each team on the other is found in every turn of
+    seeded battles between CPU controlled players making random decisions, when it is computed each time and when it
+    is looked up in an expected damage cache.
+    :param num_battles: number of battles played
+    :param seed: seed of the first battle
+    :param max_turns: maximum number of turns in each battle
+    :return: a dictionary mapping "computed" and "cached" to lookups of the damage of all attacks per second, and
+    "hit rate" to the fraction of attacks found in the cache
+    """
+    damage_cache: ExpectedDamageCache = ExpectedDamageCache()
+    computed_time: float = 0  # initial value
+    cached_time: float = 0  # initial value
+    num_lookups: int = 0  # initial value
+    for i in range(num_battles):
+        engine: BattleEngine = generate_random_cpu_battle(seed + i)
+        while engine.step() and engine.turn < max_turns:
+            for team in engine.get_teams():
+                attackers: list = [game_character for game_character in team.battle_squad.get_heroes() +
+                                   team.battle_squad.get_villagers() if game_character.get_is_alive()]
+                targets: list = [unit for unit in BattleEngine.get_units(engine.get_opposing_team(team))
+                                 if unit.get_is_alive()]
+                if len(attackers) == 0 or len(targets) == 0:
+                    continue
+
+                start_time: float = time.perf_counter()
+                compute_expected_damages(attackers, targets)
+                get_usable_skills(attackers)
+                computed_time += time.perf_counter() - start_time
+                start_time = time.perf_counter()
+                damage_cache.get_damages(attackers, targets)
+                cached_time += time.perf_counter() - start_time
+                num_lookups += 1
+
+        engine.finish()
+
+    results: dict = {"computed": num_lookups / computed_time, "cached": num_lookups / cached_time,
+                     "hit rate": damage_cache.get_hit_rate()}
+    for name in ("computed", "cached"):
+        print(name.ljust(10) + str(round(results[name])).rjust(10) + " lookups/sec")
+    print(str(round(100 * results["hit rate"], 1)) + "% of attacks found in the cache")
+    return results
+
+
+def benchmark_parallel_mcts(worker_counts=(1, 2, 4, os.cpu_count()), time_budget=0.05, num_searches=20, seed=0):
+    # type: (tuple, float, int, int) -> dict
+    """
+    This function measures how many playouts the Monte Carlo tree search of CPU controlled players runs for each
+    hero's turn within the same time budget with different numbers of worker processes.
+    :param worker_counts: numbers of processes searching each turn
+    :param time_budget: seconds searched for each hero's turn
+    :param num_searches: number of turns searched with each number of processes
+    :param seed: seed of the battle searched
+    :return: a dictionary mapping numbers of processes to playouts per turn
+    """
+    results: dict = {}  # initial value
+    for num_workers in sorted(set(worker_counts)):
+        engine: BattleEngine = generate_random_cpu_battle(seed)
+        mcts_controller: MCTSController = MCTSController(time_budget, num_workers=num_workers)
+        try:
+            # The first search starts the worker processes, so it is not measured
+            heroes: list = engine.team1.battle_squad.get_heroes()
+            mcts_controller.search(engine, heroes[0])
+            num_playouts: int = mcts_controller.num_playouts
+            for i in range(num_searches):
+                mcts_controller.search(engine, heroes[i % len(heroes)])
+        finally:
+            mcts_controller.close()
+
+        results[num_workers] = (mcts_controller.num_playouts - num_playouts) / num_searches
+        print((str(num_workers) + " workers").ljust(12) + str(round(results[num_workers], 1)).rjust(10) +
+              " playouts/turn" + str(round(results[num_workers] / results[min(results)], 2)).rjust(8) + "x")
+
+    return results
+
+
+def generate_random_game_data(num_players, seed=0):
+    # type: (int, int) -> Game
+    """
+    This function generates saved game data with human players who have bought upgrades and played a battle, so that
+    they still refer to the team they were last in.
+    :param num_players: number of human players
+    :param seed: seed of the random number generator used to generate the players
+    :return: the generated game data
+    """
+    rng: random.Random = random.Random(seed)
+    human_players: list = []  # initial value
+    for i in range(num_players):
+        human_player: HumanPlayer = HumanPlayer(generate_random_name(rng) + str(i))
+        hero: Hero = generate_random_hero(human_player.name, rng)
+        hero.controlling_player = human_player
+        human_player.hero_to_control = hero
+        human_player.global_coins = LogNumber.power_of_ten(rng.randint(5, 30))
+        human_player.wins = rng.randint(0, 3000)
+        human_player.loses = rng.randint(0, 3000)
+        human_player.update_rank()
+        for j in range(rng.randint(0, 3)):
+            human_player.buy_upgrade(Upgrade("Upgrade #" + str(j + 1), to_number("1.2"), to_number("1.2"),
+                                             to_number("1.2"), to_number("1.2"), to_number("150"), to_number("150"),
+                                             to_number("0.2"), LogNumber.power_of_ten(5 + j)))
+
+        human_players.append(human_player)
+
+    for i in range(0, num_players - BattleSquad.NUM_HEROES + 1, BattleSquad.NUM_HEROES):
+        team: Team = generate_random_team([human_player.hero_to_control
+                                           for human_player in human_players[i:i + BattleSquad.NUM_HEROES]],
+                                          "Team " + str(i // BattleSquad.NUM_HEROES % 2 + 1), rng)
+        for human_player in human_players[i:i + BattleSquad.NUM_HEROES]:
+            human_player.corresponding_team = team
+
+    return Game(human_players)
+
+
+def benchmark_save_formats(player_counts=(10, 100, 1000), file_name="BATTLELAND SAVE BENCHMARK"):
+    # type: (tuple, str) -> dict
+    """
+    This function compares saving and loading game data as a pickle of the whole game object graph against the
+    current save format for different numbers of human players.
+    :param player_counts: numbers of human players in the game data
+    :param file_name: name of the temporary file the game data is saved in
+    :return: a dictionary mapping (format, number of players) to (save time, load time, file size)
+    """
+    results: dict = {}  # initial value
+    try:
+        for num_players in player_counts:
+            game_data: Game = generate_random_game_data(num_players)
+            for format_name in ("pickle", "json lines"):
+                start_time: float = time.perf_counter()
+                if format_name == "pickle":
+                    with open(file_name, "wb") as file:
+                        pickle.dump(game_data, file)
+                else:
+                    save_game_data(game_data, file_name)
+
+                save_time: float = time.perf_counter() - start_time
+                start_time = time.perf_counter()
+                load_game_data(file_name)
+                load_time: float = time.perf_counter() - start_time
+                results[(format_name, num_players)] = (save_time, load_time, os.path.getsize(file_name))
+                print(format_name.ljust(12) + str(num_players).rjust(8) + " players" +
+                      str(round(save_time * 1000, 2)).rjust(12) + " ms save" +
+                      str(round(load_time * 1000, 2)).rjust(12) + " ms load" +
+                      str(os.path.getsize(file_name)).rjust(12) + " bytes")
+    finally:
+        if os.path.exists(file_name):
+            os.remove(file_name)
+
+    return results
+
+
+def benchmark_journaled_saves(num_players=1000, num_changed_players=10, num_saves=20,
+                              file_name="BATTLELAND JOURNAL BENCHMARK"):
+    # type: (int, int, int, str) -> dict
+    """
+    This function compares saving the whole game data against journaling the players which changed after a battle.
+    :param num_players: number of human players in the game data
+    :param num_changed_players: number of human players changed between saves
+    :param num_saves: number of saves made with each method
+    :param file_name: name of the temporary file the game data is saved in
+    :return: a dictionary mapping names of methods to saves per second
+    """
+    game_data: Game = generate_random_game_data(num_players)
+    human_players: list = game_data.get_human_players()
+    save_journal: SaveJournal = SaveJournal(file_name, compaction_threshold=num_saves * num_changed_players + 1)
+    results: dict = {}  # initial value
+    try:
+        save_journal.compact(game_data)
+        for method_name in ("whole game data", "journal"):
+            start_time: float = time.perf_counter()
+            for i in range(num_saves):
+                changed_players: list = [human_players[(i * num_changed_players + j) % num_players]
+                                         for j in range(num_changed_players)]
+                for human_player in changed_players:
+                    human_player.wins += 1
+                    human_player.global_coins += LogNumber.power_of_ten(5)
+
+                if method_name == "journal":
+                    save_journal.save_players(game_data, changed_players)
+                else:
+                    save_game_data(game_data, file_name)
+
+            results[method_name] = num_saves / (time.perf_counter() - start_time)
+            print(method_name.ljust(16) + str(round(results[method_name], 2)).rjust(12) + " saves/sec")
+    finally:
+        for curr_file_name in (file_name, save_journal.journal_file_name):
+            if os.path.exists(curr_file_name):
+                os.remove(curr_file_name)
+
+    return results
+
+
+def benchmark_player_stores(player_counts=(100, 1000, 10000), file_name="BATTLELAND STORE BENCHMARK"):
+    # type: (tuple, str) -> dict
+    """
+    This function compares how long it takes to start the game and look up a human player when human players are
+    saved in a file against when they are saved in a SQLite database, for different numbers of human players.
+    :param player_counts: numbers of human players saved
+    :param file_name: name of the temporary file the human players are saved in
+    :return: a dictionary mapping (storage, number of players) to seconds taken
+    """
+    results: dict = {}  # initial value
+    file_names: list = [file_name, file_name + SaveJournal.JOURNAL_FILE_SUFFIX, file_name + ".sqlite3"]
+    try:
+        for num_players in player_counts:
+            game_data: Game = generate_random_game_data(num_players)
+            name_to_find: str = game_data.get_human_players()[num_players // 2].name
+            SaveJournal(file_name).compact(game_data)
+            player_store: SQLitePlayerStore = SQLitePlayerStore(file_name + ".sqlite3")
+            player_store.save_players(game_data, game_data.get_human_players())
+            player_store.close()
+            for storage_name in ("file", "sqlite"):
+                start_time: float = time.perf_counter()
+                storage: SaveJournal or SQLitePlayerStore = SaveJournal(file_name) if storage_name == "file" \
+                    else SQLitePlayerStore(file_name + ".sqlite3")
+                storage.load().get_human_player_by_name(name_to_find)
+                results[(storage_name, num_players)] = time.perf_counter() - start_time
+                if isinstance(storage, SQLitePlayerStore):
+                    storage.close()
+
+                print(storage_name.ljust(8) + str(num_players).rjust(8) + " players" +
+                      str(round(results[(storage_name, num_players)] * 1000, 2)).rjust(12) + " ms to start and look up")
+
+            for curr_file_name in file_names:
+                os.remove(curr_file_name)
+    finally:
+        for curr_file_name in file_names:
+            if os.path.exists(curr_file_name):
+                os.remove(curr_file_name)
+
+    return results
+
+
+def benchmark_autosave(player_counts=(1000, 10000), num_changed_players=10, file_name="BATTLELAND AUTOSAVE BENCHMARK"):
+    # type: (tuple, int, str) -> dict
+    """
+    This function compares how long the game waits for game data to be saved after a battle when the journal is
+    compacted straight away against when it is compacted by an autosave worker, for different numbers of players.
+    :param player_counts: numbers of human players in the game data
+    :param num_changed_players: number of human players changed by the battle
+    :param file_name: name of the temporary file the game data is saved in
+    :return: a dictionary mapping (method, number of players) to seconds the game waits
+    """
+    results: dict = {}  # initial value
+    file_names: list = [file_name, file_name + SaveJournal.JOURNAL_FILE_SUFFIX,
+                        file_name + SaveJournal.JOURNAL_FILE_SUFFIX + SaveJournal.COMPACTING_JOURNAL_FILE_SUFFIX]
+    try:
+        for num_players in player_counts:
+            save_game_data(generate_random_game_data(num_players), file_name)
+            for method_name in ("foreground", "background"):
+                save_journal: SaveJournal = SaveJournal(file_name, compact_in_background=method_name == "background")
+                game_data: Game = save_journal.load()
+                changed_players: list = game_data.get_human_players()[:num_changed_players]
+                for human_player in changed_players:
+                    human_player.wins += 1
+
+                start_time: float = time.perf_counter()
+                save_journal.save_players(game_data, changed_players)
+                save_journal.compact(game_data)
+                results[(method_name, num_players)] = time.perf_counter() - start_time
+                save_journal.close()
+                print(method_name.ljust(12) + str(num_players).rjust(8) + " players" +
+                      str(round(results[(method_name, num_players)] * 1000, 2)).rjust(12) + " ms waited")
+    finally:
+        for curr_file_name in file_names:
+            if os.path.exists(curr_file_name):
+                os.remove(curr_file_name)
+
+    return results
+
+
+# Creating a batch simulation runner used to play many CPU versus CPU battles across all cores
+
+
+class BattleResult:
+    """
+    This class contains attributes of the compact outcome of a simulated battle, which is what simulation workers send
+    back instead of the battle itself.
+    """
+
+    __slots__ = ("seed", "winner", "turns", "num_attacks", "team1_kills", "team2_kills")
+
+    def __init__(self, seed, winner, turns, num_attacks, team1_kills, team2_kills):
+        # type: (int, int, int, int, int, int) -> None
+        self.seed: int = seed
+        self.winner: int = winner  # 1 or 2 for the winning team, 0 if no team won
+        self.turns: int = turns
+        self.num_attacks: int = num_attacks
+        self.team1_kills: int = team1_kills
+        self.team2_kills: int = team2_kills
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        return isinstance(other, BattleResult) and all(getattr(self, field) == getattr(other, field)
+                                                       for field in self.__slots__)
+
+    def __str__(self):
+        # type: () -> str
+        return "Seed: " + str(self.seed) + ", Winner: " + ("Team " + str(self.winner) if self.winner else "None") + \
+            ", Turns: " + str(self.turns) + ", Attacks: " + str(self.num_attacks) + ", Kills: " + \
+            str(self.team1_kills) + "-" + str(self.team2_kills)
+
+
+def simulate_battle(seed, max_turns=1000, cpu_policy="RANDOM"):
+    # type: (int, int, str) -> BattleResult
+    engine: BattleEngine = generate_random_cpu_battle(seed)
+    # Team 2 moves first in battles with odd seeds, so that neither team has the advantage of moving first
+    engine.first_team = engine.team2 if seed % 2 == 1 else engine.team1
+    engine.default_controller = CPU_POLICIES[cpu_policy]()
+    winner: Team or None = engine.run_until_done(max_turns)
+    return BattleResult(seed, 0 if winner is None else 1 if winner is engine.team1 else 2, engine.turn,
+                        engine.num_attacks, sum(hero.kills for hero in engine.team1.battle_squad.get_heroes()),
+                        sum(hero.kills for hero in engine.team2.battle_squad.get_heroes()))
+
+
+def simulate_battles(seeds, max_turns=1000, cpu_policy="RANDOM"):
+    # type: (list, int, str) -> list
+    return [simulate_battle(seed, max_turns, cpu_policy) for seed in seeds]
+
+
+def initialize_simulation_worker(numeric_backend_name):
+    # type: (str) -> None
+    set_numeric_backend(numeric_backend_name)
+
+
+def generate_battle_seeds(num_battles, master_seed=0):
+    # type: (int, int) -> list
+    seed_generator: random.Random = random.Random(master_seed)
+    return [seed_generator.getrandbits(32) for i in range(num_battles)]
+
+
+def iterate_simulated_battles(num_battles, master_seed=0, num_workers=None, max_turns=1000, chunk_size=8,
+                              cpu_policy="RANDOM"):
+    # type: (int, int, int or None, int, int, str) -> iter
+    """
+    This function simulates seeded CPU versus CPU battles in a pool of worker processes and yields their results as
+    they arrive, in the order of the battles. The same master seed always gives the same results, however many
+    workers are used.
+    :param num_battles: number of battles to simulate
+    :param master_seed: seed from which the seed of every battle is generated
+    :param num_workers: number of worker processes, or None to use every core
+    :param max_turns: maximum number of turns in each battle
+    :param chunk_size: number of battles each worker simulates before sending their results back
+    :param cpu_policy: name of the policy CPU controlled players follow (a key of CPU_POLICIES)
+    :return: an iterator over the result of each battle
+    """
+    seeds: list = generate_battle_seeds(num_battles, master_seed)
+    chunks: list = [seeds[i:i + chunk_size] for i in range(0, num_battles, chunk_size)]
+    if num_workers == 1:
+        # Run in this process to avoid the cost of starting a worker
+        for chunk in chunks:
+            yield from simulate_battles(chunk, max_turns, cpu_policy)
+
+        return
+
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=initialize_simulation_worker,
+                             initargs=(numeric_backend.name,)) as executor:
+        for results in executor.map(simulate_battles, chunks, [max_turns] * len(chunks),
+                                    [cpu_policy] * len(chunks)):
+            yield from results
+
+
+def run_simulation(num_battles, master_seed=0, num_workers=None, max_turns=1000, cpu_policy="RANDOM"):
+    # type: (int, int, int or None, int, str) -> list
+    """
+    This function simulates seeded CPU versus CPU battles across all cores and reports how the battles went.
+    :param num_battles: number of battles to simulate
+    :param master_seed: seed from which the seed of every battle is generated
+    :param num_workers: number of worker processes, or None to use every core
+    :param max_turns: maximum number of turns in each battle
+    :param cpu_policy: name of the policy CPU controlled players follow (a key of CPU_POLICIES)
+    :return: a list of the results of the battles
+    """
+    start_time: float = time.perf_counter()
+    results: list = list(iterate_simulated_battles(num_battles, master_seed, num_workers, max_turns,
+                                                   cpu_policy=cpu_policy))
+    elapsed_time: float = time.perf_counter() - start_time
+    for team in range(3):
+        num_wins: int = sum(1 for result in results if result.winner == team)
+        print(("No winner" if team == 0 else "Team " + str(team) + " wins").ljust(16) +
+              str(num_wins).rjust(8) + " (" + str(round(100 * num_wins / max(1, num_battles), 2)) + "%)")
+
+    print("Average turns".ljust(16) + str(round(sum(result.turns for result in results) / max(1, num_battles), 2))
+          .rjust(8))
+    print("Battles/sec".ljust(16) + str(round(num_battles / elapsed_time, 2)).rjust(8))
+    return results
+
+
+def benchmark_simulation(num_battles=64, master_seed=0, max_turns=1000):
+    # type: (int, int, int) -> dict
+    """
+    This function measures how the battles simulated per second scale with the number of worker processes.
+    :param num_battles: number of battles simulated with each number of workers
+    :param master_seed: seed from which the seed of every battle is generated
+    :param max_turns: maximum number of turns in each battle
+    :return: a dictionary mapping numbers of workers to battles per second
+    """
+    results: dict = {}  # initial value
+    num_workers: int = 1
+    max_workers: int = os.cpu_count() or 1
+    expected_results: list or None = None  # initial value
+    while True:
+        start_time: float = time.perf_counter()
+        curr_results: list = list(iterate_simulated_battles(num_battles, master_seed, num_workers, max_turns))
+        results[num_workers] = num_battles / (time.perf_counter() - start_time)
+        if expected_results is None:
+            expected_results = curr_results
+        elif curr_results != expected_results:
+            print("Results with " + str(num_workers) + " workers differ from results with 1 worker!")
+
+        print(str(num_workers).rjust(4) + " workers" + str(round(results[num_workers], 2)).rjust(12) +
+              " battles/sec" + str(round(results[num_workers] / results[1], 2)).rjust(8) + "x")
+        if num_workers == max_workers:
+            break
+
+        num_workers = min(2 * num_workers, max_workers)
+
+    return results
+
+
+BENCHMARKS: dict = {
+    "numeric": benchmark_numeric_backends,
+    "snapshot": benchmark_battle_snapshots,
+    "battlefield": benchmark_battlefield_sizes,
+    "squads": benchmark_squad_sizes,
+    "arraystate": benchmark_array_battle_states,
+    "stages": benchmark_turn_stages,
+    "mcts": benchmark_mcts,
+    "parallelmcts": benchmark_parallel_mcts,
+    "policies": benchmark_cpu_policies,
+    "damagecache": benchmark_damage_cache,
+    "simulation": benchmark_simulation,
+    "save": benchmark_save_formats,
+    "journal": benchmark_journaled_saves,
+    "store": benchmark_player_stores,
+    "autosave": benchmark_autosave
+}
 
 
 # Creating main function to run the game.
 
 
-def main():
+def play_battle(team_1_heroes, team_2_heroes, new_game, player_storage, cpu_controller=None):
+    # type: (list, list, Game, SaveJournal or SQLitePlayerStore, BattleController or None) -> Team or None
+    """
+    This function plays a battle between two teams of heroes on the console, asking the users what the heroes of
+    human players do, and then ranks and saves the players in the battle.
+    :param team_1_heroes: heroes in team 1
+    :param team_2_heroes: heroes in team 2
+    :param new_game: the saved game data
+    :param player_storage: where the players are saved
+    :param cpu_controller: controller of the heroes of CPU controlled players, or None to make random decisions
+    :return: the team which won the battle
+    """
+    engine: BattleEngine = generate_random_battle(team_1_heroes, team_2_heroes)
+    console_controller: ConsoleController = ConsoleController()
+    for hero in team_1_heroes + team_2_heroes:
+        if isinstance(hero.controlling_player, HumanPlayer):
+            engine.set_controller(hero, console_controller)
+        elif cpu_controller is not None:
+            engine.set_controller(hero, cpu_controller)
+
+    print("Team 1:\n" + str(engine.team1))
+    print("Team 2:\n" + str(engine.team2))
+    while not engine.is_over():
+        print("Current representation of the battlefield is as below:\n", str(engine.battlefield))
+        if engine.get_acting_team() is engine.team1:
+            print("It is team one's turn to make moves.")
+        else:
+            print("It is team two's turn to make moves.")
+
+        engine.step()
+
+    winner: Team or None = engine.finish()
+    if winner is engine.team1:
+        print("Team 1 wins the battle!")
+    elif winner is engine.team2:
+        print("Team 2 wins the battle!")
+
+    # Rank and journal the changes to the human players in the battle
+    players_in_battle: list = [hero.controlling_player for hero in team_1_heroes + team_2_heroes]
+    new_game.update_leaderboards(players_in_battle)
+    player_storage.save_players(new_game, players_in_battle)
+    return winner
+
+
+def main(player_storage_name="FILE", cpu_time_budget=None, num_cpu_workers=1, cpu_policy="RANDOM"):
     """
     This main function is used to run the game.
+    :param player_storage_name: either 'FILE' to save human players in a file with a journal of changes, or 'SQLITE'
+    to save them in a SQLite database they are loaded from when they are needed
+    :param cpu_time_budget: seconds CPU controlled players search for each hero's turn, or None to make random
+    decisions
+    :param num_cpu_workers: number of processes searching for CPU controlled players at the same time
+    :param cpu_policy: name of the policy CPU controlled players follow when they do not search
     :return: None
     """
 
@@ -1188,13 +5956,16 @@ def main():
     print("In order to win a battle in this game, your team has to destroy all the opponent's team's buildings.")
     print("This is as villagers and heroes can respawn in this game.")
 
-    # Automatically load saved game data
+    # Automatically load saved game data along with the changes journaled since it was last saved
     file_name: str = "SAVED BATTLELAND GAME PROGRESS"
-    new_game: Game
-    try:
-        new_game = load_game_data(file_name)
-    except FileNotFoundError:
-        new_game = Game([])
+    if os.path.exists(file_name) and migrate_game_data(file_name):
+        print("Saved game data has been converted to the current save format.")
+
+    player_storage: SaveJournal or SQLitePlayerStore = SQLitePlayerStore(file_name + ".sqlite3", file_name) \
+        if player_storage_name == "SQLITE" else SaveJournal(file_name, compact_in_background=True)
+    new_game: Game = player_storage.load()
+    cpu_controller: BattleController = MCTSController(cpu_time_budget, num_workers=num_cpu_workers) \
+        if cpu_time_budget is not None else CPU_POLICIES[cpu_policy]()
 
     print("Enter 'Y' for yes.")
     print("Enter anything else for no.")
@@ -1218,16 +5989,20 @@ def main():
                 print(str(human_player) + "\n")
 
             # Check whether a human player is in the saved game data or not
-            if len(new_game.get_human_players()) == 0:
+            if new_game.get_num_human_players() == 0:
                 # As there are no human players, ask the user to create a human player data
                 print("Sorry, no human players have been saved! Please create new human player data!")
                 name: str = input("Please enter your name: ")
+                while new_game.get_human_player_by_name(name) is not None:
+                    name = input("Sorry, that name has been taken! Please enter your name: ")
+
                 new_human_player: HumanPlayer = HumanPlayer(name)
                 # Creating a hero for the human player to control.
                 new_hero: Hero = generate_random_hero(name)
                 new_hero.controlling_player = new_human_player
                 new_human_player.hero_to_control = new_hero
                 new_game.add_human_player(new_human_player)
+                player_storage.save_players(new_game, [new_human_player])
             else:
                 # Play single player mode
                 print("You are now playing single player mode.")
@@ -1266,1416 +6041,7 @@ def main():
                     team_2_battle_heroes.append(cpu_players[cpu_player_index].hero_to_control)
                     cpu_player_index += 1
 
-                team_1_villagers: list = []  # initial value
-                team_2_villagers: list = []  # initial value
-                for i in range(5):
-                    team_1_villagers.append(generate_random_game_character(generate_random_name()))
-                    team_2_villagers.append(generate_random_game_character(generate_random_name()))
-
-                team_1_battle_towers: list = []  # initial value
-                team_2_battle_towers: list = []  # initial value
-                for i in range(3):
-                    team_1_battle_towers.append(generate_random_battle_tower(generate_random_name()))
-                    team_2_battle_towers.append(generate_random_battle_tower(generate_random_name()))
-
-                team_1_town_center: TownCenter = generate_random_building(generate_random_name())
-                team_2_town_center: TownCenter = generate_random_building(generate_random_name())
-                team1: Team = Team(BattleSquad(team_1_battle_heroes, team_1_villagers, team_1_battle_towers,
-                                               team_1_town_center))
-                team2: Team = Team(BattleSquad(team_2_battle_heroes, team_2_villagers, team_2_battle_towers,
-                                               team_2_town_center))
-                for hero in team1.battle_squad.get_heroes():
-                    player: Player = hero.controlling_player
-                    player.corresponding_team = team1
-
-                for hero in team2.battle_squad.get_heroes():
-                    player: Player = hero.controlling_player
-                    player.corresponding_team = team2
-
-                print("Team 1:\n" + str(team1))
-                print("Team 2:\n" + str(team2))
-
-                # Starting the battle by spawning the heroes, villagers, battle towers, and town centers
-                battlefield: Battlefield = Battlefield(generate_random_name())
-                for hero in team1.battle_squad.get_heroes():
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    hero.spawn(x, y, battlefield)
-
-                for hero in team2.battle_squad.get_heroes():
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    hero.spawn(x, y, battlefield)
-
-                for villager in team1.battle_squad.get_villagers():
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    villager.spawn(x, y, battlefield)
-
-                for villager in team2.battle_squad.get_villagers():
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    villager.spawn(x, y, battlefield)
-
-                for defense_tower in team1.battle_squad.get_defense_towers():
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    defense_tower.spawn(x, y, battlefield)
-
-                for defense_tower in team2.battle_squad.get_defense_towers():
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    defense_tower.spawn(x, y, battlefield)
-
-                x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                    x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile = battlefield.get_tiles()[y][x]
-
-                team1.battle_squad.town_center.spawn(x, y, battlefield)
-                x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                    x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile = battlefield.get_tiles()[y][x]
-
-                team2.battle_squad.town_center.spawn(x, y, battlefield)
-
-                # Initialising the battlefield shop and the rate at which battle coins are added to each player
-                runes: list = []  # initial value
-                for i in range(20):
-                    curr_rune: Rune = Rune("Rune #" + str(i + 1), mpf("0.2") * (i + 1), mpf("0.2") * (i + 1),
-                                            mpf("0.2") * (i + 1), mpf("0.2") * (i + 1), mpf("150") * (i + 1),
-                                            mpf("150") * (i + 1), mpf("0.2") * (i + 1), mpf("1e5") * (mpf("10") ** i))
-                    runes.append(curr_rune)
-
-                battlefield_shop: BattlefieldShop = BattlefieldShop(runes)
-                battle_coin_production_rate: mpf = mpf("1e5")
-                turn: int = 0  # initial value
-                while not team1.battle_squad.all_died() and not team2.battle_squad.all_died():
-                    turn += 1
-                    if turn % 2 == 1:
-                        print("Current representation of the battlefield is as below:\n", str(battlefield))
-                        print("It is team one's turn to make moves.")
-                        for hero_index in range(5):
-                            whose_turn: Hero = team1.battle_squad.get_heroes()[hero_index]
-                            # Checking whether the player controlling the hero  is a human player or not
-                            if isinstance(whose_turn.controlling_player, HumanPlayer):
-                                # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                curr_player: Player = whose_turn.controlling_player
-                                print("Below is a list of runes sold in the battlefield shop:\n")
-                                for rune in battlefield_shop.get_runes_sold():
-                                    print(str(rune) + "\n")
-
-                                    # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                    curr_player: Player = whose_turn.controlling_player
-                                    print("Below is a list of runes sold in the battlefield shop:\n")
-                                    for rune in battlefield_shop.get_runes_sold():
-                                        print(str(rune) + "\n")
-
-                                print("Enter 'Y' for yes.")
-                                print("Enter anything else for no.")
-                                buy_ask: str = input("Do you want to buy a rune? ")
-                                if buy_ask == "Y":
-                                    rune_index: int = int(
-                                        input("Please enter the index of the rune you want to buy: "))
-                                    while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                        rune_index = int(input("Sorry, invalid input! "
-                                                                "Please enter the index of the rune you want to buy: "))
-
-                                    to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                    if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                        print("You have successfully purchased " + str(to_buy.name) + ".")
-                                        curr_player.buy_rune(to_buy)
-                                    else:
-                                        print("Sorry, insufficient battle coins!")
-
-                                # Ask the user to input x and y coordinates of tile to move the hero to
-                                x: int = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                y: int = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-                                while not whose_turn.move(x, y, battlefield):
-                                    # Ask the user to input x and y coordinates of tile to move the hero to
-                                    print("Invalid move! Please try again!")
-                                    x = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                    y = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                        len(whose_turn.get_skills()) or (0 <= \
-                                                        skill_index < len(whose_turn.get_skills()) and \
-                                                        whose_turn.get_skills()[skill_index].magic_points_cost > \
-                                                        whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                            elif isinstance(whose_turn.controlling_player, CPUPlayer):
-                                # Making the CPU controlled player decide whether to buy a rune or not
-                                curr_player: Player = whose_turn.controlling_player
-                                if random.random() <= 0.75:
-                                    rune_index: int = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-                                    while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                        rune_index = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-
-                                    to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                    if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                        curr_player.buy_rune(to_buy)
-
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                while not whose_turn.move(x, y, battlefield):
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0, len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0, len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                                whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                                whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                                whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                        # Make all the villagers in the team move.
-                        for villager_index in range(5):
-                            whose_turn: Villager = team1.battle_squad.get_villagers()[villager_index]
-                            x: int = random.randint(0, 19)
-                            y: int = random.randint(0, 19)
-                            while not whose_turn.move(x, y, battlefield):
-                                x = random.randint(0, 19)
-                                y = random.randint(0, 19)
-
-                            # Checking whether the hero can attack or not
-                            if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                        for hero in team1.battle_squad.get_heroes():
-                            hero.restore_moved_status()
-                            hero.restore_attacked_status()
-                            battle_coin_production_rate *= (mpf("10") ** turn)
-                            hero.controlling_player.battle_coins += battle_coin_production_rate
-                            hero.heal()
-
-                        for hero in team2.battle_squad.get_heroes():
-                            if not hero.get_is_alive():
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                curr_tile: Tile = battlefield.get_tiles()[y][x]
-                                while curr_tile.game_character is not None and curr_tile.building is not None:
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-                                    curr_tile = battlefield.get_tiles()[y][x]
-
-                                hero.respawn(x, y, battlefield)
-
-                    else:
-                        print("Current representation of the battlefield is as below:\n", str(battlefield))
-                        print("It is team two's turn to make moves.")
-                        for hero_index in range(5):
-                            whose_turn: Hero = team2.battle_squad.get_heroes()[hero_index]
-                            # Checking whether the player controlling the hero  is a human player or not
-                            if isinstance(whose_turn.controlling_player, HumanPlayer):
-                                # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                curr_player: Player = whose_turn.controlling_player
-                                print("Below is a list of runes sold in the battlefield shop:\n")
-                                for rune in battlefield_shop.get_runes_sold():
-                                    print(str(rune) + "\n")
-
-                                    # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                    curr_player: Player = whose_turn.controlling_player
-                                    print("Below is a list of runes sold in the battlefield shop:\n")
-                                    for rune in battlefield_shop.get_runes_sold():
-                                        print(str(rune) + "\n")
-
-                                print("Enter 'Y' for yes.")
-                                print("Enter anything else for no.")
-                                buy_ask: str = input("Do you want to buy a rune? ")
-                                if buy_ask == "Y":
-                                    rune_index: int = int(
-                                        input("Please enter the index of the rune you want to buy: "))
-                                    while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                        rune_index = int(input("Sorry, invalid input! "
-                                                               "Please enter the index of the rune you want to buy: "))
-
-                                    to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                    if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                        print("You have successfully purchased " + str(to_buy.name) + ".")
-                                        curr_player.buy_rune(to_buy)
-                                    else:
-                                        print("Sorry, insufficient battle coins!")
-
-                                # Ask the user to input x and y coordinates of tile to move the hero to
-                                x: int = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                y: int = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-                                while not whose_turn.move(x, y, battlefield):
-                                    # Ask the user to input x and y coordinates of tile to move the hero to
-                                    print("Invalid move! Please try again!")
-                                    x = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                    y = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    attack_ask: str = input("Do you want to attack the game character or building at "
-                                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                    if attack_ask == "Y":
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                print("Enter 'Y' for yes.")
-                                                print("Enter anything else for no.")
-                                                use_skill_ask: str = input("Do you want to use a skill? ")
-                                                if use_skill_ask == "Y":
-                                                    print("Below is a list of skills the hero has:\n")
-                                                    for skill in whose_turn.get_skills():
-                                                        print(str(skill) + "\n")
-
-                                                    skill_index: int = int(input("Please enter index of skill to "
-                                                                                 "use: "))
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = int(input("Sorry, invalid input! "
-                                                                                "Please enter index of skill to use: "))
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                            elif isinstance(whose_turn.controlling_player, CPUPlayer):
-                                # Making the CPU controlled player decide whether to buy a rune or not
-                                curr_player: Player = whose_turn.controlling_player
-                                if random.random() <= 0.75:
-                                    rune_index: int = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-                                    while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                        rune_index = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-
-                                    to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                    if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                        curr_player.buy_rune(to_buy)
-
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                while not whose_turn.move(x, y, battlefield):
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                        whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                        whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                        whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                        elif curr_tile.game_character is not None:
-                                            skill_to_use: Skill or None = None  # initial value
-                                            has_usable_skill: bool = False  # initial value
-                                            for skill in whose_turn.get_skills():
-                                                if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                    has_usable_skill = True
-
-                                            if has_usable_skill:
-                                                will_use_skill: bool = random.random() <= 0.75
-                                                if will_use_skill:
-                                                    skill_index: int = random.randint(0,
-                                                                                      len(whose_turn.get_skills()) - 1)
-                                                    while skill_index < 0 or skill_index >= \
-                                                            len(whose_turn.get_skills()) or (0 <= \
-                                                                                             skill_index < len(
-                                                                whose_turn.get_skills()) and \
-                                                                                             whose_turn.get_skills()[
-                                                                                                 skill_index].magic_points_cost > \
-                                                                                             whose_turn.curr_magic_points):
-                                                        skill_index = random.randint(0,
-                                                                                     len(whose_turn.get_skills()) - 1)
-
-                                                    skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                            whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                        # Make all the villagers in the team move.
-                        for villager_index in range(5):
-                            whose_turn: Villager = team2.battle_squad.get_villagers()[villager_index]
-                            x: int = random.randint(0, 19)
-                            y: int = random.randint(0, 19)
-                            while not whose_turn.move(x, y, battlefield):
-                                x = random.randint(0, 19)
-                                y = random.randint(0, 19)
-
-                            # Checking whether the hero can attack or not
-                            if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                will_attack: bool = random.random() <= 0.75
-                                if will_attack:
-                                    if curr_tile.building is not None:
-                                        whose_turn.attack(curr_tile.building, battlefield)
-
-                                    elif curr_tile.game_character is not None:
-                                        whose_turn.attack(curr_tile.game_character, battlefield)
-
-                        for hero in team2.battle_squad.get_heroes():
-                            hero.restore_moved_status()
-                            hero.restore_attacked_status()
-                            battle_coin_production_rate *= (mpf("10") ** turn)
-                            hero.controlling_player.battle_coins += battle_coin_production_rate
-                            hero.heal()
-
-                        for hero in team1.battle_squad.get_heroes():
-                            if not hero.get_is_alive():
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                curr_tile: Tile = battlefield.get_tiles()[y][x]
-                                while curr_tile.game_character is not None and curr_tile.building is not None:
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-                                    curr_tile = battlefield.get_tiles()[y][x]
-
-                                hero.respawn(x, y, battlefield)
-
-                if team1.battle_squad.all_died():
-                    print("Team 2 wins the battle!")
-                    # Give awards to all team 1 and team 2 players
-                    for hero in team1.battle_squad.get_heroes():
-                        corresponding_player: Player = hero.controlling_player
-                        corresponding_player.global_coins += mpf("10") ** (hero.kills // 5)
-
-                    for hero in team2.battle_squad.get_heroes():
-                        corresponding_player: Player = hero.controlling_player
-                        corresponding_player.global_coins += mpf("10") ** hero.kills
-
-                elif team2.battle_squad.all_died():
-                    print("Team 1 wins the battle!")
-                    # Give awards to all team 1 and team 2 players
-                    for hero in team1.battle_squad.get_heroes():
-                        corresponding_player: Player = hero.controlling_player
-                        corresponding_player.global_coins += mpf("10") ** hero.kills
-
-                    for hero in team2.battle_squad.get_heroes():
-                        corresponding_player: Player = hero.controlling_player
-                        corresponding_player.global_coins += mpf("10") ** (hero.kills // 5)
-
-                for hero in team1.battle_squad.get_heroes():
-                    hero.restore_to_initial()
-                    hero.controlling_player.restore_battle_coins()
-                    curr_player: Player = hero.controlling_player
-                    curr_player.update_rank()
-
-                for hero in team2.battle_squad.get_heroes():
-                    hero.restore_to_initial()
-                    hero.controlling_player.restore_battle_coins()
-                    curr_player: Player = hero.controlling_player
-                    curr_player.update_rank()
+                play_battle(team_1_battle_heroes, team_2_battle_heroes, new_game, player_storage, cpu_controller)
 
         # Else if the user chooses to play in multiplayer mode
         elif mode == "MULTIPLAYER":
@@ -2685,7 +6051,7 @@ def main():
                 print(str(human_player) + "\n")
 
             # Check whether at least two human players are in the saved game data or not
-            if len(new_game.get_human_players()) < 2:
+            if new_game.get_num_human_players() < 2:
                 # Tell the user that multiplayer mode cannot be played and then ask the user to choose whether he/she
                 # wants to create new human player data or just proceed to deciding whether to continue playing the
                 # game or not
@@ -2704,19 +6070,23 @@ def main():
                     for i in range(num_human_players):
                         # Ask the user to create a human player data
                         name: str = input("Please enter your name: ")
+                        while new_game.get_human_player_by_name(name) is not None:
+                            name = input("Sorry, that name has been taken! Please enter your name: ")
+
                         new_human_player: HumanPlayer = HumanPlayer(name)
                         # Creating a hero for the human player to control.
                         new_hero: Hero = generate_random_hero(name)
                         new_hero.controlling_player = new_human_player
                         new_human_player.hero_to_control = new_hero
                         new_game.add_human_player(new_human_player)
+                        player_storage.save_players(new_game, [new_human_player])
 
             else:
                 # Play multiplayer mode
                 print("You are now playing multiplayer mode.")
                 num_human_players_playing: int = int(input("How many human players are playing the game (2 - 10)? "))
                 while num_human_players_playing < 2 or num_human_players_playing > 10 or num_human_players_playing < \
-                        len(new_game.get_human_players()):
+                        new_game.get_num_human_players():
                     num_human_players_playing = int(
                         input("Sorry, either you input a number out of range or the number you input exceeds the "
                               "number of human players in the saved game data! How many human players are "
@@ -2755,1473 +6125,7 @@ def main():
                         else:
                             team_2_battle_heroes.append(selected_human_players[i].hero_to_control)
 
-                    team_1_villagers: list = []  # initial value
-                    team_2_villagers: list = []  # initial value
-                    for i in range(5):
-                        team_1_villagers.append(generate_random_game_character(generate_random_name()))
-                        team_2_villagers.append(generate_random_game_character(generate_random_name()))
-
-                    team_1_battle_towers: list = []  # initial value
-                    team_2_battle_towers: list = []  # initial value
-                    for i in range(3):
-                        team_1_battle_towers.append(generate_random_battle_tower(generate_random_name()))
-                        team_2_battle_towers.append(generate_random_battle_tower(generate_random_name()))
-
-                    team_1_town_center: TownCenter = generate_random_building(generate_random_name())
-                    team_2_town_center: TownCenter = generate_random_building(generate_random_name())
-                    team1: Team = Team(BattleSquad(team_1_battle_heroes, team_1_villagers, team_1_battle_towers,
-                                                   team_1_town_center))
-                    team2: Team = Team(BattleSquad(team_2_battle_heroes, team_2_villagers, team_2_battle_towers,
-                                                   team_2_town_center))
-                    for hero in team1.battle_squad.get_heroes():
-                        player: Player = hero.controlling_player
-                        player.corresponding_team = team1
-
-                    for hero in team2.battle_squad.get_heroes():
-                        player: Player = hero.controlling_player
-                        player.corresponding_team = team2
-
-                    print("Team 1:\n" + str(team1))
-                    print("Team 2:\n" + str(team2))
-
-                    # Starting the battle by spawning the heroes, villagers, battle towers, and town centers
-                    battlefield: Battlefield = Battlefield(generate_random_name())
-                    for hero in team1.battle_squad.get_heroes():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        hero.spawn(x, y, battlefield)
-
-                    for hero in team2.battle_squad.get_heroes():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        hero.spawn(x, y, battlefield)
-
-                    for villager in team1.battle_squad.get_villagers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        villager.spawn(x, y, battlefield)
-
-                    for villager in team2.battle_squad.get_villagers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        villager.spawn(x, y, battlefield)
-
-                    for defense_tower in team1.battle_squad.get_defense_towers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        defense_tower.spawn(x, y, battlefield)
-
-                    for defense_tower in team2.battle_squad.get_defense_towers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        defense_tower.spawn(x, y, battlefield)
-
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    team1.battle_squad.town_center.spawn(x, y, battlefield)
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    team2.battle_squad.town_center.spawn(x, y, battlefield)
-
-                    # Initialising the battlefield shop and the rate at which battle coins are added to each player
-                    runes: list = []  # initial value
-                    for i in range(20):
-                        curr_rune: Rune = Rune("Rune #" + str(i + 1), mpf("0.2") * (i + 1), mpf("0.2") * (i + 1),
-                                               mpf("0.2") * (i + 1), mpf("0.2") * (i + 1), mpf("150") * (i + 1),
-                                               mpf("150") * (i + 1), mpf("0.2") * (i + 1),
-                                               mpf("1e5") * (mpf("10") ** i))
-                        runes.append(curr_rune)
-
-                    battlefield_shop: BattlefieldShop = BattlefieldShop(runes)
-                    battle_coin_production_rate: mpf = mpf("1e5")
-                    turn: int = 0  # initial value
-                    while not team1.battle_squad.all_died() and not team2.battle_squad.all_died():
-                        turn += 1
-                        if turn % 2 == 1:
-                            print("Current representation of the battlefield is as below:\n", str(battlefield))
-                            print("It is team one's turn to make moves.")
-                            for hero_index in range(5):
-                                whose_turn: Hero = team1.battle_squad.get_heroes()[hero_index]
-                                # Checking whether the player controlling the hero  is a human player or not
-                                if isinstance(whose_turn.controlling_player, HumanPlayer):
-                                    # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                    curr_player: Player = whose_turn.controlling_player
-                                    print("Below is a list of runes sold in the battlefield shop:\n")
-                                    for rune in battlefield_shop.get_runes_sold():
-                                        print(str(rune) + "\n")
-
-                                        # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                        curr_player: Player = whose_turn.controlling_player
-                                        print("Below is a list of runes sold in the battlefield shop:\n")
-                                        for rune in battlefield_shop.get_runes_sold():
-                                            print(str(rune) + "\n")
-
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    buy_ask: str = input("Do you want to buy a rune? ")
-                                    if buy_ask == "Y":
-                                        rune_index: int = int(
-                                            input("Please enter the index of the rune you want to buy: "))
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = int(input("Sorry, invalid input! "
-                                                                   "Please enter the index of the rune you want to buy: "))
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            print("You have successfully purchased " + str(to_buy.name) + ".")
-                                            curr_player.buy_rune(to_buy)
-                                        else:
-                                            print("Sorry, insufficient battle coins!")
-
-                                    # Ask the user to input x and y coordinates of tile to move the hero to
-                                    x: int = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                    y: int = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-                                    while not whose_turn.move(x, y, battlefield):
-                                        # Ask the user to input x and y coordinates of tile to move the hero to
-                                        print("Invalid move! Please try again!")
-                                        x = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                        y = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(whose_turn.controlling_player, CPUPlayer):
-                                    # Making the CPU controlled player decide whether to buy a rune or not
-                                    curr_player: Player = whose_turn.controlling_player
-                                    if random.random() <= 0.75:
-                                        rune_index: int = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            curr_player.buy_rune(to_buy)
-
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    while not whose_turn.move(x, y, battlefield):
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0, len(
-                                                            whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0, len(
-                                                                whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                            # Make all the villagers in the team move.
-                            for villager_index in range(5):
-                                whose_turn: Villager = team1.battle_squad.get_villagers()[villager_index]
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                while not whose_turn.move(x, y, battlefield):
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            for hero in team1.battle_squad.get_heroes():
-                                hero.restore_moved_status()
-                                hero.restore_attacked_status()
-                                battle_coin_production_rate *= (mpf("10") ** turn)
-                                hero.controlling_player.battle_coins += battle_coin_production_rate
-                                hero.heal()
-
-                            for hero in team2.battle_squad.get_heroes():
-                                if not hero.get_is_alive():
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    curr_tile: Tile = battlefield.get_tiles()[y][x]
-                                    while curr_tile.game_character is not None and curr_tile.building is not None:
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-                                        curr_tile = battlefield.get_tiles()[y][x]
-
-                                    hero.respawn(x, y, battlefield)
-
-                        else:
-                            print("Current representation of the battlefield is as below:\n", str(battlefield))
-                            print("It is team two's turn to make moves.")
-                            for hero_index in range(5):
-                                whose_turn: Hero = team2.battle_squad.get_heroes()[hero_index]
-                                # Checking whether the player controlling the hero  is a human player or not
-                                if isinstance(whose_turn.controlling_player, HumanPlayer):
-                                    # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                    curr_player: Player = whose_turn.controlling_player
-                                    print("Below is a list of runes sold in the battlefield shop:\n")
-                                    for rune in battlefield_shop.get_runes_sold():
-                                        print(str(rune) + "\n")
-
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    buy_ask: str = input("Do you want to buy a rune? ")
-                                    if buy_ask == "Y":
-                                        rune_index: int = int(
-                                            input("Please enter the index of the rune you want to buy: "))
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = int(input("Sorry, invalid input! "
-                                                                   "Please enter the index of the rune you want to buy: "))
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            print("You have successfully purchased " + str(to_buy.name) + ".")
-                                            curr_player.buy_rune(to_buy)
-                                        else:
-                                            print("Sorry, insufficient battle coins!")
-
-                                    # Ask the user to input x and y coordinates of tile to move the hero to
-                                    x: int = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                    y: int = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-                                    while not whose_turn.move(x, y, battlefield):
-                                        # Ask the user to input x and y coordinates of tile to move the hero to
-                                        print("Invalid move! Please try again!")
-                                        x = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                        y = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(whose_turn.controlling_player, CPUPlayer):
-                                    # Making the CPU controlled player decide whether to buy a rune or not
-                                    curr_player: Player = whose_turn.controlling_player
-                                    if random.random() <= 0.75:
-                                        rune_index: int = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            curr_player.buy_rune(to_buy)
-
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    while not whose_turn.move(x, y, battlefield):
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0, len(
-                                                            whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0, len(
-                                                                whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                            # Make all the villagers in the team move.
-                            for villager_index in range(5):
-                                whose_turn: Villager = team1.battle_squad.get_villagers()[villager_index]
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                while not whose_turn.move(x, y, battlefield):
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y),
-                                              Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1,
-                                                                              whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y),
-                                                Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1,
-                                                                              whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1),
-                                                Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x,
-                                                                              whose_turn.y - 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1),
-                                                Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x,
-                                                                              whose_turn.y + 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            for hero in team2.battle_squad.get_heroes():
-                                hero.restore_moved_status()
-                                hero.restore_attacked_status()
-                                battle_coin_production_rate *= (mpf("10") ** turn)
-                                hero.controlling_player.battle_coins += battle_coin_production_rate
-                                hero.heal()
-
-                            for hero in team1.battle_squad.get_heroes():
-                                if not hero.get_is_alive():
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    curr_tile: Tile = battlefield.get_tiles()[y][x]
-                                    while curr_tile.game_character is not None and curr_tile.building is not None:
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-                                        curr_tile = battlefield.get_tiles()[y][x]
-
-                                    hero.respawn(x, y, battlefield)
-
-                    if team1.battle_squad.all_died():
-                        print("Team 2 wins the battle!")
-                        # Give awards to all team 1 and team 2 players
-                        for hero in team1.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** (hero.kills // 5)
-
-                        for hero in team2.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** hero.kills
-
-                    elif team2.battle_squad.all_died():
-                        print("Team 1 wins the battle!")
-                        # Give awards to all team 1 and team 2 players
-                        for hero in team1.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** hero.kills
-
-                        for hero in team2.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** (hero.kills // 5)
-
-                    for hero in team1.battle_squad.get_heroes():
-                        hero.restore_to_initial()
-                        hero.controlling_player.restore_battle_coins()
-                        curr_player: Player = hero.controlling_player
-                        curr_player.update_rank()
-
-                    for hero in team2.battle_squad.get_heroes():
-                        hero.restore_to_initial()
-                        hero.controlling_player.restore_battle_coins()
-                        curr_player: Player = hero.controlling_player
-                        curr_player.update_rank()
+                    play_battle(team_1_battle_heroes, team_2_battle_heroes, new_game, player_storage, cpu_controller)
                 else:
                     # Add CPU players
                     num_cpu_players_to_add: int = 10 - len(selected_human_players)
@@ -4250,1473 +6154,7 @@ def main():
                         team_2_battle_heroes.append(cpu_players[cpu_player_index].hero_to_control)
                         cpu_player_index += 1
 
-                    team_1_villagers: list = []  # initial value
-                    team_2_villagers: list = []  # initial value
-                    for i in range(5):
-                        team_1_villagers.append(generate_random_game_character(generate_random_name()))
-                        team_2_villagers.append(generate_random_game_character(generate_random_name()))
-
-                    team_1_battle_towers: list = []  # initial value
-                    team_2_battle_towers: list = []  # initial value
-                    for i in range(3):
-                        team_1_battle_towers.append(generate_random_battle_tower(generate_random_name()))
-                        team_2_battle_towers.append(generate_random_battle_tower(generate_random_name()))
-
-                    team_1_town_center: TownCenter = generate_random_building(generate_random_name())
-                    team_2_town_center: TownCenter = generate_random_building(generate_random_name())
-                    team1: Team = Team(BattleSquad(team_1_battle_heroes, team_1_villagers, team_1_battle_towers,
-                                                   team_1_town_center))
-                    team2: Team = Team(BattleSquad(team_2_battle_heroes, team_2_villagers, team_2_battle_towers,
-                                                   team_2_town_center))
-                    for hero in team1.battle_squad.get_heroes():
-                        player: Player = hero.controlling_player
-                        player.corresponding_team = team1
-
-                    for hero in team2.battle_squad.get_heroes():
-                        player: Player = hero.controlling_player
-                        player.corresponding_team = team2
-
-                    print("Team 1:\n" + str(team1))
-                    print("Team 2:\n" + str(team2))
-
-                    # Starting the battle by spawning the heroes, villagers, battle towers, and town centers
-                    battlefield: Battlefield = Battlefield(generate_random_name())
-                    for hero in team1.battle_squad.get_heroes():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        hero.spawn(x, y, battlefield)
-
-                    for hero in team2.battle_squad.get_heroes():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        hero.spawn(x, y, battlefield)
-
-                    for villager in team1.battle_squad.get_villagers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        villager.spawn(x, y, battlefield)
-
-                    for villager in team2.battle_squad.get_villagers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        villager.spawn(x, y, battlefield)
-
-                    for defense_tower in team1.battle_squad.get_defense_towers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        defense_tower.spawn(x, y, battlefield)
-
-                    for defense_tower in team2.battle_squad.get_defense_towers():
-                        x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                        while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                            x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                            y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                            curr_tile = battlefield.get_tiles()[y][x]
-
-                        defense_tower.spawn(x, y, battlefield)
-
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    team1.battle_squad.town_center.spawn(x, y, battlefield)
-                    x: int = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                    y: int = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                    curr_tile: Tile or None = battlefield.get_tiles()[y][x]
-                    while curr_tile is None or curr_tile.building is not None or curr_tile.game_character is not None:
-                        x = random.randint(0, battlefield.BATTLEFIELD_WIDTH - 1)
-                        y = random.randint(0, battlefield.BATTLEFIELD_HEIGHT - 1)
-                        curr_tile = battlefield.get_tiles()[y][x]
-
-                    team2.battle_squad.town_center.spawn(x, y, battlefield)
-
-                    # Initialising the battlefield shop and the rate at which battle coins are added to each player
-                    runes: list = []  # initial value
-                    for i in range(20):
-                        curr_rune: Rune = Rune("Rune #" + str(i + 1), mpf("0.2") * (i + 1), mpf("0.2") * (i + 1),
-                                               mpf("0.2") * (i + 1), mpf("0.2") * (i + 1), mpf("150") * (i + 1),
-                                               mpf("150") * (i + 1), mpf("0.2") * (i + 1),
-                                               mpf("1e5") * (mpf("10") ** i))
-                        runes.append(curr_rune)
-
-                    battlefield_shop: BattlefieldShop = BattlefieldShop(runes)
-                    battle_coin_production_rate: mpf = mpf("1e5")
-                    turn: int = 0  # initial value
-                    while not team1.battle_squad.all_died() and not team2.battle_squad.all_died():
-                        turn += 1
-                        if turn % 2 == 1:
-                            print("Current representation of the battlefield is as below:\n", str(battlefield))
-                            print("It is team one's turn to make moves.")
-                            for hero_index in range(5):
-                                whose_turn: Hero = team1.battle_squad.get_heroes()[hero_index]
-                                # Checking whether the player controlling the hero  is a human player or not
-                                if isinstance(whose_turn.controlling_player, HumanPlayer):
-                                    # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                    curr_player: Player = whose_turn.controlling_player
-                                    print("Below is a list of runes sold in the battlefield shop:\n")
-                                    for rune in battlefield_shop.get_runes_sold():
-                                        print(str(rune) + "\n")
-
-                                        # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                        curr_player: Player = whose_turn.controlling_player
-                                        print("Below is a list of runes sold in the battlefield shop:\n")
-                                        for rune in battlefield_shop.get_runes_sold():
-                                            print(str(rune) + "\n")
-
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    buy_ask: str = input("Do you want to buy a rune? ")
-                                    if buy_ask == "Y":
-                                        rune_index: int = int(
-                                            input("Please enter the index of the rune you want to buy: "))
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = int(input("Sorry, invalid input! "
-                                                                   "Please enter the index of the rune you want to buy: "))
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            print("You have successfully purchased " + str(to_buy.name) + ".")
-                                            curr_player.buy_rune(to_buy)
-                                        else:
-                                            print("Sorry, insufficient battle coins!")
-
-                                    # Ask the user to input x and y coordinates of tile to move the hero to
-                                    x: int = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                    y: int = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-                                    while not whose_turn.move(x, y, battlefield):
-                                        # Ask the user to input x and y coordinates of tile to move the hero to
-                                        print("Invalid move! Please try again!")
-                                        x = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                        y = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(whose_turn.controlling_player, CPUPlayer):
-                                    # Making the CPU controlled player decide whether to buy a rune or not
-                                    curr_player: Player = whose_turn.controlling_player
-                                    if random.random() <= 0.75:
-                                        rune_index: int = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            curr_player.buy_rune(to_buy)
-
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    while not whose_turn.move(x, y, battlefield):
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0, len(
-                                                            whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0, len(
-                                                                whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                            # Make all the villagers in the team move.
-                            for villager_index in range(5):
-                                whose_turn: Villager = team1.battle_squad.get_villagers()[villager_index]
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                while not whose_turn.move(x, y, battlefield):
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            for hero in team1.battle_squad.get_heroes():
-                                hero.restore_moved_status()
-                                hero.restore_attacked_status()
-                                battle_coin_production_rate *= (mpf("10") ** turn)
-                                hero.controlling_player.battle_coins += battle_coin_production_rate
-                                hero.heal()
-
-                            for hero in team2.battle_squad.get_heroes():
-                                if not hero.get_is_alive():
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    curr_tile: Tile = battlefield.get_tiles()[y][x]
-                                    while curr_tile.game_character is not None and curr_tile.building is not None:
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-                                        curr_tile = battlefield.get_tiles()[y][x]
-
-                                    hero.respawn(x, y, battlefield)
-
-                        else:
-                            print("Current representation of the battlefield is as below:\n", str(battlefield))
-                            print("It is team two's turn to make moves.")
-                            for hero_index in range(5):
-                                whose_turn: Hero = team2.battle_squad.get_heroes()[hero_index]
-                                # Checking whether the player controlling the hero  is a human player or not
-                                if isinstance(whose_turn.controlling_player, HumanPlayer):
-                                    # Ask the user whether he/she wants to buy a rune from the battlefield shop or not.
-                                    curr_player: Player = whose_turn.controlling_player
-                                    print("Below is a list of runes sold in the battlefield shop:\n")
-                                    for rune in battlefield_shop.get_runes_sold():
-                                        print(str(rune) + "\n")
-
-                                    print("Enter 'Y' for yes.")
-                                    print("Enter anything else for no.")
-                                    buy_ask: str = input("Do you want to buy a rune? ")
-                                    if buy_ask == "Y":
-                                        rune_index: int = int(
-                                            input("Please enter the index of the rune you want to buy: "))
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = int(input("Sorry, invalid input! "
-                                                                   "Please enter the index of the rune you want to buy: "))
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            print("You have successfully purchased " + str(to_buy.name) + ".")
-                                            curr_player.buy_rune(to_buy)
-                                        else:
-                                            print("Sorry, insufficient battle coins!")
-
-                                    # Ask the user to input x and y coordinates of tile to move the hero to
-                                    x: int = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                    y: int = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-                                    while not whose_turn.move(x, y, battlefield):
-                                        # Ask the user to input x and y coordinates of tile to move the hero to
-                                        print("Invalid move! Please try again!")
-                                        x = int(input("Please enter x-coordinates of the tile to move the hero to: "))
-                                        y = int(input("Please enter y-coordinates of the tile to move the hero to: "))
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        print("Enter 'Y' for yes.")
-                                        print("Enter anything else for no.")
-                                        attack_ask: str = input(
-                                            "Do you want to attack the game character or building at "
-                                            "(" + str(curr_tile.x) + ", " + str(curr_tile.y) + ")? ")
-                                        if attack_ask == "Y":
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    print("Enter 'Y' for yes.")
-                                                    print("Enter anything else for no.")
-                                                    use_skill_ask: str = input("Do you want to use a skill? ")
-                                                    if use_skill_ask == "Y":
-                                                        print("Below is a list of skills the hero has:\n")
-                                                        for skill in whose_turn.get_skills():
-                                                            print(str(skill) + "\n")
-
-                                                        skill_index: int = int(input("Please enter index of skill to "
-                                                                                     "use: "))
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = int(input("Sorry, invalid input! "
-                                                                                    "Please enter index of skill to use: "))
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                elif isinstance(whose_turn.controlling_player, CPUPlayer):
-                                    # Making the CPU controlled player decide whether to buy a rune or not
-                                    curr_player: Player = whose_turn.controlling_player
-                                    if random.random() <= 0.75:
-                                        rune_index: int = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-                                        while rune_index < 0 or rune_index >= len(battlefield_shop.get_runes_sold()):
-                                            rune_index = random.randint(0, len(battlefield_shop.get_runes_sold()) - 1)
-
-                                        to_buy: Rune = battlefield_shop.get_runes_sold()[rune_index]
-                                        if curr_player.battle_coins >= to_buy.purchase_battle_coin_cost:
-                                            curr_player.buy_rune(to_buy)
-
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    while not whose_turn.move(x, y, battlefield):
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-
-                                    # Checking whether the hero can attack or not
-                                    if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0, len(
-                                                            whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0, len(
-                                                                whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                                    elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1), Tile):
-                                        curr_tile: Tile = battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1)
-                                        will_attack: bool = random.random() <= 0.75
-                                        if will_attack:
-                                            if curr_tile.building is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= skill_index < len(
-                                                            whose_turn.get_skills()) and whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.building, battlefield, skill_to_use)
-
-                                            elif curr_tile.game_character is not None:
-                                                skill_to_use: Skill or None = None  # initial value
-                                                has_usable_skill: bool = False  # initial value
-                                                for skill in whose_turn.get_skills():
-                                                    if skill.magic_points_cost <= whose_turn.curr_magic_points:
-                                                        has_usable_skill = True
-
-                                                if has_usable_skill:
-                                                    will_use_skill: bool = random.random() <= 0.75
-                                                    if will_use_skill:
-                                                        skill_index: int = random.randint(0,
-                                                                                          len(
-                                                                                              whose_turn.get_skills()) - 1)
-                                                        while skill_index < 0 or skill_index >= \
-                                                                len(whose_turn.get_skills()) or (0 <= \
-                                                                                                 skill_index < len(
-                                                                    whose_turn.get_skills()) and \
-                                                                                                 whose_turn.get_skills()[
-                                                                                                     skill_index].magic_points_cost > \
-                                                                                                 whose_turn.curr_magic_points):
-                                                            skill_index = random.randint(0,
-                                                                                         len(
-                                                                                             whose_turn.get_skills()) - 1)
-
-                                                        skill_to_use = whose_turn.get_skills()[skill_index]
-
-                                                whose_turn.attack(curr_tile.game_character, battlefield, skill_to_use)
-
-                            # Make all the villagers in the team move.
-                            for villager_index in range(5):
-                                whose_turn: Villager = team1.battle_squad.get_villagers()[villager_index]
-                                x: int = random.randint(0, 19)
-                                y: int = random.randint(0, 19)
-                                while not whose_turn.move(x, y, battlefield):
-                                    x = random.randint(0, 19)
-                                    y = random.randint(0, 19)
-
-                                # Checking whether the hero can attack or not
-                                if isinstance(battlefield.get_tile_at(whose_turn.x - 1, whose_turn.y),
-                                              Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x - 1,
-                                                                              whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x + 1, whose_turn.y),
-                                                Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x + 1,
-                                                                              whose_turn.y)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y - 1),
-                                                Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x,
-                                                                              whose_turn.y - 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                                elif isinstance(battlefield.get_tile_at(whose_turn.x, whose_turn.y + 1),
-                                                Tile):
-                                    curr_tile: Tile = battlefield.get_tile_at(whose_turn.x,
-                                                                              whose_turn.y + 1)
-                                    will_attack: bool = random.random() <= 0.75
-                                    if will_attack:
-                                        if curr_tile.building is not None:
-                                            whose_turn.attack(curr_tile.building, battlefield)
-
-                                        elif curr_tile.game_character is not None:
-                                            whose_turn.attack(curr_tile.game_character, battlefield)
-
-                            for hero in team2.battle_squad.get_heroes():
-                                hero.restore_moved_status()
-                                hero.restore_attacked_status()
-                                battle_coin_production_rate *= (mpf("10") ** turn)
-                                hero.controlling_player.battle_coins += battle_coin_production_rate
-                                hero.heal()
-
-                            for hero in team1.battle_squad.get_heroes():
-                                if not hero.get_is_alive():
-                                    x: int = random.randint(0, 19)
-                                    y: int = random.randint(0, 19)
-                                    curr_tile: Tile = battlefield.get_tiles()[y][x]
-                                    while curr_tile.game_character is not None and curr_tile.building is not None:
-                                        x = random.randint(0, 19)
-                                        y = random.randint(0, 19)
-                                        curr_tile = battlefield.get_tiles()[y][x]
-
-                                    hero.respawn(x, y, battlefield)
-
-                    if team1.battle_squad.all_died():
-                        print("Team 2 wins the battle!")
-                        # Give awards to all team 1 and team 2 players
-                        for hero in team1.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** (hero.kills // 5)
-
-                        for hero in team2.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** hero.kills
-
-                    elif team2.battle_squad.all_died():
-                        print("Team 1 wins the battle!")
-                        # Give awards to all team 1 and team 2 players
-                        for hero in team1.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** hero.kills
-
-                        for hero in team2.battle_squad.get_heroes():
-                            corresponding_player: Player = hero.controlling_player
-                            corresponding_player.global_coins += mpf("10") ** (hero.kills // 5)
-
-                    for hero in team1.battle_squad.get_heroes():
-                        hero.restore_to_initial()
-                        hero.controlling_player.restore_battle_coins()
-                        curr_player: Player = hero.controlling_player
-                        curr_player.update_rank()
-
-                    for hero in team2.battle_squad.get_heroes():
-                        hero.restore_to_initial()
-                        hero.controlling_player.restore_battle_coins()
-                        curr_player: Player = hero.controlling_player
-                        curr_player.update_rank()
+                    play_battle(team_1_battle_heroes, team_2_battle_heroes, new_game, player_storage, cpu_controller)
 
         # Display all the human players in the saved game data
         print("Below is a list of human players in the saved game data:\n")
@@ -5733,9 +6171,11 @@ def main():
         selected_human_player: HumanPlayer = curr_human_player
         upgrades: list = []  # initial value
         for i in range(20):
-            curr_upgrade: Upgrade = Upgrade("Upgrade #" + str(i + 1), mpf("0.2") * (i + 1), mpf("0.2") * (i + 1),
-                                            mpf("0.2") * (i + 1), mpf("0.2") * (i + 1), mpf("150") * (i + 1),
-                                            mpf("150") * (i + 1), mpf("0.2") * (i + 1), mpf("1e5") * (mpf("10") ** i))
+            curr_upgrade: Upgrade = Upgrade("Upgrade #" + str(i + 1), to_number("0.2") * (i + 1),
+                                            to_number("0.2") * (i + 1), to_number("0.2") * (i + 1),
+                                            to_number("0.2") * (i + 1), to_number("150") * (i + 1),
+                                            to_number("150") * (i + 1), to_number("0.2") * (i + 1),
+                                            LogNumber.power_of_ten(5 + i))
             upgrades.append(curr_upgrade)
 
         global_shop: GlobalShop = GlobalShop(upgrades)
@@ -5756,17 +6196,67 @@ def main():
             if selected_human_player.global_coins >= to_buy.purchase_global_coin_cost:
                 print("Congratulations! You have successfully bought " + str(to_buy.name) + ".")
                 selected_human_player.buy_upgrade(to_buy)
+                player_storage.save_players(new_game, [selected_human_player])
             else:
                 print("Sorry, insufficient global coins!")
 
+        print("Enter 'Y' for yes.")
+        print("Enter anything else for no.")
+        view_leaderboard: str = input("Do you want to view the leaderboard? ")
+        if view_leaderboard == "Y":
+            leaderboard: Leaderboard = new_game.get_leaderboard("WINS")
+            print("Below is a list of the top 10 players by wins:")
+            for position, human_player in enumerate(leaderboard.get_top_players(10), 1):
+                print(str(position) + ". " + str(human_player.name) + " (" + str(human_player.rank) + ", " +
+                      str(human_player.wins) + " - " + str(human_player.loses) + ")")
+
+            print(str(selected_human_player.name) + " is in position " +
+                  str(leaderboard.get_position(selected_human_player)) + " of " + str(len(leaderboard)) + ".")
+
         print("Enter 'Y' for yes.")
         print("Enter anything else for no.")
         continue_ask = input("Do you want to continue playing 'Battleland'? ")
 
-    # Automatically save game data
-    save_game_data(new_game, file_name)
+    # Automatically save game data and empty the journal
+    player_storage.compact(new_game)
+    player_storage.close()
+    if isinstance(cpu_controller, MCTSController):
+        cpu_controller.close()
+
     sys.exit()
 
 
+def parse_arguments(arguments):
+    # type: (list) -> argparse.Namespace
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Battleland")
+    parser.add_argument("--numeric-backend", choices=list(NUMERIC_BACKENDS), default="MPF",
+                        help="numeric backend used to represent stats")
+    parser.add_argument("--player-storage", choices=["FILE", "SQLITE"], default="FILE",
+                        help="how human players are saved")
+    parser.add_argument("--benchmark", choices=list(BENCHMARKS),
+                        help="run a benchmark instead of the game")
+    parser.add_argument("--simulate", type=int, metavar="NUM_BATTLES",
+                        help="simulate CPU versus CPU battles instead of running the game")
+    parser.add_argument("--seed", type=int, default=0, help="master seed of simulated battles")
+    parser.add_argument("--workers", type=int, help="number of worker processes used to simulate battles")
+    parser.add_argument("--cpu-time-budget", type=int, metavar="MILLISECONDS",
+                        help="make CPU controlled players search for this long for each hero's turn")
+    parser.add_argument("--cpu-policy", choices=list(CPU_POLICIES), default="RANDOM",
+                        help="policy CPU controlled players follow in simulated battles and when they do not search")
+    parser.add_argument("--cpu-workers", type=int, default=1,
+                        help="number of processes searching for CPU controlled players at the same time")
+    return parser.parse_args(arguments)
+
+
 if __name__ == '__main__':
-    main()
+    command_line_arguments: argparse.Namespace = parse_arguments(sys.argv[1:])
+    set_numeric_backend(command_line_arguments.numeric_backend)
+    if command_line_arguments.benchmark is not None:
+        BENCHMARKS[command_line_arguments.benchmark]()
+    elif command_line_arguments.simulate is not None:
+        run_simulation(command_line_arguments.simulate, command_line_arguments.seed, command_line_arguments.workers,
+                       cpu_policy=command_line_arguments.cpu_policy)
+    else:
+        main(command_line_arguments.player_storage, None if command_line_arguments.cpu_time_budget is None else
+             command_line_arguments.cpu_time_budget / 1000, command_line_arguments.cpu_workers,
+             command_line_arguments.cpu_policy)
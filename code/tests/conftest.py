@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battleland  # noqa: E402
+
+
+@pytest.fixture(params=list(battleland.NUMERIC_BACKENDS))
+def numeric_backend(request):
+    # type: (pytest.FixtureRequest) -> str
+    previous_backend: battleland.NumericBackend = battleland.numeric_backend
+    battleland.set_numeric_backend(request.param)
+    yield request.param
+    battleland.set_numeric_backend(previous_backend.name)
@@ -0,0 +1,41 @@
+import os
+
+from battleland import AutosaveWorker, Game, HumanPlayer, SaveJournal, generate_random_game_data, load_game_data, \
+    load_player_records, player_to_record
+
+
+def test_journal_is_compacted_in_the_background(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    journal: SaveJournal = SaveJournal(file_name, compaction_threshold=5, compact_in_background=True)
+    game: Game = journal.load()
+    try:
+        game.import_human_players(generate_random_game_data(8).get_human_players())
+        journal.save_players(game, game.get_human_players())
+        for i in range(40):
+            human_player: HumanPlayer = game.get_human_players()[i % 8]
+            human_player.wins += 1
+            journal.save_players(game, [human_player])
+    finally:
+        journal.close()
+
+    assert not os.path.exists(journal.compacting_journal_file_name)
+    assert load_game_data(file_name).get_num_human_players() == 8
+    assert SaveJournal(file_name).load().export_player_records() == game.export_player_records()
+
+
+def test_autosave_worker_saves_the_latest_records(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    game: Game = generate_random_game_data(4)
+    autosave_worker: AutosaveWorker = AutosaveWorker(file_name, game.export_player_records())
+    try:
+        autosave_worker.request_save()
+        autosave_worker.wait()
+        human_player: HumanPlayer = game.get_human_players()[0]
+        human_player.loses += 3
+        autosave_worker.update_records([player_to_record(human_player)])
+    finally:
+        autosave_worker.stop()
+
+    assert autosave_worker.get_num_saves() >= 2
+    assert not os.path.exists(file_name + ".tmp")
+    assert load_player_records(file_name) == game.export_player_records()
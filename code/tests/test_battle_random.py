@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from battleland import BattleRandom, BattleResult, CPU_POLICIES, iterate_simulated_battles, simulate_battle
+
+
+@pytest.mark.parametrize("cpu_policy", list(CPU_POLICIES))
+def test_battles_are_replayed_exactly_from_their_seeds(numeric_backend, cpu_policy):
+    for seed in (0, 1, 12345):
+        assert simulate_battle(seed, 200, cpu_policy) == simulate_battle(seed, 200, cpu_policy)
+
+
+def test_battles_do_not_depend_on_the_module_random_number_generator():
+    random.seed(1)
+    expected_result: BattleResult = simulate_battle(42, 200)
+    random.seed(2)
+    random.random()
+    assert simulate_battle(42, 200) == expected_result
+
+
+def test_substreams_are_independent():
+    battle_random: BattleRandom = BattleRandom(7)
+    expected_crits: list = [battle_random.crits.random() for i in range(10)]
+    battle_random = BattleRandom(7)
+    for i in range(1000):
+        battle_random.ai.random()
+        battle_random.spawning.random()
+
+    assert [battle_random.crits.random() for i in range(10)] == expected_crits
+
+
+def test_simulations_do_not_depend_on_the_number_of_workers():
+    expected_results: list = list(iterate_simulated_battles(6, master_seed=3, num_workers=1, max_turns=100,
+                                                            chunk_size=2))
+    assert list(iterate_simulated_battles(6, master_seed=3, num_workers=2, max_turns=100, chunk_size=2)) == \
+        expected_results
@@ -0,0 +1,66 @@
+import pickle
+
+from battleland import BattleEngine, BattleSnapshot, BattleTower, GameCharacter, generate_random_cpu_battle
+
+
+def get_battle_state(engine):
+    # type: (BattleEngine) -> tuple
+    # Stats versions are drawn afresh whenever stats change, and runes bought again after restoring are new copies,
+    # so the state is compared without stats versions and with the names of runes
+    snapshot: BattleSnapshot = engine.snapshot()
+    units: list = [unit for team in engine.get_teams() for unit in BattleEngine.get_units(team)]
+    unit_values: tuple = tuple(
+        tuple(value for field, value in zip(BattleEngine.GAME_CHARACTER_FIELDS if isinstance(unit, GameCharacter) else
+                                            BattleEngine.BATTLE_TOWER_FIELDS if isinstance(unit, BattleTower) else
+                                            BattleEngine.BUILDING_FIELDS, values) if field != "stats_version")
+        for unit, values in zip(units, snapshot.unit_values))
+    return (snapshot.engine_values, unit_values, snapshot.units_on_battlefield,
+            tuple(tuple(rune.name for rune in runes) for runes in snapshot.runes), snapshot.battle_coins,
+            snapshot.free_cells, engine.battle_random.get_state())
+
+
+def test_restore_undoes_turns(numeric_backend):
+    engine: BattleEngine = generate_random_cpu_battle(3)
+    for i in range(10):
+        engine.step()
+
+    expected_state: tuple = get_battle_state(engine)
+    snapshot: BattleSnapshot = engine.snapshot()
+    random_state: tuple = engine.battle_random.get_state()
+    for i in range(25):
+        engine.step()
+
+    assert get_battle_state(engine) != expected_state
+    engine.restore(snapshot)
+    engine.battle_random.set_state(random_state)
+    assert get_battle_state(engine) == expected_state
+
+
+def test_restored_battle_plays_on_like_the_original(numeric_backend):
+    engine: BattleEngine = generate_random_cpu_battle(5)
+    for i in range(10):
+        engine.step()
+
+    snapshot: BattleSnapshot = engine.snapshot()
+    random_state: tuple = engine.battle_random.get_state()
+    for i in range(30):
+        engine.step()
+
+    expected_state: tuple = get_battle_state(engine)
+    engine.restore(snapshot)
+    engine.battle_random.set_state(random_state)
+    for i in range(30):
+        engine.step()
+
+    assert get_battle_state(engine) == expected_state
+
+
+def test_snapshot_restores_a_pickled_copy_of_the_battle():
+    engine: BattleEngine = generate_random_cpu_battle(7)
+    copied_engine: BattleEngine = pickle.loads(pickle.dumps(engine))
+    for i in range(15):
+        engine.step()
+
+    copied_engine.restore(pickle.loads(pickle.dumps(engine.snapshot())))
+    copied_engine.battle_random.set_state(engine.battle_random.get_state())
+    assert get_battle_state(copied_engine)[1:] == get_battle_state(engine)[1:]
@@ -0,0 +1,39 @@
+import pytest
+
+from battleland import BattleEngine, Battlefield, GameCharacter, Team, Tile, generate_random_cpu_battle
+
+
+def get_expected_mask(engine, team, is_enemy, game_characters, buildings):
+    # type: (BattleEngine, Team or None, bool, bool, bool) -> int
+    battlefield: Battlefield = engine.battlefield
+    mask: int = 0
+    for unit_team in engine.get_teams():
+        if team is not None and (unit_team is team) == is_enemy:
+            continue
+
+        for unit in BattleEngine.get_units(unit_team):
+            if not (game_characters if isinstance(unit, GameCharacter) else buildings):
+                continue
+
+            tile: Tile = battlefield.get_tiles()[unit.y][unit.x]
+            if tile.game_character is unit or tile.building is unit:
+                mask |= 1 << (unit.y * battlefield.BATTLEFIELD_WIDTH + unit.x)
+
+    return mask
+
+
+@pytest.mark.parametrize("battlefield_size", [20, 100])
+def test_masks_match_unit_positions(battlefield_size):
+    engine: BattleEngine = generate_random_cpu_battle(3, battlefield_size, battlefield_size, num_villagers=30)
+    for i in range(20):
+        engine.step()
+
+    battlefield: Battlefield = engine.battlefield
+    for team in [None] + engine.get_teams():
+        for game_characters in (True, False):
+            for buildings in (True, False):
+                assert battlefield.get_occupancy_mask(team, game_characters, buildings) == \
+                    get_expected_mask(engine, team, False, game_characters, buildings)
+                if team is not None:
+                    assert battlefield.get_enemy_mask(team, game_characters, buildings) == \
+                        get_expected_mask(engine, team, True, game_characters, buildings)
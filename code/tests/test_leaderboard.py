@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from battleland import Game, HumanPlayer, Leaderboard, SkipList, generate_random_game_data
+
+
+def get_sorted_players(players, order):
+    # type: (list, str) -> list
+    return sorted(players, key=lambda player: Leaderboard.ORDERS[order](player) + (player.player_id,))
+
+
+def test_skip_list_matches_a_sorted_list():
+    rng: random.Random = random.Random(0)
+    skip_list: SkipList = SkipList()
+    keys: set = set()
+    for i in range(3000):
+        key: int = rng.randint(0, 500)
+        if key in keys:
+            assert skip_list.remove(key)
+            keys.remove(key)
+        else:
+            skip_list.add(key)
+            keys.add(key)
+
+        assert not skip_list.remove(-1)
+
+    sorted_keys: list = sorted(keys)
+    assert list(skip_list) == sorted_keys
+    assert len(skip_list) == len(sorted_keys)
+    assert skip_list.get_first(10) == sorted_keys[:10]
+    assert [skip_list.index(key) for key in sorted_keys] == list(range(len(sorted_keys)))
+    assert skip_list.index(-1) is None
+
+
+@pytest.mark.parametrize("order", list(Leaderboard.ORDERS))
+def test_leaderboard_matches_sorted_players(order):
+    game: Game = generate_random_game_data(60)
+    leaderboard: Leaderboard = game.get_leaderboard(order)
+    rng: random.Random = random.Random(1)
+    for i in range(200):
+        human_player: HumanPlayer = rng.choice(game.get_human_players())
+        if rng.random() < 0.5:
+            human_player.wins += rng.randint(1, 500)
+        else:
+            human_player.loses += rng.randint(1, 500)
+
+        human_player.update_rank()
+        game.update_leaderboards([human_player])
+
+    sorted_players: list = get_sorted_players(game.get_human_players(), order)
+    assert leaderboard.get_top_players(len(sorted_players)) == sorted_players
+    assert [leaderboard.get_position(human_player) for human_player in sorted_players] == \
+        list(range(1, len(sorted_players) + 1))
+
+
+def test_leaderboards_are_kept_by_copies_of_the_game_data():
+    game: Game = generate_random_game_data(30)
+    game.get_leaderboard("WINS")
+    copied_game: Game = game.clone()
+    copied_player: HumanPlayer = copied_game.get_human_players()[0]
+    copied_player.wins += 10000
+    copied_game.update_leaderboards([copied_player])
+    assert copied_game.get_leaderboard("WINS").get_top_players(1) == [copied_player]
+    assert copied_game.get_leaderboard("WINS").get_top_players(30) == \
+        get_sorted_players(copied_game.get_human_players(), "WINS")
@@ -0,0 +1,24 @@
+import pickle
+
+from battleland import Game, generate_random_game_data, is_pickled_game_data, load_game_data, migrate_game_data, \
+    save_game_data
+
+
+def test_saved_game_data_is_loaded_back(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    game: Game = generate_random_game_data(12)
+    save_game_data(game, file_name)
+    assert load_game_data(file_name).export_player_records() == game.export_player_records()
+
+
+def test_pickled_game_data_is_migrated(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    game: Game = generate_random_game_data(12)
+    with open(file_name, "wb") as file:
+        pickle.dump(game, file)
+
+    assert is_pickled_game_data(file_name)
+    assert migrate_game_data(file_name)
+    assert not is_pickled_game_data(file_name)
+    assert load_game_data(file_name).export_player_records() == game.export_player_records()
+    assert not migrate_game_data(file_name)
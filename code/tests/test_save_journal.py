@@ -0,0 +1,48 @@
+import os
+
+from battleland import Game, HumanPlayer, SaveJournal, generate_random_game_data, load_game_data
+
+
+def make_game_data(journal):
+    # type: (SaveJournal) -> Game
+    game: Game = journal.load()
+    game.import_human_players(generate_random_game_data(8).get_human_players())
+    journal.save_players(game, game.get_human_players())
+    return game
+
+
+def test_journal_is_replayed_on_top_of_the_saved_game_data(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    journal: SaveJournal = SaveJournal(file_name, compaction_threshold=1000)
+    game: Game = make_game_data(journal)
+    human_player: HumanPlayer = game.get_human_players()[3]
+    human_player.wins += 42
+    assert journal.save_players(game, game.get_human_players()) == 1
+    assert not os.path.exists(file_name)
+
+    loaded_game: Game = SaveJournal(file_name).load()
+    assert loaded_game.export_player_records() == game.export_player_records()
+    assert loaded_game.get_human_player_by_id(human_player.player_id).wins == human_player.wins
+
+
+def test_half_written_journal_entries_are_ignored(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    journal: SaveJournal = SaveJournal(file_name, compaction_threshold=1000)
+    game: Game = make_game_data(journal)
+    with open(journal.journal_file_name, "a", encoding="utf-8") as file:
+        file.write('{"player_id": "')
+
+    assert SaveJournal(file_name).load().export_player_records() == game.export_player_records()
+
+
+def test_compaction_saves_the_game_data_and_empties_the_journal(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    journal: SaveJournal = SaveJournal(file_name, compaction_threshold=10)
+    game: Game = make_game_data(journal)
+    for human_player in game.get_human_players():
+        human_player.loses += 1
+        journal.save_players(game, [human_player])
+
+    assert journal.get_num_entries() < 10
+    assert load_game_data(file_name).get_num_human_players() == len(game.get_human_players())
+    assert SaveJournal(file_name).load().export_player_records() == game.export_player_records()
@@ -0,0 +1,56 @@
+from battleland import Game, HumanPlayer, SQLitePlayerStore, SaveJournal, generate_random_game_data, \
+    save_game_data
+
+
+def test_players_are_loaded_back_lazily(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA.sqlite3")
+    game_data: Game = generate_random_game_data(10)
+    player_store: SQLitePlayerStore = SQLitePlayerStore(file_name)
+    player_store.load().import_human_players(game_data.get_human_players())
+    player_store.close()
+
+    player_store = SQLitePlayerStore(file_name)
+    try:
+        game: Game = player_store.load()
+        assert game.get_num_human_players() == 10
+        assert game.get_loaded_human_players() == []
+        human_player: HumanPlayer = game_data.get_human_players()[4]
+        assert game.get_human_player_by_name(human_player.name).player_id == human_player.player_id
+        assert len(game.get_loaded_human_players()) == 1
+        assert game.export_player_records() == game_data.export_player_records()
+    finally:
+        player_store.close()
+
+
+def test_changed_players_are_saved(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA.sqlite3")
+    player_store: SQLitePlayerStore = SQLitePlayerStore(file_name)
+    game: Game = player_store.load()
+    game.import_human_players(generate_random_game_data(5).get_human_players())
+    human_player: HumanPlayer = game.get_human_players()[2]
+    human_player.wins += 7
+    player_store.save_players(game, [human_player])
+    player_store.close()
+
+    player_store = SQLitePlayerStore(file_name)
+    try:
+        assert player_store.load().get_human_player_by_id(human_player.player_id).wins == human_player.wins
+    finally:
+        player_store.close()
+
+
+def test_saved_game_data_and_its_journal_are_imported(tmp_path):
+    file_name: str = str(tmp_path / "SAVED BATTLELAND GAME DATA")
+    game_data: Game = generate_random_game_data(6)
+    save_game_data(game_data, file_name)
+    journal: SaveJournal = SaveJournal(file_name)
+    journaled_game: Game = journal.load()
+    human_player: HumanPlayer = journaled_game.get_human_players()[1]
+    human_player.wins += 42
+    journal.save_players(journaled_game, [human_player])
+
+    player_store: SQLitePlayerStore = SQLitePlayerStore(file_name + ".sqlite3", file_name)
+    try:
+        assert player_store.load().export_player_records() == journaled_game.export_player_records()
+    finally:
+        player_store.close()
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from battleland import BattleEngine, BattleSnapshot, ZobristHash, generate_random_cpu_battle
+
+
+def play_and_check_hash(engine, num_turns):
+    # type: (BattleEngine, int) -> None
+    zobrist_hash: ZobristHash = engine.battlefield.zobrist_hash
+    feature_keys: list = [list(unit_keys) for unit_keys in zobrist_hash.feature_keys]
+    for i in range(num_turns):
+        if not engine.step():
+            break
+
+        incremental_value: int = zobrist_hash.value
+        assert zobrist_hash.recompute(engine.battlefield) == incremental_value
+
+    # Keys are mixed with the values instead of being stored per value, so they never grow
+    assert zobrist_hash.feature_keys == feature_keys
+
+
+@pytest.mark.parametrize("battlefield_size", [None, 100])
+def test_incremental_hash_matches_recomputed_hash(numeric_backend, battlefield_size):
+    engine: BattleEngine = generate_random_cpu_battle(3, battlefield_size, battlefield_size)
+    engine.enable_zobrist_hash()
+    play_and_check_hash(engine, 150)
+
+
+@pytest.mark.parametrize("numeric_backend", ["FLOAT"], indirect=True)
+def test_incremental_hash_matches_recomputed_hash_in_array_battle_state(numeric_backend):
+    # Array battle states need the FLOAT numeric backend
+    engine: BattleEngine = generate_random_cpu_battle(3, use_array_state=True)
+    engine.enable_zobrist_hash()
+    play_and_check_hash(engine, 150)
+
+
+def test_restoring_a_snapshot_restores_the_hash(numeric_backend):
+    engine: BattleEngine = generate_random_cpu_battle(4)
+    engine.enable_zobrist_hash()
+    for i in range(20):
+        engine.step()
+
+    snapshot: BattleSnapshot = engine.snapshot()
+    position_hash: int = engine.get_position_hash()
+    for i in range(20):
+        engine.step()
+
+    engine.restore(snapshot)
+    assert engine.get_position_hash() == position_hash
+    restored_value: int = engine.battlefield.zobrist_hash.value
+    assert engine.battlefield.zobrist_hash.recompute(engine.battlefield) == restored_value
+
+
+def test_pickled_battles_keep_hashing_identically():
+    engine: BattleEngine = generate_random_cpu_battle(5)
+    engine.enable_zobrist_hash()
+    for i in range(10):
+        engine.step()
+
+    copied_engine: BattleEngine = pickle.loads(pickle.dumps(engine))
+    assert copied_engine.get_position_hash() == engine.get_position_hash()
+    for i in range(10):
+        engine.step()
+        copied_engine.step()
+
+    assert copied_engine.get_position_hash() == engine.get_position_hash()
+    play_and_check_hash(copied_engine, 10)